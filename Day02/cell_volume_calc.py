@@ -1,18 +1,22 @@
 """
+calculate_volume(current_conf, current_area, desired_conf, dest_area, current_volume)
+
     Calculate the volume to take from a current plate of cultured cells to reach desired confluency in a new plate.
     
     Parameters:
         current_conf: current confluency (%) of source plate
         current_area: surface area (cm²) of source plate
         desired_conf: desired confluency (%) on new plate
-        desired_area: surface area (cm²) of new plate
-        final_vol: final total volume (µL) in current plate after trypsinization
+        dest_area: surface area (cm²) of new plate
+        current_volume: total volume (µL) in current plate after trypsinization
     
     Returns:
         float: Volume to take from current plate (µL)
 
+    The calculation itself lives in Day03/calc_logic.py (loaded by shared_logic.py),
+    so all calculators (and the Day03 calc_service) share one engine.
+    Values <= 0 raise ValueError.
 """
-def calculate_volume(current_conf, current_area, desired_conf, desired_area, final_vol):
-    return final_vol*((desired_conf * desired_area) /(current_conf * current_area))
+from shared_logic import calc_logic
 
-  
+calculate_volume = calc_logic.calculate_volume
@@ -2,16 +2,12 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 from tkinter import simpledialog
 from cell_volume_calc import calculate_volume
+from shared_logic import load_day03_module
 
-# Plate info: area (cm²) and final culture volume (µL)
-plates = {
-    "96 well (0.33 cm², 100 µL)": {"area": 0.33, "final_vol": 100},
-    "24 well (2 cm², 500 µL)": {"area": 2, "final_vol": 500},
-    "12 well (4 cm², 1000 µL)": {"area": 4, "final_vol": 1000},
-    "6 well (10 cm², 2000 µL)": {"area": 10, "final_vol": 2000},
-    "10 cm (60 cm², 10000 µL)": {"area": 60, "final_vol": 10000},
-    "Other": {"area": None, "final_vol": None}
-}
+# Plate info (area, final culture volume) is shared with the Day03 calculators (Day03/plates.csv)
+registry = load_day03_module("plate_registry").load_plate_registry()
+plates = registry.labels + ["Other"]
+custom_plates = {}  # "current"/"destination" -> index of the custom plate entered for "Other"
 
 # ---------- Helper functions ----------
 
@@ -22,21 +18,28 @@ def safe_float(s):
         return None
 
 def reset_fields():
-    current_plate_dropdown.current(4) 
-    destination_plate_dropdown.current(3)  # 6 well
+    current_plate_dropdown.current(registry.index("10 cm"))
+    destination_plate_dropdown.current(registry.index("6 well"))
+    custom_plates.clear()
     current_conf_entry.delete(0, tk.END)
     desired_conf_entry.delete(0, tk.END)
     current_vol_entry.delete(0, tk.END)
     result_label.config(text="", foreground="black")
 
-def get_plate_params(key):
-    """Return area and final_vol. If Other, ask user for input."""
+def get_plate_params(key, role):
+    """Return area and final_vol. If Other, ask user for input (only the first time for each role)."""
     if key != "Other":
-        return plates[key]["area"], plates[key]["final_vol"]
+        index = registry.index(key)
+    elif role in custom_plates:
+        index = custom_plates[role]
     else:
         area = simpledialog.askfloat("Custom plate", "Enter plate area (cm²):", minvalue=0.01)
         final_vol = simpledialog.askfloat("Custom plate", "Enter final volume (µL):", minvalue=1)
-        return area, final_vol
+        if not area or not final_vol:
+            return area, final_vol
+        index = registry.add_custom(area, final_vol)
+        custom_plates[role] = index
+    return float(registry.areas[index]), float(registry.final_vols[index])
 
 # ---------- Main calculation ----------
 
@@ -56,8 +59,8 @@ def calculate():
             messagebox.showerror("Input error", "Confluency values must be > 0.")
             return
 
-        current_area, _ = get_plate_params(current_plate_key)
-        dest_area, dest_final_vol = get_plate_params(destination_plate_key)
+        current_area, _ = get_plate_params(current_plate_key, "current")
+        dest_area, dest_final_vol = get_plate_params(destination_plate_key, "destination")
 
         volume_to_take = calculate_volume(current_conf, current_area, desired_conf, dest_area, current_vol)
         media_to_add = dest_final_vol - volume_to_take
@@ -100,8 +103,8 @@ frame = ttk.Frame(root, padding=15)
 frame.pack(fill="both", expand=True)
 
 ttk.Label(frame, text="Current plate type:").grid(row=0, column=0, sticky="w", pady=5)
-current_plate_var = tk.StringVar(value=list(plates.keys())[4])
-current_plate_dropdown = ttk.Combobox(frame, textvariable=current_plate_var, values=list(plates.keys()), width=40, state="readonly")
+current_plate_var = tk.StringVar(value=plates[registry.index("10 cm")])
+current_plate_dropdown = ttk.Combobox(frame, textvariable=current_plate_var, values=plates, width=40, state="readonly")
 current_plate_dropdown.grid(row=0, column=1, pady=5)
 
 ttk.Label(frame, text="Current confluency (%):").grid(row=1, column=0, sticky="w", pady=5)
@@ -113,8 +116,8 @@ current_vol_entry = ttk.Entry(frame, width=10)
 current_vol_entry.grid(row=2, column=1, pady=5)
 
 ttk.Label(frame, text="Destination plate type:").grid(row=3, column=0, sticky="w", pady=5)
-destination_plate_var = tk.StringVar(value=list(plates.keys())[3])
-destination_plate_dropdown = ttk.Combobox(frame, textvariable=destination_plate_var, values=list(plates.keys()), width=40, state="readonly")
+destination_plate_var = tk.StringVar(value=plates[registry.index("6 well")])
+destination_plate_dropdown = ttk.Combobox(frame, textvariable=destination_plate_var, values=plates, width=40, state="readonly")
 destination_plate_dropdown.grid(row=3, column=1, pady=5)
 
 ttk.Label(frame, text="Desired confluency (%):").grid(row=4, column=0, sticky="w", pady=5)
@@ -0,0 +1,34 @@
+"""
+The Day03 modules shared with the Day02 calculators.
+
+calc_logic (the volume formula) and plate_registry (the plates in
+Day03/plates.csv) are loaded from their files in the Day03 folder and
+registered under their usual names, so sys.path is left unchanged and
+plate_registry's own `from calc_logic import ...` finds the same module.
+Keep the Day03 folder next to Day02.
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+DAY03_DIR = Path(__file__).resolve().parent.parent / "Day03"
+
+
+def load_day03_module(name):
+    """Import Day03/<name>.py (once) and return the module."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, DAY03_DIR / f"{name}.py")
+    if spec is None:
+        raise ImportError(f"Cannot find {name}.py in {DAY03_DIR}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    return module
+
+
+calc_logic = load_day03_module("calc_logic")
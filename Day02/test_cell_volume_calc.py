@@ -0,0 +1,20 @@
+import sys
+
+import cell_volume_calc
+import shared_logic
+
+
+def test_uses_the_day03_calculation():
+    assert cell_volume_calc.calculate_volume is shared_logic.calc_logic.calculate_volume
+    assert cell_volume_calc.calculate_volume(50, 60, 25, 10, 3000) == 250
+    assert shared_logic.calc_logic.__file__ == str(shared_logic.DAY03_DIR / "calc_logic.py")
+
+
+def test_day03_folder_not_added_to_sys_path():
+    assert str(shared_logic.DAY03_DIR) not in sys.path
+
+
+def test_plate_registry_shares_calc_logic():
+    plate_registry = shared_logic.load_day03_module("plate_registry")
+    assert plate_registry.calculate_volume is cell_volume_calc.calculate_volume
+    assert plate_registry.load_plate_registry().labels
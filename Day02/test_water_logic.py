@@ -0,0 +1,49 @@
+import io
+import math
+
+import numpy as np
+import pytest
+
+import water_cli
+from water_logic import recommend_water_intake, recommend_water_intake_batch
+
+LEVELS = ["low", "medium", "high", "High", "unknown", ""]
+
+
+def scalar(weights, ages, levels):
+    return np.array([recommend_water_intake(w, a, l) for w, a, l in zip(weights, ages, levels)])
+
+
+@pytest.mark.parametrize("age", [0, 17, 17.9, 18, 18.1, 54.9, 55, 55.1, 56, 90])
+@pytest.mark.parametrize("level", LEVELS)
+def test_batch_matches_scalar_at_boundaries(age, level):
+    assert recommend_water_intake_batch([70.3], [age], [level]).tolist() == [recommend_water_intake(70.3, age, level)]
+
+
+def test_batch_matches_scalar_random():
+    rng = np.random.default_rng(0)
+    n = 20_000
+    weights = rng.uniform(2, 200, n)
+    ages = rng.integers(0, 100, n).astype(float)
+    levels = rng.choice(LEVELS, n)
+    np.testing.assert_array_equal(recommend_water_intake_batch(weights, ages, levels), scalar(weights, ages, levels))
+
+
+def test_batch_nan():
+    result = recommend_water_intake_batch([math.nan, 70], [30, math.nan], ["low", "high"])
+    assert math.isnan(result[0]) and math.isnan(recommend_water_intake(math.nan, 30, "low"))
+    # A missing age applies no age factor, like the scalar function
+    assert result[1] == recommend_water_intake(70, math.nan, "high")
+
+
+def test_cli_matches_scalar():
+    infile = io.StringIO("weight_kg,age,activity_level\n70,30,High\n70,30,high\n60,55,medium\nabc,20,low\n")
+    outfile = io.StringIO()
+    assert water_cli.process_stream(infile, outfile, chunk_size=2) == 4
+    values = [line.rsplit(",", 1)[1] for line in outfile.getvalue().splitlines()[1:]]
+    assert values == [
+        repr(recommend_water_intake(70, 30, "High")),
+        repr(recommend_water_intake(70, 30, "high")),
+        repr(recommend_water_intake(60, 55, "medium")),
+        "",
+    ]
@@ -0,0 +1,90 @@
+"""
+Water intake recommendations for a whole table of people.
+
+Reads a CSV file with the columns weight_kg, age and activity_level (other
+columns are copied to the output), processes it in chunks and writes the
+same rows with an extra water_l column (liters/day), exactly as
+recommend_water_intake would give for each row. activity_level is used as
+written ("low", "medium" or "high"; other values leave the amount unchanged);
+rows with missing or non-numeric weight get an empty water_l.
+
+    python water_cli.py cohort.csv -o recommendations.csv
+"""
+import csv
+import math
+
+import click
+import numpy as np
+
+from water_logic import recommend_water_intake_batch
+
+INPUT_COLUMNS = ("weight_kg", "age", "activity_level")
+OUTPUT_COLUMN = "water_l"
+DEFAULT_CHUNK_SIZE = 10000
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+def process_stream(infile, outfile, chunk_size=DEFAULT_CHUNK_SIZE, decimals=None):
+    """Read people from infile (CSV), write them with water_l to outfile; returns the number of rows."""
+    reader = csv.DictReader(infile)
+    fieldnames = reader.fieldnames or []
+    missing = [col for col in INPUT_COLUMNS if col not in fieldnames]
+    if missing:
+        raise ValueError(f"Missing columns in input table: {', '.join(missing)}")
+
+    writer = csv.DictWriter(outfile, fieldnames=[*fieldnames, OUTPUT_COLUMN], lineterminator="\n")
+    writer.writeheader()
+
+    def write_chunk(rows):
+        liters = recommend_water_intake_batch(
+            [_to_float(row["weight_kg"]) for row in rows],
+            [_to_float(row["age"]) for row in rows],
+            [row["activity_level"] or "" for row in rows],
+        )
+        for row, value in zip(rows, liters.tolist()):
+            if np.isnan(value):
+                row[OUTPUT_COLUMN] = ""
+            else:
+                row[OUTPUT_COLUMN] = repr(value) if decimals is None else f"{value:.{decimals}f}"
+        writer.writerows(rows)
+
+    total = 0
+    rows = []
+    for row in reader:
+        rows.append(row)
+        if len(rows) >= chunk_size:
+            write_chunk(rows)
+            total += len(rows)
+            rows = []
+    if rows:
+        write_chunk(rows)
+        total += len(rows)
+    return total
+
+
+@click.command()
+@click.argument('input_file', type=click.File('r', encoding='utf-8'))
+@click.option('--output', '-o', type=click.File('w', encoding='utf-8'), default='-',
+              help="Output CSV file (default: standard output).")
+@click.option('--chunk-size', type=click.IntRange(min=1), default=DEFAULT_CHUNK_SIZE, show_default=True,
+              help="Rows calculated at once.")
+@click.option('--decimals', type=click.IntRange(min=0),
+              help="Round water_l to this many decimals (default: full precision).")
+def main(input_file, output, chunk_size, decimals):
+    """Add recommended water intake (liters/day) to every row of INPUT_FILE ('-' for stdin)."""
+    try:
+        total = process_stream(input_file, output, chunk_size, decimals)
+    except ValueError as e:
+        click.echo(f"Error: {e}", err=True)
+        raise click.Abort()
+    click.echo(f"Processed {total} rows.", err=True)
+
+
+if __name__ == "__main__":
+    main()
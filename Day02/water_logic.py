@@ -0,0 +1,49 @@
+"""
+Water intake recommendation, without any user interface.
+
+recommend_water_intake handles one person; recommend_water_intake_batch does
+the same calculation for whole arrays (e.g. a cohort table) with NumPy and
+gives exactly the same numbers.
+"""
+import numpy as np
+
+ACTIVITY_LEVELS = ("low", "medium", "high")
+
+
+def recommend_water_intake(weight_kg, age, activity_level):
+    """Return the recommended water intake in liters per day."""
+    base_ml = weight_kg * 35
+    if age < 18:
+        base_ml *= 1.1
+    elif age > 55:
+        base_ml *= 0.9
+
+    if activity_level == "low":
+        base_ml *= 1.0
+    elif activity_level == "medium":
+        base_ml *= 1.2
+    elif activity_level == "high":
+        base_ml *= 1.4
+
+    return base_ml / 1000
+
+
+def recommend_water_intake_batch(weight_kg, age, activity_level):
+    """
+    Vectorized recommend_water_intake for arrays of weight (kg), age and activity level.
+
+    Uses the same operations in the same order as the scalar function, so every
+    value is identical to calling it row by row. Returns a float array (liters/day).
+    """
+    weight_kg = np.asarray(weight_kg, dtype=float)
+    age = np.asarray(age, dtype=float)
+    activity_level = np.asarray(activity_level, dtype=object)
+
+    base_ml = weight_kg * 35
+    base_ml = np.where(age < 18, base_ml * 1.1, np.where(age > 55, base_ml * 0.9, base_ml))
+    # "low" multiplies by 1.0, unknown levels are left unchanged
+    base_ml = np.where(
+        activity_level == "medium", base_ml * 1.2,
+        np.where(activity_level == "high", base_ml * 1.4, base_ml),
+    )
+    return base_ml / 1000
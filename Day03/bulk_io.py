@@ -0,0 +1,161 @@
+"""
+Bulk input/output for the cell volume CLI.
+
+Transfers are read from a CSV table or from a 96/384-well plate map,
+calculated chunk by chunk with calculate_volumes_batch, and written
+incrementally as CSV or JSON. No user interaction here.
+"""
+
+import csv
+import json
+import math
+
+import numpy as np
+
+from calc_logic import BATCH_COLUMNS, calculate_volumes_batch
+from plate_registry import load_plate_registry
+
+# Columns expected in a CSV table of transfers (same order as the CLI arguments)
+INPUT_COLUMNS = BATCH_COLUMNS
+OUTPUT_COLUMNS = ("well",) + INPUT_COLUMNS + ("volume_to_take", "valid", "exceeds_available")
+
+# Plate map layouts: wells -> (rows, columns)
+PLATE_LAYOUTS = {96: (8, 12), 384: (16, 24)}
+
+DEFAULT_CHUNK_SIZE = 10000
+
+
+def _to_float(value):
+    """Convert a table cell to float, using NaN for empty, non-numeric or infinite cells."""
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        return math.nan
+    return value if math.isfinite(value) else math.nan
+
+
+def _make_chunk(wells, rows):
+    return wells, np.array(rows, dtype=float).reshape(-1, len(INPUT_COLUMNS))
+
+
+def read_transfer_table(stream, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Read transfers from a CSV table with one transfer per row.
+
+    The table needs the columns in INPUT_COLUMNS; an optional `well` column is
+    used as the row label (otherwise the row number is used). The header is
+    checked right away, before any result is written.
+    Returns an iterator of (wells, values) chunks, where values is an (n, 5) float array.
+    """
+    reader = csv.DictReader(stream)
+    missing = [col for col in INPUT_COLUMNS if col not in (reader.fieldnames or [])]
+    if missing:
+        raise ValueError(f"Missing columns in input table: {', '.join(missing)}")
+    return _table_chunks(reader, chunk_size)
+
+
+def _table_chunks(reader, chunk_size):
+    wells, rows = [], []
+    for row_number, row in enumerate(reader, start=1):
+        wells.append(row.get("well") or str(row_number))
+        rows.append([_to_float(row[col]) for col in INPUT_COLUMNS])
+        if len(rows) >= chunk_size:
+            yield _make_chunk(wells, rows)
+            wells, rows = [], []
+    if rows:
+        yield _make_chunk(wells, rows)
+
+
+def read_plate_map(stream, current_area, desired_conf, dest_area, current_volume):
+    """
+    Read a 96/384-well plate map of current confluency values.
+
+    The first row holds the column numbers (1-12 or 1-24) and the first column
+    holds the row letters (A-H or A-P). Empty wells are skipped. The other four
+    values are the same for every well. If current_area is None, the well area
+    of the matching plate in the plate registry is used.
+    The whole map is checked before anything is returned.
+    Returns a list with a single (wells, values) chunk.
+    """
+    reader = csv.reader(stream)
+    header = next(reader, None)
+    if header is None:
+        raise ValueError("Plate map is empty")
+    column_labels = [label.strip() for label in header[1:]]
+    grid = [row for row in reader if any(cell.strip() for cell in row)]
+
+    layout = (len(grid), len(column_labels))
+    if layout not in PLATE_LAYOUTS.values():
+        raise ValueError(
+            f"Plate map must be 8x12 (96 wells) or 16x24 (384 wells), got {layout[0]}x{layout[1]}"
+        )
+    if current_area is None:
+        registry = load_plate_registry()
+        current_area = float(registry.areas[registry.index_by_wells(layout[0] * layout[1])])
+
+    wells, rows = [], []
+    for row in grid:
+        row_label = row[0].strip()
+        if len(row) - 1 < len(column_labels):
+            raise ValueError(f"Plate map row {row_label} has {len(row) - 1} wells, expected {len(column_labels)}")
+        for column_label, cell in zip(column_labels, row[1:]):
+            if not cell.strip():
+                continue
+            wells.append(f"{row_label}{column_label}")
+            rows.append([_to_float(cell), current_area, desired_conf, dest_area, current_volume])
+    return [_make_chunk(wells, rows)]
+
+
+def calculate_chunk(values):
+    """Return (volumes, valid, exceeds_available) for an (n, 5) chunk of transfers."""
+    volumes, valid = calculate_volumes_batch(*values.T)
+    exceeds = valid & (volumes > values[:, INPUT_COLUMNS.index("current_volume")])
+    return volumes, valid, exceeds
+
+
+def _result_rows(wells, values, volumes, valid, exceeds):
+    for i, well in enumerate(wells):
+        row = {"well": well}
+        for col, value in zip(INPUT_COLUMNS, values[i]):
+            row[col] = float(value) if math.isfinite(value) else None
+        row["volume_to_take"] = round(float(volumes[i]), 2) if valid[i] else None
+        row["valid"] = bool(valid[i])
+        row["exceeds_available"] = bool(exceeds[i])
+        yield row
+
+
+def write_results(chunks, stream, output_format="csv"):
+    """
+    Calculate every chunk and write the results to stream as they are ready.
+
+    output_format is "csv" or "json" (a JSON array of objects).
+    Returns a summary dict with the number of rows, invalid rows and rows
+    whose volume exceeds the available volume.
+    """
+    if output_format not in ("csv", "json"):
+        raise ValueError(f"Unknown output format: {output_format}")
+
+    summary = {"total": 0, "invalid": 0, "exceeds_available": 0}
+    if output_format == "csv":
+        writer = csv.DictWriter(stream, fieldnames=OUTPUT_COLUMNS)
+        writer.writeheader()
+    else:
+        stream.write("[")
+
+    for wells, values in chunks:
+        volumes, valid, exceeds = calculate_chunk(values)
+        for row in _result_rows(wells, values, volumes, valid, exceeds):
+            if output_format == "csv":
+                writer.writerow(row)
+            else:
+                stream.write(",\n" if summary["total"] else "\n")
+                # NaN/Infinity are not valid JSON, so fail instead of writing them
+                stream.write(json.dumps(row, ensure_ascii=False, allow_nan=False))
+            summary["total"] += 1
+        summary["invalid"] += int((~valid).sum())
+        summary["exceeds_available"] += int(exceeds.sum())
+        stream.flush()
+
+    if output_format == "json":
+        stream.write("\n]\n")
+    return summary
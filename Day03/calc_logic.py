@@ -1,3 +1,7 @@
+# Column names used by the batch calculator when given a table of plates
+BATCH_COLUMNS = ("current_conf", "current_area", "desired_conf", "dest_area", "current_volume")
+
+
 def calculate_volume(current_conf, current_area, desired_conf, dest_area, current_volume):
     """
     Calculate how much volume should be transferred based on confluency and area.
@@ -20,3 +24,47 @@ def calculate_volume(current_conf, current_area, desired_conf, dest_area, curren
 
     fraction_needed = cells_needed / cells_now
     return current_volume * fraction_needed
+
+
+def calculate_volumes_batch(current_conf, current_area=None, desired_conf=None, dest_area=None, current_volume=None):
+    """
+    Vectorized version of calculate_volume for many transfers at once.
+
+    Accepts either five array-likes (broadcast against each other) or a single
+    DataFrame-like table with the columns listed in BATCH_COLUMNS.
+    Returns (volumes, valid): volumes (µL) as a float array and a boolean mask
+    marking rows whose inputs are all finite and > 0. Invalid rows get NaN
+    instead of raising ValueError. Needs numpy (calculate_volume does not).
+    """
+    import numpy as np
+
+    if hasattr(current_conf, "columns"):
+        table = current_conf
+        missing = [col for col in BATCH_COLUMNS if col not in table.columns]
+        if missing:
+            raise ValueError(f"Missing columns: {', '.join(missing)}")
+        current_conf, current_area, desired_conf, dest_area, current_volume = (
+            np.asarray(table[col], dtype=float) for col in BATCH_COLUMNS
+        )
+    elif current_area is None or desired_conf is None or dest_area is None or current_volume is None:
+        raise ValueError("Expected a table of plates or all five input arrays")
+
+    current_conf, current_area, desired_conf, dest_area, current_volume = np.broadcast_arrays(
+        *(np.asarray(values, dtype=float)
+          for values in (current_conf, current_area, desired_conf, dest_area, current_volume))
+    )
+
+    # Same rules as calculate_volume; NaN inputs compare False and are invalid too,
+    # infinite inputs are rejected explicitly
+    inputs = np.stack([current_conf, current_area, desired_conf, dest_area, current_volume])
+    valid = ((inputs > 0) & np.isfinite(inputs)).all(axis=0)
+
+    # Same order of operations as calculate_volume so results match exactly
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        cells_now = current_conf * current_area
+        cells_needed = desired_conf * dest_area
+        volumes = current_volume * (cells_needed / cells_now)
+    # Products of huge values can still overflow to inf
+    valid &= np.isfinite(volumes)
+
+    return np.where(valid, volumes, np.nan), valid
@@ -0,0 +1,134 @@
+"""
+Long-running calculation service for the cell volume calculators.
+
+Start it once and send it JSON requests, one per line, over stdin/stdout
+or a local TCP socket. This avoids starting Python for every calculation
+when calling from other programs (e.g. LIMS scripts).
+
+Requests (the optional "id" is copied to the response):
+
+    {"id": 1, "current_conf": 50, "current_area": 60, "desired_conf": 25,
+     "dest_area": 10, "current_volume": 3000}
+        -> {"id": 1, "volume": 250.0}
+
+    {"id": 2, "batch": [{...}, {...}]}
+    {"id": 3, "columns": {"current_conf": [...], "current_area": [...], ...}}
+        -> {"id": 2, "volumes": [...], "valid": [...]}
+
+Invalid input (including NaN or infinite numbers) gives {"id": ..., "error": "..."}
+and the service keeps running; batch rows that are invalid get a null volume.
+"""
+
+import json
+import math
+import socketserver
+import sys
+
+import click
+import numpy as np
+
+from calc_logic import BATCH_COLUMNS, calculate_volume, calculate_volumes_batch
+
+
+def _batch_response(columns):
+    volumes, valid = calculate_volumes_batch(*columns)
+    return {
+        "volumes": [float(v) if ok else None for v, ok in zip(volumes.tolist(), valid.tolist())],
+        "valid": valid.tolist(),
+    }
+
+
+def handle_request(request):
+    """Answer one decoded request (a dict) and return the response dict."""
+    response = {}
+    if isinstance(request, dict) and "id" in request:
+        response["id"] = request["id"]
+    try:
+        if not isinstance(request, dict):
+            raise ValueError("Request must be a JSON object")
+        if "batch" in request:
+            rows = request["batch"]
+            columns = [[row.get(col, np.nan) for row in rows] for col in BATCH_COLUMNS]
+            response.update(_batch_response(columns))
+        elif "columns" in request:
+            columns = [request["columns"][col] for col in BATCH_COLUMNS]
+            response.update(_batch_response(columns))
+        else:
+            values = [float(request[col]) for col in BATCH_COLUMNS]
+            if not all(math.isfinite(value) for value in values):
+                raise ValueError("Inputs must be finite numbers")
+            response["volume"] = calculate_volume(*values)
+    except KeyError as e:
+        response["error"] = f"Missing field: {e.args[0]}"
+    except (TypeError, ValueError, AttributeError) as e:
+        response["error"] = str(e) or "Invalid request"
+    return response
+
+
+def handle_line(line):
+    """Answer one request line and return the response line (without newline)."""
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError as e:
+        return json.dumps({"error": f"Invalid JSON: {e}"})
+    response = handle_request(request)
+    try:
+        # NaN/Infinity are not valid JSON
+        return json.dumps(response, allow_nan=False)
+    except ValueError:
+        error = {"id": response["id"]} if "id" in response else {}
+        error["error"] = "Result is not a finite number"
+        return json.dumps(error)
+
+
+def serve_stream(infile, outfile):
+    """Answer requests line by line until infile is closed."""
+    for line in infile:
+        if not line.strip():
+            continue
+        outfile.write(handle_line(line) + "\n")
+        outfile.flush()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for raw_line in self.rfile:
+            line = raw_line.decode("utf-8")
+            if not line.strip():
+                continue
+            self.wfile.write((handle_line(line) + "\n").encode("utf-8"))
+
+
+class CalcServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+@click.command()
+@click.option('--port', type=click.IntRange(0, 65535),
+              help="Listen on this local TCP port instead of reading stdin.")
+@click.option('--host', default="127.0.0.1", show_default=True, help="Address to listen on with --port.")
+def main(port, host):
+    """
+    Run the cell volume calculator as a long-lived service.
+
+    \b
+    Reads one JSON request per line and writes one JSON response per line.
+    Example (stdin):
+
+        echo '{"current_conf": 50, "current_area": 60, "desired_conf": 25, "dest_area": 10, "current_volume": 3000}' | python calc_service.py
+    """
+    if port is None:
+        serve_stream(sys.stdin, sys.stdout)
+        return
+
+    with CalcServer((host, port), _RequestHandler) as server:
+        click.echo(f"Listening on {host}:{server.server_address[1]}", err=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,34 @@
 import click
 from calc_logic import calculate_volume
+from bulk_io import DEFAULT_CHUNK_SIZE, read_plate_map, read_transfer_table, write_results
+from plate_registry import load_plate_registry
 
 
 @click.command()
-@click.argument('current_conf', type=click.FLOAT)
-@click.argument('current_area', type=click.FLOAT)
-@click.argument('desired_conf', type=click.FLOAT)
-@click.argument('dest_area', type=click.FLOAT)
-@click.argument('current_vol', type=click.FLOAT)
-def main(current_conf, current_area, desired_conf, dest_area, current_vol):
+@click.argument('current_conf', type=click.FLOAT, required=False)
+@click.argument('current_area', type=click.FLOAT, required=False)
+@click.argument('desired_conf', type=click.FLOAT, required=False)
+@click.argument('dest_area', type=click.FLOAT, required=False)
+@click.argument('current_vol', type=click.FLOAT, required=False)
+@click.option('--bulk', 'bulk_file', type=click.File('r', encoding='utf-8'),
+              help="Read many transfers from a CSV file ('-' for stdin) instead of the arguments.")
+@click.option('--plate-map', is_flag=True,
+              help="The bulk file is a 96/384-well plate map of current confluency values.")
+@click.option('--map-area', type=click.FLOAT,
+              help="Plate map mode: area (cm²) of every source well (default: from plates.csv by plate size).")
+@click.option('--map-desired-conf', type=click.FLOAT, help="Plate map mode: desired confluency (%) for every well.")
+@click.option('--map-dest-area', type=click.FLOAT, help="Plate map mode: destination plate area (cm²).")
+@click.option('--map-dest-plate', help="Plate map mode: destination plate name from plates.csv, e.g. '6 well'.")
+@click.option('--map-vol', type=click.FLOAT, help="Plate map mode: volume (µL) in every source well.")
+@click.option('--output', '-o', type=click.File('w', encoding='utf-8'), default='-',
+              help="Where to write bulk results (default: stdout).")
+@click.option('--format', 'output_format', type=click.Choice(['csv', 'json']), default='csv',
+              help="Bulk output format (default: csv).")
+@click.option('--chunk-size', type=click.IntRange(min=1), default=DEFAULT_CHUNK_SIZE,
+              help="Number of rows calculated at once in bulk mode.")
+def main(current_conf, current_area, desired_conf, dest_area, current_vol,
+         bulk_file, plate_map, map_area, map_desired_conf, map_dest_area, map_dest_plate, map_vol,
+         output, output_format, chunk_size):
     """
     Calculate the volume to transfer from a source plate to reach desired confluency.
     
@@ -55,7 +75,40 @@ def main(current_conf, current_area, desired_conf, dest_area, current_vol):
     This calculates the volume to take from a 10 cm plate (60 cm²) with 50% 
     confluency to achieve 25% confluency in a 6-well plate (10 cm²), 
     assuming 3000 µL total volume in the source plate.
+
+    \b
+    BULK MODE:
+
+    \b
+    --bulk transfers.csv   CSV with the columns current_conf, current_area,
+                           desired_conf, dest_area, current_volume (optional: well)
+    --bulk plate.csv --plate-map
+                           96/384-well grid of current confluency values;
+                           the other values come from the --map-* options
+                           (plate names are listed in plates.csv)
+
+    \b
+    Results are written row by row as CSV or JSON, with a flag for rows whose
+    volume exceeds the available volume. Example:
+
+        python cell_volume_cli.py --bulk transfers.csv --format json -o results.json
     """
+    if bulk_file is not None:
+        if any(value is not None for value in (current_conf, current_area, desired_conf, dest_area, current_vol)):
+            raise click.UsageError("--bulk FILE cannot be combined with the 5 arguments.")
+        if map_dest_plate is not None:
+            registry = load_plate_registry()
+            try:
+                map_dest_area = float(registry.areas[registry.index(map_dest_plate)])
+            except ValueError as e:
+                raise click.BadParameter(str(e), param_hint="--map-dest-plate")
+        run_bulk(bulk_file, plate_map, (map_area, map_desired_conf, map_dest_area, map_vol),
+                 output, output_format, chunk_size)
+        return
+
+    if None in (current_conf, current_area, desired_conf, dest_area, current_vol):
+        raise click.UsageError("Expected 5 arguments (or --bulk FILE).")
+
     try:
         v_take = calculate_volume(current_conf, current_area, desired_conf, dest_area, current_vol)
         
@@ -69,5 +122,29 @@ def main(current_conf, current_area, desired_conf, dest_area, current_vol):
         raise click.Abort()
 
 
+def run_bulk(bulk_file, plate_map, map_values, output, output_format, chunk_size):
+    """Calculate all transfers from a CSV table or plate map and write the results."""
+    try:
+        if plate_map:
+            if None in map_values[1:]:
+                raise click.UsageError(
+                    "--plate-map needs --map-desired-conf, --map-dest-area (or --map-dest-plate) and --map-vol."
+                )
+            chunks = read_plate_map(bulk_file, *map_values)
+        else:
+            chunks = read_transfer_table(bulk_file, chunk_size)
+        summary = write_results(chunks, output, output_format)
+    except ValueError as e:
+        click.echo(f"Error: {e}", err=True)
+        raise click.Abort()
+
+    click.echo(
+        f"Processed {summary['total']} transfers: "
+        f"{summary['exceeds_available']} exceed the available volume, "
+        f"{summary['invalid']} invalid.",
+        err=True,
+    )
+
+
 if __name__ == "__main__":
     main()
@@ -1,17 +1,17 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from tkinter import simpledialog
-from calc_logic import calculate_volume
-
-# Plate info: area (cm²) and final culture volume (µL)
-plates = {
-    "96 well (0.33 cm², 100 µL)": {"area": 0.33, "final_vol": 100},
-    "24 well (2 cm², 500 µL)": {"area": 2, "final_vol": 500},
-    "12 well (4 cm², 1000 µL)": {"area": 4, "final_vol": 1000},
-    "6 well (10 cm², 2000 µL)": {"area": 10, "final_vol": 2000},
-    "10 cm (60 cm², 10000 µL)": {"area": 60, "final_vol": 10000},
-    "Other": {"area": None, "final_vol": None}
-}
+from plate_registry import load_plate_registry
+
+# Plate info (area, final culture volume) comes from plates.csv
+registry = load_plate_registry()
+OTHER = "Other"
+DEFAULT_CURRENT_PLATE = "10 cm"
+DEFAULT_DESTINATION_PLATE = "6 well"
+
+
+def plate_options():
+    return registry.labels + [OTHER]
 
 # ---------- Helper functions ----------
 
@@ -22,25 +22,43 @@ def safe_float(s):
         return None
 
 def reset_fields():
-    current_plate_dropdown.current(4) 
-    destination_plate_dropdown.current(3)  # 6 well
+    current_plate_dropdown.current(registry.index(DEFAULT_CURRENT_PLATE))
+    destination_plate_dropdown.current(registry.index(DEFAULT_DESTINATION_PLATE))
     current_conf_entry.delete(0, tk.END)
     desired_conf_entry.delete(0, tk.END)
     current_vol_entry.delete(0, tk.END)
     result_label.config(text="", foreground="black")
+    previous_current_plate[0] = current_plate_var.get()
+    previous_destination_plate[0] = destination_plate_var.get()
 
-def get_plate_params(key):
-    """Return area and final_vol. If Other, ask user for input."""
-    if key != "Other":
-        return plates[key]["area"], plates[key]["final_vol"]
+def report_error(title, message, quiet=False):
+    """Show an error dialog, or just clear the result during live updates."""
+    if quiet:
+        result_label.config(text="")
     else:
-        area = simpledialog.askfloat("Custom plate", "Enter plate area (cm²):", minvalue=0.01)
-        final_vol = simpledialog.askfloat("Custom plate", "Enter final volume (µL):", minvalue=1)
-        return area, final_vol
+        messagebox.showerror(title, message)
+
+def on_plate_selected(dropdown, var, previous):
+    """When Other is chosen, ask once for the custom plate and add it to the dropdown."""
+    if var.get() != OTHER:
+        previous[0] = var.get()
+        return
+    area = simpledialog.askfloat("Custom plate", "Enter plate area (cm²):", minvalue=0.01)
+    final_vol = simpledialog.askfloat("Custom plate", "Enter final volume (µL):", minvalue=1) if area else None
+    if not area or not final_vol:
+        var.set(previous[0])
+        return
+    index = registry.add_custom(area, final_vol)
+    current_plate_dropdown.config(values=plate_options())
+    destination_plate_dropdown.config(values=plate_options())
+    dropdown.current(index)
+    previous[0] = var.get()
+    calculate(quiet=True)
 
 # ---------- Main calculation ----------
 
-def calculate():
+def calculate(quiet=False):
+    """Calculate and show the result. With quiet=True (live update while typing) no error dialogs are shown."""
     try:
         current_plate_key = current_plate_var.get()
         destination_plate_key = destination_plate_var.get()
@@ -49,17 +67,18 @@ def calculate():
         current_vol = safe_float(current_vol_entry.get())
 
         if not all([current_conf, desired_conf, current_vol]):
-            messagebox.showerror("Input error", "Please enter numeric values for all fields.")
+            report_error("Input error", "Please enter numeric values for all fields.", quiet)
             return
 
         if current_conf <= 0 or desired_conf <= 0:
-            messagebox.showerror("Input error", "Confluency values must be > 0.")
+            report_error("Input error", "Confluency values must be > 0.", quiet)
             return
 
-        current_area, _ = get_plate_params(current_plate_key)
-        dest_area, dest_final_vol = get_plate_params(destination_plate_key)
+        source_index = registry.index(current_plate_key)
+        dest_index = registry.index(destination_plate_key)
+        dest_final_vol = registry.final_vols[dest_index]
 
-        volume_to_take = calculate_volume(current_conf, current_area, desired_conf, dest_area, current_vol)
+        volume_to_take = registry.transfer_volume(source_index, dest_index, current_conf, desired_conf, current_vol)
         media_to_add = dest_final_vol - volume_to_take
 
         # Build result text
@@ -87,7 +106,7 @@ def calculate():
         result_label.config(text="\n".join(text_lines), foreground=color)
 
     except Exception as e:
-        messagebox.showerror("Error", f"Something went wrong.\n\n{e}")
+        report_error("Error", f"Something went wrong.\n\n{e}", quiet)
 
 # ---------- GUI setup ----------
 
@@ -100,8 +119,8 @@ frame = ttk.Frame(root, padding=15)
 frame.pack(fill="both", expand=True)
 
 ttk.Label(frame, text="Current plate type:").grid(row=0, column=0, sticky="w", pady=5)
-current_plate_var = tk.StringVar(value=list(plates.keys())[4])
-current_plate_dropdown = ttk.Combobox(frame, textvariable=current_plate_var, values=list(plates.keys()), width=40, state="readonly")
+current_plate_var = tk.StringVar(value=registry.labels[registry.index(DEFAULT_CURRENT_PLATE)])
+current_plate_dropdown = ttk.Combobox(frame, textvariable=current_plate_var, values=plate_options(), width=40, state="readonly")
 current_plate_dropdown.grid(row=0, column=1, pady=5)
 
 ttk.Label(frame, text="Current confluency (%):").grid(row=1, column=0, sticky="w", pady=5)
@@ -113,8 +132,8 @@ current_vol_entry = ttk.Entry(frame, width=10)
 current_vol_entry.grid(row=2, column=1, pady=5)
 
 ttk.Label(frame, text="Destination plate type:").grid(row=3, column=0, sticky="w", pady=5)
-destination_plate_var = tk.StringVar(value=list(plates.keys())[3])
-destination_plate_dropdown = ttk.Combobox(frame, textvariable=destination_plate_var, values=list(plates.keys()), width=40, state="readonly")
+destination_plate_var = tk.StringVar(value=registry.labels[registry.index(DEFAULT_DESTINATION_PLATE)])
+destination_plate_dropdown = ttk.Combobox(frame, textvariable=destination_plate_var, values=plate_options(), width=40, state="readonly")
 destination_plate_dropdown.grid(row=3, column=1, pady=5)
 
 ttk.Label(frame, text="Desired confluency (%):").grid(row=4, column=0, sticky="w", pady=5)
@@ -129,4 +148,18 @@ ttk.Button(btn_frame, text="Reset", command=reset_fields).grid(row=0, column=1,
 result_label = ttk.Label(frame, text="", wraplength=560, justify="left", font=("Arial", 11))
 result_label.grid(row=6, column=0, columnspan=2, sticky="w", pady=10)
 
+# Recalculate while typing and when a plate is chosen
+for entry in (current_conf_entry, desired_conf_entry, current_vol_entry):
+    entry.bind("<KeyRelease>", lambda event: calculate(quiet=True))
+previous_current_plate = [current_plate_var.get()]
+previous_destination_plate = [destination_plate_var.get()]
+current_plate_dropdown.bind(
+    "<<ComboboxSelected>>",
+    lambda event: on_plate_selected(current_plate_dropdown, current_plate_var, previous_current_plate),
+)
+destination_plate_dropdown.bind(
+    "<<ComboboxSelected>>",
+    lambda event: on_plate_selected(destination_plate_dropdown, destination_plate_var, previous_destination_plate),
+)
+
 root.mainloop()
@@ -0,0 +1,131 @@
+"""
+Plate-split planner: seed many destination plates from one source plate.
+
+Given the source plate and the volume of cell suspension available, decide
+which destination plates to seed so that either the leftover volume is as
+small as possible or as many plates as possible are satisfied.
+No user interaction here.
+"""
+
+import math
+
+from calc_logic import calculate_volumes_batch
+
+OBJECTIVES = ("min_leftover", "max_plates")
+
+# Volumes are rounded up to this step (µL) for the knapsack table
+DEFAULT_RESOLUTION = 0.1
+
+
+def _choose_min_leftover(weights, capacity):
+    """
+    Subset-sum knapsack: pick items whose total weight is as large as possible
+    without exceeding capacity. Reachable totals are kept as bits of a Python
+    int, so each item costs one shift-and-or over the whole table.
+    """
+    mask = (1 << (capacity + 1)) - 1
+    reachable = 1  # only total 0 is reachable before any item
+    history = []
+    for weight in weights:
+        history.append(reachable)
+        reachable |= (reachable << weight) & mask
+
+    # Walk back from the best total: if it was reachable without item i, skip i
+    total = reachable.bit_length() - 1
+    chosen = []
+    for i in range(len(weights) - 1, -1, -1):
+        if not (history[i] >> total) & 1:
+            chosen.append(i)
+            total -= weights[i]
+    return chosen[::-1]
+
+
+def _choose_max_plates(volumes, available_volume):
+    """Smallest volumes first gives the largest number of plates that fit."""
+    chosen = []
+    used = 0.0
+    for i in sorted(range(len(volumes)), key=lambda i: volumes[i]):
+        if used + volumes[i] > available_volume:
+            break
+        chosen.append(i)
+        used += volumes[i]
+    return sorted(chosen)
+
+
+def plan_transfers(current_conf, current_area, available_volume, destinations,
+                   objective="min_leftover", resolution=DEFAULT_RESOLUTION):
+    """
+    Plan how to split one source plate across many destination plates.
+
+    destinations is a list of dicts with "area" (cm²) and "desired_conf" (%),
+    and optionally "name" and "final_vol" (µL, the destination's total volume;
+    plates that would need more than this cannot be seeded).
+
+    objective:
+        "min_leftover" - use as much of the available volume as possible
+                         (exact knapsack on volumes rounded up to `resolution` µL)
+        "max_plates"   - seed as many destination plates as possible
+
+    Returns a dict with:
+        "transfers"       - list of {"destination", "name", "volume", "media_to_add"}
+        "unsatisfied"     - indices of destinations that were not seeded
+        "used_volume"     - total volume taken from the source plate (µL)
+        "leftover_volume" - volume left in the source plate (µL)
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective: {objective}")
+    if current_conf <= 0:
+        raise ValueError("Current confluency must be > 0")
+    if current_area <= 0:
+        raise ValueError("Plate areas must be > 0")
+    if available_volume <= 0:
+        raise ValueError("Available volume must be > 0")
+    if resolution <= 0:
+        raise ValueError("Resolution must be > 0")
+
+    volumes, valid = calculate_volumes_batch(
+        current_conf,
+        current_area,
+        [dest["desired_conf"] for dest in destinations],
+        [dest["area"] for dest in destinations],
+        available_volume,
+    )
+    if not valid.all():
+        bad = [i for i in range(len(destinations)) if not valid[i]]
+        raise ValueError(f"Destinations with invalid area or confluency: {bad}")
+
+    # Only plates that fit on their own are candidates
+    candidates = [
+        i for i, dest in enumerate(destinations)
+        if volumes[i] <= available_volume
+        and (dest.get("final_vol") is None or volumes[i] <= dest["final_vol"])
+    ]
+    candidate_volumes = [float(volumes[i]) for i in candidates]
+
+    if objective == "min_leftover":
+        # Round weights up so the plan never needs more than is available
+        weights = [max(1, math.ceil(v / resolution - 1e-9)) for v in candidate_volumes]
+        capacity = math.floor(available_volume / resolution + 1e-9)
+        chosen = _choose_min_leftover(weights, capacity)
+    else:
+        chosen = _choose_max_plates(candidate_volumes, available_volume)
+
+    selected = [candidates[j] for j in chosen]
+    transfers = []
+    for i in selected:
+        final_vol = destinations[i].get("final_vol")
+        transfers.append({
+            "destination": i,
+            "name": destinations[i].get("name"),
+            "volume": float(volumes[i]),
+            "media_to_add": None if final_vol is None else final_vol - float(volumes[i]),
+        })
+
+    used_volume = sum(t["volume"] for t in transfers)
+    selected_set = set(selected)
+    return {
+        "transfers": transfers,
+        "unsatisfied": [i for i in range(len(destinations)) if i not in selected_set],
+        "used_volume": used_volume,
+        "leftover_volume": available_volume - used_volume,
+    }
@@ -0,0 +1,120 @@
+"""
+Plate definitions shared by the cell volume calculators.
+
+Plates (area, final volume, number of wells) are loaded from plates.csv.
+The registry keeps a precomputed table of area ratios so a pair of plates
+is resolved by index lookup, and caches custom plates so they are only
+entered once. No user interaction here.
+"""
+
+import csv
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+from calc_logic import calculate_volume
+
+DEFAULT_PLATES_FILE = Path(__file__).parent / "plates.csv"
+
+
+def plate_label(name, area, final_vol):
+    """Return the dropdown label for a plate, e.g. '6 well (10 cm², 2000 µL)'."""
+    return f"{name} ({area:g} cm², {final_vol:g} µL)"
+
+
+class PlateRegistry:
+    """Plate definitions with a precomputed area-ratio table."""
+
+    def __init__(self, plates):
+        self.names = []
+        self.labels = []
+        self.wells = []
+        self._areas = []
+        self._final_vols = []
+        self._index = {}
+        self._custom = {}  # (area, final_vol) -> index
+        for plate in plates:
+            self._add(plate["name"], plate["area"], plate["final_vol"], plate.get("wells"))
+        self._build_ratio_table()
+
+    def __len__(self):
+        return len(self.names)
+
+    def _add(self, name, area, final_vol, wells=None):
+        if area <= 0:
+            raise ValueError(f"Plate area must be > 0 ({name})")
+        if final_vol <= 0:
+            raise ValueError(f"Final volume must be > 0 ({name})")
+        index = len(self.names)
+        label = plate_label(name, area, final_vol)
+        self.names.append(name)
+        self.labels.append(label)
+        self.wells.append(wells)
+        self._areas.append(float(area))
+        self._final_vols.append(float(final_vol))
+        self._index[name] = index
+        self._index[label] = index
+        return index
+
+    def _build_ratio_table(self):
+        # ratios[i, j] = area of plate j / area of plate i (destination / source)
+        self.areas = np.array(self._areas)
+        self.final_vols = np.array(self._final_vols)
+        self.area_ratios = self.areas[np.newaxis, :] / self.areas[:, np.newaxis]
+
+    def index(self, key):
+        """Return the index of a plate given its name or dropdown label."""
+        try:
+            return self._index[key]
+        except KeyError:
+            raise ValueError(f"Unknown plate: {key}") from None
+
+    def index_by_wells(self, wells):
+        """Return the index of the plate with the given number of wells."""
+        for index, plate_wells in enumerate(self.wells):
+            if plate_wells == wells:
+                return index
+        raise ValueError(f"No plate with {wells} wells")
+
+    def add_custom(self, area, final_vol):
+        """
+        Add a custom plate and return its index.
+        The same area and final volume always return the same cached plate.
+        """
+        key = (float(area), float(final_vol))
+        if key not in self._custom:
+            self._custom[key] = self._add("Custom", area, final_vol)
+            self._build_ratio_table()
+        return self._custom[key]
+
+    def area_ratio(self, source, dest):
+        """Return destination area / source area for two plate indices."""
+        return self.area_ratios[source, dest]
+
+    def transfer_volume(self, source, dest, current_conf, desired_conf, current_volume):
+        """Volume (µL) to take from the source plate (calc_logic.calculate_volume with the plates' areas)."""
+        return calculate_volume(current_conf, self._areas[source], desired_conf, self._areas[dest], current_volume)
+
+
+def read_plates_file(path):
+    """Read plate definitions from a CSV file with name, area, final_vol and wells columns."""
+    plates = []
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        for row_number, row in enumerate(csv.DictReader(f), start=2):
+            try:
+                plates.append({
+                    "name": row["name"].strip(),
+                    "area": float(row["area"]),
+                    "final_vol": float(row["final_vol"]),
+                    "wells": int(row["wells"]) if row.get("wells") else None,
+                })
+            except (KeyError, TypeError, ValueError):
+                raise ValueError(f"Invalid plate definition in {path}, line {row_number}") from None
+    return plates
+
+
+@lru_cache(maxsize=None)
+def load_plate_registry(path=DEFAULT_PLATES_FILE):
+    """Load (once) the plate registry from a plates file."""
+    return PlateRegistry(read_plates_file(path))
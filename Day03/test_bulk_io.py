@@ -0,0 +1,86 @@
+import io
+import json
+
+import pytest
+from click.testing import CliRunner
+
+import cell_volume_cli
+from bulk_io import read_plate_map, read_transfer_table, write_results
+
+TABLE = """well,current_conf,current_area,desired_conf,dest_area,current_volume
+A1,50,10,25,10,2000
+A2,10,0.33,80,2,100
+A3,0,10,25,10,2000
+"""
+
+
+def plate_map_text(rows, columns):
+    lines = ["," + ",".join(str(c) for c in range(1, columns + 1))]
+    for r in range(rows):
+        lines.append(chr(ord("A") + r) + "," + ",".join(["50"] * columns))
+    return "\n".join(lines) + "\n"
+
+
+def test_table_results_and_flags():
+    out = io.StringIO()
+    summary = write_results(read_transfer_table(io.StringIO(TABLE), chunk_size=2), out, "json")
+    rows = json.loads(out.getvalue())
+
+    assert summary == {"total": 3, "invalid": 1, "exceeds_available": 1}
+    assert rows[0]["volume_to_take"] == 1000
+    assert rows[1]["exceeds_available"] is True
+    assert rows[2]["valid"] is False and rows[2]["volume_to_take"] is None
+
+
+def test_table_missing_column():
+    with pytest.raises(ValueError):
+        read_transfer_table(io.StringIO("current_conf,current_area\n50,10\n"))
+
+
+def test_missing_column_writes_no_output(tmp_path):
+    bulk = tmp_path / "transfers.csv"
+    bulk.write_text("current_conf,current_area\n50,10\n", encoding="utf-8")
+    output = tmp_path / "results.csv"
+    result = CliRunner().invoke(cell_volume_cli.main, ["--bulk", str(bulk), "-o", str(output)])
+    assert result.exit_code != 0
+    assert "Missing columns" in result.output
+    assert not output.exists()
+
+
+def test_bulk_rejects_arguments(tmp_path):
+    bulk = tmp_path / "transfers.csv"
+    bulk.write_text(TABLE, encoding="utf-8")
+    result = CliRunner().invoke(cell_volume_cli.main, ["50", "10", "--bulk", str(bulk)])
+    assert result.exit_code == 2
+    assert "cannot be combined" in result.output
+
+
+def test_infinite_values_are_invalid():
+    table = TABLE + "A4,inf,10,25,10,2000\nA5,50,10,25,10,-inf\n"
+    out = io.StringIO()
+    summary = write_results(read_transfer_table(io.StringIO(table)), out, "json")
+    rows = json.loads(out.getvalue(), parse_constant=pytest.fail)
+
+    assert summary["invalid"] == 3
+    assert rows[3]["current_conf"] is None and rows[3]["valid"] is False
+    assert rows[4]["current_volume"] is None and rows[4]["volume_to_take"] is None
+
+
+@pytest.mark.parametrize("rows, columns", [(8, 12), (16, 24)])
+def test_plate_map_layouts(rows, columns):
+    out = io.StringIO()
+    summary = write_results(read_plate_map(io.StringIO(plate_map_text(rows, columns)), 10, 25, 10, 2000), out)
+    assert summary["total"] == rows * columns
+    assert out.getvalue().splitlines()[1].startswith("A1,50.0,10.0,25.0,10.0,2000.0,1000.0,")
+
+
+def test_plate_map_short_row():
+    lines = plate_map_text(8, 12).splitlines()
+    lines[3] = lines[3].rsplit(",", 1)[0]
+    with pytest.raises(ValueError, match="row C"):
+        read_plate_map(io.StringIO("\n".join(lines)), 10, 25, 10, 2000)
+
+
+def test_plate_map_wrong_layout():
+    with pytest.raises(ValueError):
+        read_plate_map(io.StringIO(plate_map_text(4, 6)), 10, 25, 10, 2000)
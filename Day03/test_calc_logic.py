@@ -1,4 +1,9 @@
-from calc_logic import calculate_volume
+import os
+import subprocess
+import sys
+
+from calc_logic import calculate_volume, calculate_volumes_batch
+import numpy as np
 import pytest
 
 # Normal calculation
@@ -22,3 +27,55 @@ def test_error_zero_current_area():
 def test_error_zero_dest_area():
     with pytest.raises(ValueError):
         calculate_volume(50, 10, 25, 0, 2000)
+
+
+# Batch calculation
+def test_batch_matches_scalar():
+    current_conf = np.array([50, 80, 30.5])
+    current_area = np.array([10, 0.33, 60])
+    desired_conf = np.array([25, 40, 70])
+    dest_area = np.array([10, 2, 9.6])
+    current_volume = np.array([2000, 200, 3000])
+
+    volumes, valid = calculate_volumes_batch(current_conf, current_area, desired_conf, dest_area, current_volume)
+
+    assert valid.all()
+    for i in range(len(volumes)):
+        assert volumes[i] == calculate_volume(
+            current_conf[i], current_area[i], desired_conf[i], dest_area[i], current_volume[i]
+        )
+
+def test_batch_invalid_rows_are_masked():
+    volumes, valid = calculate_volumes_batch([50, 0, 50, np.nan], 10, [25, 25, -1, 25], 10, 2000)
+    assert valid.tolist() == [True, False, False, False]
+    assert volumes[0] == 1000
+    assert np.isnan(volumes[1:]).all()
+
+def test_batch_infinite_rows_are_masked():
+    volumes, valid = calculate_volumes_batch([50, np.inf, 50, 50], 10, [25, 25, 25, 1e300], [10, 10, np.inf, 1e300], 2000)
+    assert valid.tolist() == [True, False, False, False]
+    assert np.isnan(volumes[1:]).all()
+
+def test_scalar_import_does_not_need_numpy():
+    code = "import sys, calc_logic; calc_logic.calculate_volume(50, 10, 25, 10, 2000); print('numpy' in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(os.path.abspath(__file__)),
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
+
+def test_batch_from_table():
+    pd = pytest.importorskip("pandas")
+    table = pd.DataFrame({
+        "current_conf": [50, 50],
+        "current_area": [10, 0],
+        "desired_conf": [25, 25],
+        "dest_area": [10, 10],
+        "current_volume": [2000, 2000],
+    })
+    volumes, valid = calculate_volumes_batch(table)
+    assert valid.tolist() == [True, False]
+    assert volumes[0] == 1000
+
+def test_batch_table_missing_column():
+    pd = pytest.importorskip("pandas")
+    with pytest.raises(ValueError):
+        calculate_volumes_batch(pd.DataFrame({"current_conf": [50]}))
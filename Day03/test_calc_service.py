@@ -0,0 +1,50 @@
+import io
+import json
+
+import pytest
+
+from calc_service import handle_request, serve_stream
+
+TRANSFER = {"current_conf": 50, "current_area": 10, "desired_conf": 25, "dest_area": 10, "current_volume": 2000}
+
+
+def test_single_request():
+    assert handle_request(dict(TRANSFER, id=7)) == {"id": 7, "volume": 1000}
+
+
+def test_batch_request():
+    response = handle_request({"batch": [TRANSFER, dict(TRANSFER, current_conf=0)]})
+    assert response == {"volumes": [1000, None], "valid": [True, False]}
+
+
+def test_columns_request():
+    columns = {key: [value] for key, value in TRANSFER.items()}
+    assert handle_request({"columns": columns})["volumes"] == [1000]
+
+
+def test_errors_keep_service_running():
+    out = io.StringIO()
+    serve_stream(io.StringIO("not json\n" + json.dumps(dict(TRANSFER, current_area=0)) + "\n"
+                             + json.dumps({"current_conf": 50}) + "\n" + json.dumps(TRANSFER) + "\n"), out)
+    responses = [json.loads(line) for line in out.getvalue().splitlines()]
+
+    assert "error" in responses[0]
+    assert responses[1]["error"] == "Plate areas must be > 0"
+    assert responses[2]["error"] == "Missing field: current_area"
+    assert responses[3] == {"volume": 1000}
+
+
+def test_non_finite_inputs_are_rejected():
+    out = io.StringIO()
+    requests = [
+        dict(TRANSFER, id=1, current_conf="nan"),
+        dict(TRANSFER, id=2, dest_area="inf"),
+        {"id": 3, "batch": [TRANSFER, dict(TRANSFER, current_volume="Infinity"), dict(TRANSFER, current_conf="nan")]},
+    ]
+    serve_stream(io.StringIO("".join(json.dumps(r) + "\n" for r in requests)), out)
+    lines = out.getvalue().splitlines()
+    responses = [json.loads(line, parse_constant=lambda name: pytest.fail(f"{name} in response")) for line in lines]
+
+    assert responses[0] == {"id": 1, "error": "Inputs must be finite numbers"}
+    assert responses[1] == {"id": 2, "error": "Inputs must be finite numbers"}
+    assert responses[2] == {"id": 3, "volumes": [1000, None, None], "valid": [True, False, False]}
@@ -0,0 +1,47 @@
+import pytest
+
+from plate_planner import plan_transfers
+
+# Source: 50% confluency on 10 cm² with 1000 µL, so each plate needs
+# 1000 * desired_conf * area / (50 * 10) = 2 * desired_conf * area µL
+DESTINATIONS = [
+    {"name": "a", "area": 10, "desired_conf": 30},   # 600 µL
+    {"name": "b", "area": 10, "desired_conf": 20},   # 400 µL
+    {"name": "c", "area": 10, "desired_conf": 25},   # 500 µL
+    {"name": "d", "area": 2, "desired_conf": 25},    # 100 µL
+]
+
+
+def test_min_leftover_uses_all_volume():
+    plan = plan_transfers(50, 10, 1000, DESTINATIONS)
+    assert sum(t["volume"] for t in plan["transfers"]) == pytest.approx(1000)
+    assert plan["leftover_volume"] == pytest.approx(0)
+
+
+def test_max_plates_prefers_small_volumes():
+    plan = plan_transfers(50, 10, 1000, DESTINATIONS, objective="max_plates")
+    assert [t["name"] for t in plan["transfers"]] == ["b", "c", "d"]
+    assert plan["unsatisfied"] == [0]
+
+
+def test_destination_final_volume_limits_plan():
+    destinations = [{"area": 10, "desired_conf": 30, "final_vol": 500}]
+    plan = plan_transfers(50, 10, 1000, destinations)
+    assert plan["transfers"] == []
+    assert plan["unsatisfied"] == [0]
+
+
+def test_media_to_add():
+    destinations = [{"area": 2, "desired_conf": 25, "final_vol": 500}]
+    plan = plan_transfers(50, 10, 1000, destinations)
+    assert plan["transfers"][0]["media_to_add"] == pytest.approx(400)
+
+
+def test_invalid_destination():
+    with pytest.raises(ValueError):
+        plan_transfers(50, 10, 1000, [{"area": 0, "desired_conf": 25}])
+
+
+def test_invalid_objective():
+    with pytest.raises(ValueError):
+        plan_transfers(50, 10, 1000, DESTINATIONS, objective="fastest")
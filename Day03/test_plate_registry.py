@@ -0,0 +1,48 @@
+import pytest
+
+from calc_logic import calculate_volume
+from plate_registry import PlateRegistry, load_plate_registry
+
+PLATES = [
+    {"name": "6 well", "area": 10, "final_vol": 2000, "wells": 6},
+    {"name": "10 cm", "area": 60, "final_vol": 10000, "wells": 1},
+]
+
+
+def test_default_plates_file():
+    registry = load_plate_registry()
+    assert registry.labels[registry.index("96 well")] == "96 well (0.33 cm², 100 µL)"
+    assert registry.index_by_wells(384) == registry.index("384 well")
+
+
+def test_lookup_by_name_and_label():
+    registry = PlateRegistry(PLATES)
+    assert registry.index("10 cm") == registry.index("10 cm (60 cm², 10000 µL)") == 1
+
+
+def test_transfer_volume_matches_calculate_volume():
+    registry = PlateRegistry(PLATES)
+    source, dest = registry.index("10 cm"), registry.index("6 well")
+    for current_conf, desired_conf, current_volume in [(50, 25, 3000), (33.3, 71.1, 1234.5), (0.7, 99.9, 10)]:
+        volume = registry.transfer_volume(source, dest, current_conf, desired_conf, current_volume)
+        assert volume == calculate_volume(current_conf, 60, desired_conf, 10, current_volume)
+    with pytest.raises(ValueError):
+        registry.transfer_volume(source, dest, 0, 25, 3000)
+
+
+def test_custom_plates_are_cached():
+    registry = PlateRegistry(PLATES)
+    index = registry.add_custom(5, 800)
+    assert registry.add_custom(5, 800) == index
+    assert len(registry) == 3
+    assert registry.area_ratio(0, index) == pytest.approx(0.5)
+
+
+def test_unknown_plate():
+    with pytest.raises(ValueError):
+        PlateRegistry(PLATES).index("2 well")
+
+
+def test_invalid_plate_area():
+    with pytest.raises(ValueError):
+        PlateRegistry([{"name": "bad", "area": 0, "final_vol": 100}])
@@ -1,4 +1,5 @@
 import random
+import sys
 
 AMINO_ACIDS = {
     "A": {"name": "Alanine",       "charge": "neutral", "polarity": "nonpolar", "aromatic": "non-aromatic"},
@@ -23,6 +24,9 @@ AMINO_ACIDS = {
     "V": {"name": "Valine",        "charge": "neutral", "polarity": "nonpolar","aromatic": "non-aromatic"},
 }
 
+# Codes in a fixed order, so random choices don't rebuild the list every time
+AMINO_ACID_CODES = tuple(AMINO_ACIDS)
+
 CATEGORY_OPTIONS = {
     "charge": ["positive", "negative", "neutral"],
     "polarity": ["polar", "nonpolar"],
@@ -34,7 +38,7 @@ def get_random_amino_acid(rng: random.Random | None = None) -> tuple[str, dict]:
     """Return a random (code, properties_dict) pair."""
     if rng is None:
         rng = random
-    code = rng.choice(list(AMINO_ACIDS.keys()))
+    code = rng.choice(AMINO_ACID_CODES)
     return code, AMINO_ACIDS[code]
 
 
@@ -87,12 +91,16 @@ def ask_num_questions() -> int:
         print("Please enter a positive integer.")
 
 
-def play_round(category: str, rng: random.Random | None = None) -> bool:
+def play_round(category: str, rng: random.Random | None = None, scheduler=None) -> bool:
     """
     Play a single round.
+    With a scheduler (see quiz_scheduler.py) it picks the amino acid and records the result.
     Returns True if the user was correct, False otherwise.
     """
-    code, props = get_random_amino_acid(rng)
+    if scheduler is not None:
+        code, props = scheduler.next_question()
+    else:
+        code, props = get_random_amino_acid(rng)
     name = props["name"]
     options = CATEGORY_OPTIONS[category]
 
@@ -101,7 +109,10 @@ def play_round(category: str, rng: random.Random | None = None) -> bool:
     print("Options:", ", ".join(options))
 
     user_answer = input("Your answer: ")
-    if check_answer(code, category, user_answer):
+    is_correct = check_answer(code, category, user_answer)
+    if scheduler is not None:
+        scheduler.record(code, is_correct)
+    if is_correct:
         print("✅ Correct!")
         return True
     else:
@@ -110,7 +121,10 @@ def play_round(category: str, rng: random.Random | None = None) -> bool:
         return False
 
 
-def main() -> None:
+def main(use_scheduler: bool = True) -> None:
+    # Imported here because quiz_scheduler imports this module
+    from quiz_scheduler import QuizScheduler, load_schedulers, save_schedulers
+
     print("Welcome to the Amino Acid Classification Quiz!\n")
     category = ask_category_from_user()
     num_questions = ask_num_questions()
@@ -118,11 +132,25 @@ def main() -> None:
     print(f"\nYou chose category: {category}")
     print(f"Number of questions: {num_questions}\n")
 
+    schedulers = {}
+    if use_scheduler:
+        try:
+            schedulers = load_schedulers()
+        except (OSError, ValueError) as e:
+            print(f"Could not load your previous progress ({e}), starting fresh.")
+        schedulers.setdefault(category, QuizScheduler(category))
+
     score = 0
     for _ in range(num_questions):
-        if play_round(category):
+        if play_round(category, scheduler=schedulers.get(category)):
             score += 1
 
+    if use_scheduler:
+        try:
+            save_schedulers(schedulers)
+        except OSError as e:
+            print(f"Could not save your progress: {e}")
+
     print(f"\nGame over! Your score: {score}/{num_questions}")
     if score == num_questions:
         print("Perfect! 🧬✨")
@@ -133,4 +161,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    main(use_scheduler="--random" not in sys.argv[1:])
@@ -0,0 +1,176 @@
+"""
+Profile every protein of a (large) FASTA file.
+
+Records are read one at a time, grouped into batches and profiled in worker
+processes. Only a few batches are in flight at once and results are written
+as soon as they are ready (in input order), so memory use does not grow with
+the size of the file.
+
+    python fasta_profile.py uniprot_sprot.fasta -o profiles.csv
+    python fasta_profile.py uniprot_sprot.fasta -o profiles.parquet --workers 8
+"""
+
+import csv
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import click
+import numpy as np
+
+from amino_acids_game import CATEGORY_OPTIONS
+from protein_properties import CATEGORY_CODES, COMPOSITION_COLUMNS, composition_table, encode, read_fasta
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Number of residues per category option, e.g. "charge_positive", "polarity_polar"
+CATEGORY_COLUMNS = tuple(
+    f"{category}_{option}" for category, options in CATEGORY_OPTIONS.items() for option in options
+)
+PROFILE_COLUMNS = ("id",) + COMPOSITION_COLUMNS + CATEGORY_COLUMNS
+
+DEFAULT_BATCH_SIZE = 2000
+
+
+def profile_batch(records) -> dict:
+    """Profile a list of (record_id, sequence) pairs; returns a dict of columns (PROFILE_COLUMNS)."""
+    ids = [record_id for record_id, _ in records]
+    sequences = [sequence for _, sequence in records]
+    profile = {"id": ids}
+    profile.update(composition_table(sequences))
+
+    lengths = np.array([len(sequence) for sequence in sequences], dtype=np.int64)
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+    residues = np.concatenate([encode(sequence) for sequence in sequences]) if sequences else np.empty(0, np.uint8)
+    for category, options in CATEGORY_OPTIONS.items():
+        codes = CATEGORY_CODES[category][residues]
+        for index, option in enumerate(options):
+            totals = np.concatenate(([0], np.cumsum(codes == index, dtype=np.int64)))
+            profile[f"{category}_{option}"] = totals[ends] - totals[starts]
+    return profile
+
+
+def iter_batches(records, batch_size=DEFAULT_BATCH_SIZE):
+    """Group an iterable of records into lists of up to batch_size records."""
+    records = iter(records)
+    while batch := list(islice(records, batch_size)):
+        yield batch
+
+
+def iter_profiles(records, batch_size=DEFAULT_BATCH_SIZE, workers=None):
+    """
+    Yield profile batches (see profile_batch) in input order.
+
+    With more than one worker, batches are profiled in a process pool with at
+    most 2 * workers batches submitted but not yet written.
+    """
+    batches = iter_batches(records, batch_size)
+    if workers == 1:
+        yield from map(profile_batch, batches)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        window = 2 * workers
+        pending = deque()
+        for batch in batches:
+            pending.append(pool.submit(profile_batch, batch))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+class CsvProfileWriter:
+    """Write profile batches to a text stream as CSV."""
+
+    def __init__(self, stream):
+        self.writer = csv.writer(stream)
+        self.writer.writerow(PROFILE_COLUMNS)
+
+    def write(self, profile):
+        columns = [profile[column] for column in PROFILE_COLUMNS]
+        for row in zip(*columns):
+            self.writer.writerow([f"{value:.4f}" if isinstance(value, float) else value for value in row])
+
+    def close(self):
+        pass
+
+
+class ParquetProfileWriter:
+    """Write profile batches to a Parquet file, one row group per batch."""
+
+    def __init__(self, path):
+        if not HAS_PYARROW:
+            raise RuntimeError("Parquet output needs pyarrow (pip install pyarrow)")
+        fields = [pa.field("id", pa.string())]
+        for column in PROFILE_COLUMNS[1:]:
+            fields.append(pa.field(column, pa.float64() if column == "polar_fraction" else pa.int64()))
+        self.schema = pa.schema(fields)
+        self.writer = pq.ParquetWriter(path, self.schema)
+
+    def write(self, profile):
+        self.writer.write_table(pa.table({column: profile[column] for column in PROFILE_COLUMNS}, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+def write_profiles(profiles, writer) -> int:
+    """Write profile batches with a writer; returns the number of proteins."""
+    total = 0
+    try:
+        for profile in profiles:
+            writer.write(profile)
+            total += len(profile["id"])
+    finally:
+        writer.close()
+    return total
+
+
+@click.command()
+@click.argument('fasta_file', type=click.File('r', encoding='ascii', errors='replace'))
+@click.option('--output', '-o', default='-',
+              help="Output file (default: standard output, CSV only).")
+@click.option('--format', 'output_format', type=click.Choice(['csv', 'parquet']),
+              help="Output format (default: from the output file extension, else csv).")
+@click.option('--workers', type=click.IntRange(min=1),
+              help="Worker processes (default: number of CPUs; 1 = no pool).")
+@click.option('--batch-size', type=click.IntRange(min=1), default=DEFAULT_BATCH_SIZE, show_default=True,
+              help="Proteins per batch sent to a worker.")
+def main(fasta_file, output, output_format, workers, batch_size):
+    """Write the charge, polarity and aromaticity profile of every protein in FASTA_FILE ('-' for stdin)."""
+    if output_format is None:
+        output_format = "parquet" if output.endswith(".parquet") else "csv"
+    if output_format == "parquet" and output == "-":
+        raise click.UsageError("Parquet output needs an output file (-o).")
+
+    try:
+        if output_format == "parquet":
+            writer = ParquetProfileWriter(output)
+            out = None
+        else:
+            out = sys.stdout if output == "-" else open(output, "w", newline="", encoding="utf-8")
+            writer = CsvProfileWriter(out)
+        try:
+            total = write_profiles(iter_profiles(read_fasta(fasta_file), batch_size, workers), writer)
+        finally:
+            if out is not None and out is not sys.stdout:
+                out.close()
+    except (RuntimeError, ValueError, OSError) as e:
+        click.echo(f"Error: {e}", err=True)
+        raise click.Abort()
+
+    click.echo(f"Profiled {total} proteins.", err=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+"""
+Amino acid properties for whole protein sequences.
+
+The properties from AMINO_ACIDS are stored in small NumPy tables indexed by
+the byte value of the one-letter code (upper or lower case), so a sequence is
+classified with one array lookup instead of one dict lookup per residue.
+Unknown letters (X, B, Z, U, *, ...) are marked as not valid.
+
+    composition("MKWVTFISLLFLFSSAYS")
+    composition_table(seq for _, seq in read_fasta("proteins.fasta"))
+    window_profile("MKKRDEEDLLAV", k=5, prop="charge")
+"""
+
+import os
+
+import numpy as np
+
+from amino_acids_game import AMINO_ACIDS, CATEGORY_OPTIONS
+
+CHARGE_VALUES = {"positive": 1, "negative": -1, "neutral": 0}
+
+COMPOSITION_COLUMNS = (
+    "length", "unknown", "positive", "negative", "net_charge",
+    "polar", "polar_fraction", "aromatic_count",
+)
+
+
+def _build_tables():
+    valid = np.zeros(256, dtype=bool)
+    charge = np.zeros(256, dtype=np.int8)
+    polar = np.zeros(256, dtype=bool)
+    aromatic = np.zeros(256, dtype=bool)
+    # Index of the property in CATEGORY_OPTIONS[category], -1 for unknown letters
+    codes = {category: np.full(256, -1, dtype=np.int8) for category in CATEGORY_OPTIONS}
+
+    for code, props in AMINO_ACIDS.items():
+        for byte in (ord(code.upper()), ord(code.lower())):
+            valid[byte] = True
+            charge[byte] = CHARGE_VALUES[props["charge"]]
+            polar[byte] = props["polarity"] == "polar"
+            aromatic[byte] = props["aromatic"] == "aromatic"
+            for category, options in CATEGORY_OPTIONS.items():
+                codes[category][byte] = options.index(props[category])
+    return valid, charge, polar, aromatic, codes
+
+
+VALID, CHARGE, POLAR, AROMATIC, CATEGORY_CODES = _build_tables()
+
+
+def encode(sequence) -> np.ndarray:
+    """Return the residues of a sequence (str or bytes) as a uint8 array of byte codes."""
+    if isinstance(sequence, str):
+        sequence = sequence.encode("ascii", errors="replace")
+    return np.frombuffer(sequence, dtype=np.uint8)
+
+
+def property_codes(sequence, category: str) -> np.ndarray:
+    """
+    Return the property of every residue as an index into CATEGORY_OPTIONS[category]
+    (e.g. 0 = positive for "charge"), -1 for unknown residues.
+    """
+    if category not in CATEGORY_OPTIONS:
+        raise ValueError(f"Unknown category: {category}")
+    return CATEGORY_CODES[category][encode(sequence)]
+
+
+def property_vectors(sequence) -> dict:
+    """Return per-residue arrays: valid, charge (+1/-1/0), polar and aromatic."""
+    residues = encode(sequence)
+    return {
+        "valid": VALID[residues],
+        "charge": CHARGE[residues],
+        "polar": POLAR[residues],
+        "aromatic": AROMATIC[residues],
+    }
+
+
+def composition_table(sequences) -> dict:
+    """
+    Composition statistics for many sequences at once.
+
+    All sequences are joined into one byte array and classified together; per
+    sequence totals come from prefix sums. Returns a dict of arrays (one value
+    per sequence) with the keys in COMPOSITION_COLUMNS. polar_fraction is the
+    share of polar residues among the known ones (NaN if there are none).
+    """
+    encoded = [encode(sequence) for sequence in sequences]
+    lengths = np.fromiter((len(residues) for residues in encoded), dtype=np.int64, count=len(encoded))
+    residues = np.concatenate(encoded) if encoded else np.empty(0, dtype=np.uint8)
+    ends = np.cumsum(lengths)
+    starts = ends - lengths
+
+    def per_sequence(values):
+        totals = np.concatenate(([0], np.cumsum(values, dtype=np.int64)))
+        return totals[ends] - totals[starts]
+
+    charge = CHARGE[residues]
+    known = per_sequence(VALID[residues])
+    positive = per_sequence(charge > 0)
+    negative = per_sequence(charge < 0)
+    polar = per_sequence(POLAR[residues])
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        polar_fraction = np.where(known > 0, polar / known, np.nan)
+
+    return {
+        "length": lengths,
+        "unknown": lengths - known,
+        "positive": positive,
+        "negative": negative,
+        "net_charge": positive - negative,
+        "polar": polar,
+        "polar_fraction": polar_fraction,
+        "aromatic_count": per_sequence(AROMATIC[residues]),
+    }
+
+
+def composition(sequence) -> dict:
+    """Composition statistics (see COMPOSITION_COLUMNS) for a single sequence."""
+    table = composition_table([sequence])
+    return {column: table[column][0].item() for column in COMPOSITION_COLUMNS}
+
+
+WINDOW_PROPERTIES = ("charge", "polar", "aromatic")
+
+
+def _window_sums(residues, lengths, k, prop):
+    """Sum of the property over every window of k residues, for sequences stored back to back."""
+    if prop not in WINDOW_PROPERTIES:
+        raise ValueError(f"Unknown property: {prop}")
+    if k < 1:
+        raise ValueError("Window size must be at least 1")
+    table = {"charge": CHARGE, "polar": POLAR, "aromatic": AROMATIC}[prop]
+    totals = np.concatenate(([0], np.cumsum(table[residues], dtype=np.int64)))
+
+    windows = np.maximum(lengths - k + 1, 0)
+    starts = np.cumsum(lengths) - lengths
+    # Position of every window start: starts[i], starts[i] + 1, ... for each sequence
+    offsets = np.arange(windows.sum()) - np.repeat(np.cumsum(windows) - windows, windows)
+    positions = np.repeat(starts, windows) + offsets
+    return totals[positions + k] - totals[positions], windows
+
+
+def window_profile(sequence, k: int, prop: str = "charge") -> np.ndarray:
+    """
+    Average of a property over every window of k residues (len(sequence) - k + 1 values).
+
+    prop is "charge" (net charge per residue), "polar" or "aromatic" (fraction of
+    residues). Unknown residues count as neutral, nonpolar and non-aromatic.
+    Uses prefix sums, so each window costs the same whatever k is.
+    """
+    residues = encode(sequence)
+    sums, _ = _window_sums(residues, np.array([len(residues)]), k, prop)
+    return sums / k
+
+
+def window_profiles(sequences, k: int, prop: str = "charge") -> list:
+    """window_profile for many sequences at once; returns one array per sequence."""
+    encoded = [encode(sequence) for sequence in sequences]
+    if not encoded:
+        return []
+    lengths = np.array([len(residues) for residues in encoded], dtype=np.int64)
+    residues = np.concatenate(encoded)
+    sums, windows = _window_sums(residues, lengths, k, prop)
+    return np.split(sums / k, np.cumsum(windows)[:-1])
+
+
+def find_patches(profile, k: int, threshold: float) -> list:
+    """
+    Return the (start, end) residue ranges (end exclusive) covered by windows of a
+    window_profile whose value is at least threshold; overlapping windows are merged.
+    For negative patches pass the negated profile, e.g. find_patches(-charge, k, 0.6).
+    """
+    above = np.asarray(profile) >= threshold
+    edges = np.diff(np.concatenate(([0], above.astype(np.int8), [0])))
+    first = np.flatnonzero(edges == 1)
+    last = np.flatnonzero(edges == -1) - 1
+    return [(int(start), int(end) + k) for start, end in zip(first, last)]
+
+
+def read_fasta(source):
+    """
+    Yield (record_id, sequence) pairs from a FASTA file path (str or os.PathLike)
+    or open text file, one record at a time. The id is the first word of the header line.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding="ascii", errors="replace") as stream:
+            yield from read_fasta(stream)
+        return
+
+    record_id = None
+    parts = []
+    for line in source:
+        line = line.strip()
+        if not line or line.startswith(";"):
+            continue
+        if line.startswith(">"):
+            if record_id is not None:
+                yield record_id, "".join(parts)
+            header = line[1:].split()
+            record_id = header[0] if header else ""
+            parts = []
+        elif record_id is None:
+            raise ValueError("FASTA input must start with a '>' header line")
+        else:
+            parts.append(line)
+    if record_id is not None:
+        yield record_id, "".join(parts)
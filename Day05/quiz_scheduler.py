@@ -0,0 +1,155 @@
+"""
+Spaced repetition for the amino acid quiz.
+
+Every amino acid has a review interval counted in questions (a logical
+clock). A correct answer doubles the interval, a wrong one resets it to 1,
+so difficult amino acids come back soon and known ones less often. The next
+question is the amino acid that is due first (ties: higher error rate
+first), taken from a heap in O(log n).
+
+    scheduler = QuizScheduler("charge")
+    code, props = scheduler.next_question()
+    scheduler.answer(code, "positive")
+
+The learner's state is saved as compact JSON (see save_schedulers).
+"""
+
+import heapq
+import json
+import os
+import random
+from pathlib import Path
+
+from amino_acids_game import AMINO_ACID_CODES, AMINO_ACIDS, CATEGORY_OPTIONS, check_answer
+
+DEFAULT_STATE_PATH = Path.home() / ".amino_acids_quiz.json"
+MAX_INTERVAL = 64
+STATE_VERSION = 1
+
+
+class QuizScheduler:
+    """Question order for one learner and one category."""
+
+    def __init__(self, category: str, rng: random.Random | None = None):
+        if category not in CATEGORY_OPTIONS:
+            raise ValueError(f"Unknown category: {category}")
+        self.category = category
+        self.clock = 0
+        # New amino acids come in a random order, one more becomes due after every question
+        order = list(AMINO_ACID_CODES)
+        (rng or random).shuffle(order)
+        self.order = {code: i for i, code in enumerate(order)}
+        # code -> [interval, due, attempts, wrong]
+        self.cards = {code: [1, self.order[code], 0, 0] for code in AMINO_ACID_CODES}
+        self._rebuild_heap()
+
+    def _entry(self, code):
+        interval, due, attempts, wrong = self.cards[code]
+        error_rate = wrong / attempts if attempts else 0.0
+        return (due, -error_rate, self.order[code], code)
+
+    def _rebuild_heap(self):
+        self._current = {code: self._entry(code) for code in self.cards}
+        self._heap = list(self._current.values())
+        heapq.heapify(self._heap)
+
+    def next_question(self) -> tuple[str, dict]:
+        """Return the (code, properties_dict) pair to ask next."""
+        # Entries of amino acids answered since they were pushed are out of date
+        while self._heap[0] != self._current[self._heap[0][3]]:
+            heapq.heappop(self._heap)
+        code = self._heap[0][3]
+        return code, AMINO_ACIDS[code]
+
+    def record(self, code: str, correct: bool) -> None:
+        """Record the result of a question and schedule the amino acid again."""
+        code = code.upper()
+        if code not in self.cards:
+            raise ValueError(f"Unknown amino acid code: {code}")
+        card = self.cards[code]
+        self.clock += 1
+        card[0] = min(card[0] * 2, MAX_INTERVAL) if correct else 1
+        card[1] = self.clock + card[0]
+        card[2] += 1
+        card[3] += 0 if correct else 1
+        entry = self._entry(code)
+        self._current[code] = entry
+        heapq.heappush(self._heap, entry)
+        # Drop out-of-date entries now and then so the heap stays small
+        if len(self._heap) > 4 * len(self.cards):
+            self._rebuild_heap()
+
+    def answer(self, code: str, user_answer: str) -> bool:
+        """Check an answer for this scheduler's category, record it and return True if correct."""
+        correct = check_answer(code, self.category, user_answer)
+        self.record(code, correct)
+        return correct
+
+    def error_rate(self, code: str) -> float:
+        _, _, attempts, wrong = self.cards[code.upper()]
+        return wrong / attempts if attempts else 0.0
+
+    def to_dict(self) -> dict:
+        """State of the answered amino acids, e.g. {"clock": 3, "cards": {"K": [2, 3, 1, 0]}}."""
+        cards = {code: card for code, card in self.cards.items() if card[2] > 0}
+        return {"clock": self.clock, "cards": cards}
+
+    @classmethod
+    def from_dict(cls, category: str, data: dict, rng: random.Random | None = None) -> "QuizScheduler":
+        """Restore a scheduler from to_dict() output; raises ValueError if data has the wrong structure."""
+        if not isinstance(data, dict):
+            raise ValueError(f"Quiz state for {category} must be an object")
+        cards = data.get("cards", {})
+        if not isinstance(cards, dict):
+            raise ValueError(f"Quiz state cards for {category} must be an object")
+        scheduler = cls(category, rng)
+        scheduler.clock = _to_int(data.get("clock", 0), f"clock of {category}")
+        for card in scheduler.cards.values():
+            card[1] += scheduler.clock
+        for code, card in cards.items():
+            if not isinstance(card, list) or len(card) != 4:
+                raise ValueError(f"Quiz state card {code} of {category} must be a list of 4 numbers")
+            if code in scheduler.cards:
+                scheduler.cards[code] = [_to_int(value, f"card {code} of {category}") for value in card]
+        scheduler._rebuild_heap()
+        return scheduler
+
+
+def _to_int(value, name):
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"Quiz state {name} must be a number, got {value!r}")
+    return int(value)
+
+
+def load_schedulers(path=DEFAULT_STATE_PATH, rng: random.Random | None = None) -> dict:
+    """
+    Load the saved schedulers (category -> QuizScheduler); missing file -> empty dict.
+    Raises ValueError if the file is not a quiz state file.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return {}
+    if not isinstance(data, dict) or data.get("version") != STATE_VERSION:
+        raise ValueError(f"Unsupported quiz state file: {path}")
+    categories = data.get("categories", {})
+    if not isinstance(categories, dict):
+        raise ValueError(f"Invalid quiz state file (categories must be an object): {path}")
+    return {
+        category: QuizScheduler.from_dict(category, state, rng)
+        for category, state in categories.items()
+        if category in CATEGORY_OPTIONS
+    }
+
+
+def save_schedulers(schedulers: dict, path=DEFAULT_STATE_PATH) -> None:
+    """Save the schedulers as compact JSON (written to a temporary file first)."""
+    data = {
+        "version": STATE_VERSION,
+        "categories": {category: scheduler.to_dict() for category, scheduler in schedulers.items()},
+    }
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, separators=(",", ":"))
+    os.replace(tmp_path, path)
@@ -0,0 +1,166 @@
+"""
+Quiz server: many players at once over TCP, in one process.
+
+Every connection gets its own QuizSession (with its own seeded random
+generator) and plays the same game as amino_acids_game.py, one line of text
+per answer. Connections are handled with asyncio, so a whole class can play
+at the same time without a thread per player.
+
+    python quiz_server.py --port 5005
+    nc localhost 5005
+"""
+
+import asyncio
+import random
+
+import click
+
+from amino_acids_game import CATEGORY_OPTIONS, check_answer, get_property, get_random_amino_acid
+
+CATEGORIES = tuple(CATEGORY_OPTIONS)
+MAX_QUESTIONS = 100
+MAX_LINE_LENGTH = 1024
+
+# Session steps
+CHOOSE_CATEGORY, CHOOSE_COUNT, ANSWER, DONE = range(4)
+
+
+class QuizSession:
+    """State of one player's game; handle_line turns one input line into reply lines."""
+
+    __slots__ = ("rng", "step", "category", "remaining", "asked", "score", "code")
+
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+        self.step = CHOOSE_CATEGORY
+        self.category = None
+        self.remaining = 0
+        self.asked = 0
+        self.score = 0
+        self.code = None
+
+    @property
+    def done(self) -> bool:
+        return self.step == DONE
+
+    def start(self) -> list[str]:
+        lines = ["Welcome to the Amino Acid Classification Quiz!", "Choose a category to practice:"]
+        lines += [f"{i}. {category}" for i, category in enumerate(CATEGORIES, start=1)]
+        lines.append("Enter number (or 'q' to quit):")
+        return lines
+
+    def handle_line(self, line: str) -> list[str]:
+        """Process one line from the player and return the reply lines."""
+        text = line.strip()
+        if self.step == DONE:
+            return []
+        if text.lower() in ("q", "quit"):
+            self.step = DONE
+            return ["Goodbye!"]
+
+        if self.step == CHOOSE_CATEGORY:
+            category = self._parse_category(text)
+            if category is None:
+                return ["Invalid choice, please try again."]
+            self.category = category
+            self.step = CHOOSE_COUNT
+            return [f"You chose category: {category}", "How many questions would you like? (e.g. 5, 10):"]
+
+        if self.step == CHOOSE_COUNT:
+            try:
+                count = int(text)
+            except ValueError:
+                count = 0
+            if not 0 < count <= MAX_QUESTIONS:
+                return [f"Please enter a number from 1 to {MAX_QUESTIONS}."]
+            self.remaining = count
+            self.step = ANSWER
+            return self._ask()
+
+        # ANSWER
+        if check_answer(self.code, self.category, text):
+            self.score += 1
+            lines = ["Correct!"]
+        else:
+            lines = [f"Incorrect. The correct answer was: {get_property(self.code, self.category)}."]
+        self.remaining -= 1
+        if self.remaining > 0:
+            return lines + self._ask()
+        self.step = DONE
+        return lines + [f"Game over! Your score: {self.score}/{self.asked}"]
+
+    def _parse_category(self, text):
+        if text.lower() in CATEGORY_OPTIONS:
+            return text.lower()
+        if text.isdigit() and 1 <= int(text) <= len(CATEGORIES):
+            return CATEGORIES[int(text) - 1]
+        return None
+
+    def _ask(self):
+        self.code, props = get_random_amino_acid(self.rng)
+        self.asked += 1
+        return [
+            f"Amino acid: {props['name']} ({self.code})",
+            f"Category: {self.category}",
+            "Options: " + ", ".join(CATEGORY_OPTIONS[self.category]),
+            "Your answer:",
+        ]
+
+
+class QuizServer:
+    """Serves a QuizSession per TCP connection. Seeds are seed, seed + 1, ... if seed is given."""
+
+    def __init__(self, seed=None, idle_timeout=600):
+        self.seed = seed
+        self.idle_timeout = idle_timeout
+        self.sessions_started = 0
+
+    def new_session(self) -> QuizSession:
+        seed = None if self.seed is None else self.seed + self.sessions_started
+        self.sessions_started += 1
+        return QuizSession(seed)
+
+    async def handle_client(self, reader, writer):
+        session = self.new_session()
+        try:
+            await self._send(writer, session.start())
+            while not session.done:
+                line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                if not line:
+                    break
+                await self._send(writer, session.handle_line(line.decode("utf-8", errors="replace")))
+        except (asyncio.TimeoutError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _send(self, writer, lines):
+        writer.write("".join(line + "\n" for line in lines).encode("utf-8"))
+        await writer.drain()
+
+    async def start(self, host="127.0.0.1", port=0):
+        return await asyncio.start_server(self.handle_client, host, port, limit=MAX_LINE_LENGTH)
+
+
+async def serve(host, port, seed=None):
+    server = await QuizServer(seed).start(host, port)
+    address = server.sockets[0].getsockname()
+    click.echo(f"Quiz server listening on {address[0]}:{address[1]}", err=True)
+    async with server:
+        await server.serve_forever()
+
+
+@click.command()
+@click.option('--host', default="127.0.0.1", show_default=True, help="Address to listen on.")
+@click.option('--port', type=click.IntRange(0, 65535), default=5005, show_default=True, help="TCP port.")
+@click.option('--seed', type=int, help="Seed for reproducible questions (session n uses seed + n).")
+def main(host, port, seed):
+    """Run the amino acid quiz for many players over TCP."""
+    try:
+        asyncio.run(serve(host, port, seed))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
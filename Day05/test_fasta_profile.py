@@ -0,0 +1,46 @@
+import csv
+
+from click.testing import CliRunner
+
+import fasta_profile as fp
+
+FASTA = ">P1 first\nKKDW\n>P2\nAX\n>P3\nSSEE\nY\n"
+
+
+def test_profile_batch():
+    profile = fp.profile_batch([("P1", "KKDW"), ("P2", "AX")])
+    assert profile["id"] == ["P1", "P2"]
+    assert profile["net_charge"].tolist() == [1, 0]
+    assert profile["charge_positive"].tolist() == [2, 0]
+    assert profile["charge_neutral"].tolist() == [1, 1]
+    assert profile["aromatic_aromatic"].tolist() == [1, 0]
+    assert profile["unknown"].tolist() == [0, 1]
+
+
+def test_iter_profiles_keeps_order_with_pool():
+    records = [(f"P{i}", "K" * i) for i in range(25)]
+    profiles = list(fp.iter_profiles(records, batch_size=3, workers=2))
+    ids = [record_id for profile in profiles for record_id in profile["id"]]
+    assert ids == [f"P{i}" for i in range(25)]
+    lengths = [n for profile in profiles for n in profile["length"].tolist()]
+    assert lengths == list(range(25))
+
+
+def test_cli_csv(tmp_path):
+    fasta = tmp_path / "proteins.fasta"
+    fasta.write_text(FASTA)
+    output = tmp_path / "profiles.csv"
+    result = CliRunner().invoke(fp.main, [str(fasta), "-o", str(output), "--workers", "1", "--batch-size", "2"])
+    assert result.exit_code == 0, result.output
+
+    with open(output, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["id"] for row in rows] == ["P1", "P2", "P3"]
+    assert list(rows[0].keys()) == list(fp.PROFILE_COLUMNS)
+    assert rows[2]["length"] == "5"
+    assert rows[2]["negative"] == "2"
+
+
+def test_cli_parquet_needs_file():
+    result = CliRunner().invoke(fp.main, ["-", "--format", "parquet"], input=FASTA)
+    assert result.exit_code != 0
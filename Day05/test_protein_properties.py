@@ -0,0 +1,115 @@
+import io
+import math
+
+import numpy as np
+import pytest
+
+import amino_acids_game as game
+import protein_properties as pp
+
+
+def test_tables_match_amino_acids():
+    for code in game.AMINO_ACIDS:
+        for category, options in game.CATEGORY_OPTIONS.items():
+            expected = game.get_property(code, category)
+            assert options[pp.property_codes(code, category)[0]] == expected
+            assert options[pp.property_codes(code.lower(), category)[0]] == expected
+
+
+def test_property_vectors():
+    vectors = pp.property_vectors("KDSFX")
+    assert vectors["valid"].tolist() == [True, True, True, True, False]
+    assert vectors["charge"].tolist() == [1, -1, 0, 0, 0]
+    assert vectors["polar"].tolist() == [True, True, True, False, False]
+    assert vectors["aromatic"].tolist() == [False, False, False, True, False]
+
+
+def test_property_codes_unknown_residue_and_category():
+    assert pp.property_codes("X", "charge").tolist() == [-1]
+    with pytest.raises(ValueError):
+        pp.property_codes("A", "size")
+
+
+def test_composition():
+    stats = pp.composition("KKDEWYAX")
+    assert stats["length"] == 8
+    assert stats["unknown"] == 1
+    assert stats["positive"] == 2
+    assert stats["negative"] == 2
+    assert stats["net_charge"] == 0
+    assert stats["aromatic_count"] == 2
+    # K, K, D, E, Y are polar out of 7 known residues
+    assert stats["polar_fraction"] == pytest.approx(5 / 7)
+
+
+def test_composition_table_matches_single_sequences():
+    sequences = ["MKRH", "", "DDEEW", "xyz", b"FFA"]
+    table = pp.composition_table(sequences)
+    assert table["length"].tolist() == [4, 0, 5, 3, 3]
+    for i, sequence in enumerate(sequences):
+        single = pp.composition(sequence)
+        for column in pp.COMPOSITION_COLUMNS:
+            if column == "polar_fraction" and math.isnan(single[column]):
+                assert np.isnan(table[column][i])
+            else:
+                assert table[column][i] == single[column]
+
+
+def test_composition_table_empty():
+    table = pp.composition_table([])
+    assert all(len(table[column]) == 0 for column in pp.COMPOSITION_COLUMNS)
+
+
+def test_read_fasta():
+    text = ">sp|P1|ONE first protein\nMKV\nLLA\n\n>P2\nDE\n>P3 empty\n"
+    records = list(pp.read_fasta(io.StringIO(text)))
+    assert records == [("sp|P1|ONE", "MKVLLA"), ("P2", "DE"), ("P3", "")]
+
+
+def test_read_fasta_from_path(tmp_path):
+    path = tmp_path / "proteins.fasta"
+    path.write_text(">P1\nMKV\n>P2\nDE\n", encoding="ascii")
+    expected = [("P1", "MKV"), ("P2", "DE")]
+    assert list(pp.read_fasta(path)) == expected
+    assert list(pp.read_fasta(str(path))) == expected
+
+
+def test_read_fasta_requires_header():
+    with pytest.raises(ValueError):
+        list(pp.read_fasta(io.StringIO("MKV\n")))
+
+
+def naive_window_profile(sequence, k, prop):
+    values = pp.property_vectors(sequence)[prop].astype(float)
+    return np.array([values[i:i + k].mean() for i in range(len(sequence) - k + 1)])
+
+
+def test_window_profile_matches_naive():
+    sequence = "MKKRDEEDLLAVWYXSTKR"
+    for prop in pp.WINDOW_PROPERTIES:
+        for k in (1, 3, 7, len(sequence)):
+            assert np.allclose(pp.window_profile(sequence, k, prop), naive_window_profile(sequence, k, prop))
+
+
+def test_window_profile_short_sequence_and_bad_input():
+    assert len(pp.window_profile("KK", 5)) == 0
+    with pytest.raises(ValueError):
+        pp.window_profile("KK", 0)
+    with pytest.raises(ValueError):
+        pp.window_profile("KK", 1, "size")
+
+
+def test_window_profiles_batch():
+    sequences = ["KKKAAA", "", "DE", "SSTTAA"]
+    profiles = pp.window_profiles(sequences, 3, "polar")
+    assert len(profiles) == 4
+    for sequence, profile in zip(sequences, profiles):
+        assert np.allclose(profile, naive_window_profile(sequence, 3, "polar"))
+
+
+def test_find_patches():
+    sequence = "AAKKKKAAAADDDDAA"
+    charge = pp.window_profile(sequence, 3, "charge")
+    assert pp.find_patches(charge, 3, 1.0) == [(2, 6)]
+    assert pp.find_patches(-charge, 3, 1.0) == [(10, 14)]
+    assert pp.find_patches(charge, 3, 2.0) == []
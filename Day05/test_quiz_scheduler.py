@@ -0,0 +1,96 @@
+import random
+
+import pytest
+
+import amino_acids_game as game
+from quiz_scheduler import QuizScheduler, load_schedulers, save_schedulers
+
+
+def test_random_amino_acid_uses_code_tuple():
+    assert game.AMINO_ACID_CODES == tuple(game.AMINO_ACIDS)
+    code, props = game.get_random_amino_acid(random.Random(0))
+    assert props is game.AMINO_ACIDS[code]
+
+
+def test_new_scheduler_introduces_every_amino_acid():
+    scheduler = QuizScheduler("charge", random.Random(1))
+    asked = set()
+    for _ in range(2 * len(game.AMINO_ACIDS)):
+        code, _ = scheduler.next_question()
+        asked.add(code)
+        scheduler.record(code, True)
+    assert asked == set(game.AMINO_ACIDS)
+
+
+def test_wrong_answer_comes_back_soon_and_correct_doubles_interval():
+    scheduler = QuizScheduler("charge", random.Random(2))
+    code, _ = scheduler.next_question()
+    assert not scheduler.answer(code, "wrong answer")
+    assert scheduler.cards[code][0] == 1
+    assert scheduler.error_rate(code) == 1.0
+
+    # Due again after one question
+    other, _ = scheduler.next_question()
+    scheduler.record(other, True)
+    assert scheduler.next_question()[0] == code
+
+    scheduler.record(code, True)
+    scheduler.record(code, True)
+    assert scheduler.cards[code][0] == 4
+
+
+def test_due_ties_prefer_higher_error_rate():
+    scheduler = QuizScheduler("polarity", random.Random(3))
+    scheduler.cards["A"] = [1, 0, 4, 1]
+    scheduler.cards["K"] = [1, 0, 4, 3]
+    for code in scheduler.cards:
+        if code not in ("A", "K"):
+            scheduler.cards[code][1] = 100
+    scheduler._rebuild_heap()
+    assert scheduler.next_question()[0] == "K"
+
+
+def test_unknown_input():
+    with pytest.raises(ValueError):
+        QuizScheduler("size")
+    with pytest.raises(ValueError):
+        QuizScheduler("charge").record("Z", True)
+
+
+def test_save_and_load(tmp_path):
+    path = tmp_path / "state.json"
+    scheduler = QuizScheduler("aromatic", random.Random(4))
+    scheduler.record("W", False)
+    scheduler.record("F", True)
+    save_schedulers({"aromatic": scheduler}, path)
+
+    text = path.read_text()
+    assert " " not in text
+    loaded = load_schedulers(path)["aromatic"]
+    assert loaded.clock == 2
+    assert loaded.cards["W"] == scheduler.cards["W"]
+    assert loaded.cards["F"] == scheduler.cards["F"]
+    assert loaded.cards["A"][2:] == [0, 0]
+
+
+def test_load_missing_and_bad_files(tmp_path):
+    assert load_schedulers(tmp_path / "missing.json") == {}
+    bad = tmp_path / "bad.json"
+    bad.write_text('{"version": 99}')
+    with pytest.raises(ValueError):
+        load_schedulers(bad)
+
+
+@pytest.mark.parametrize("text", [
+    '{"version": 1, "categories": {"charge": {"cards": {"K": 5}}}}',
+    '{"version": 1, "categories": []}',
+    '{"version": 1, "categories": {"charge": []}}',
+    '{"version": 1, "categories": {"charge": {"cards": []}}}',
+    '{"version": 1, "categories": {"charge": {"clock": "x"}}}',
+    '{"version": 1, "categories": {"charge": {"cards": {"K": [1, 2, null, 0]}}}}',
+])
+def test_load_wrong_structure_raises_value_error(tmp_path, text):
+    path = tmp_path / "state.json"
+    path.write_text(text)
+    with pytest.raises(ValueError):
+        load_schedulers(path)
@@ -0,0 +1,75 @@
+import asyncio
+
+import amino_acids_game as game
+from quiz_server import MAX_QUESTIONS, QuizServer, QuizSession
+
+
+def play(session, answer_correctly):
+    """Answer every question of a started game, correctly or not."""
+    lines = []
+    while not session.done:
+        correct = game.get_property(session.code, session.category)
+        lines = session.handle_line(correct if answer_correctly else "wrong")
+    return lines
+
+
+def test_session_full_game():
+    session = QuizSession(seed=1)
+    assert "1. charge" in session.start()
+    assert session.handle_line("1")[0] == "You chose category: charge"
+    lines = session.handle_line("3")
+    assert lines[0].startswith("Amino acid:")
+    assert play(session, True)[-1] == "Game over! Your score: 3/3"
+
+
+def test_session_wrong_answers_and_category_by_name():
+    session = QuizSession(seed=2)
+    session.handle_line("Polarity")
+    session.handle_line("2")
+    lines = play(session, False)
+    assert lines[0].startswith("Incorrect.")
+    assert lines[-1] == "Game over! Your score: 0/2"
+
+
+def test_session_invalid_input_and_quit():
+    session = QuizSession(seed=3)
+    assert session.handle_line("9") == ["Invalid choice, please try again."]
+    session.handle_line("aromatic")
+    assert session.handle_line("abc")[0].startswith("Please enter a number")
+    assert session.handle_line(str(MAX_QUESTIONS + 1))[0].startswith("Please enter a number")
+    assert session.handle_line("q") == ["Goodbye!"]
+    assert session.done
+
+
+def test_same_seed_same_questions():
+    codes = []
+    for _ in range(2):
+        session = QuizSession(seed=42)
+        session.handle_line("1")
+        session.handle_line("5")
+        asked = []
+        while not session.done:
+            asked.append(session.code)
+            session.handle_line("neutral")
+        codes.append(asked)
+    assert codes[0] == codes[1]
+
+
+def test_server_handles_concurrent_clients():
+    async def client(port):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"1\n1\nneutral\n")
+        await writer.drain()
+        data = await reader.read()
+        writer.close()
+        return data.decode()
+
+    async def run():
+        server = await QuizServer(seed=0).start()
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await asyncio.gather(*(client(port) for _ in range(20)))
+
+    outputs = asyncio.run(run())
+    assert len(outputs) == 20
+    assert all("Game over! Your score:" in output for output in outputs)
@@ -0,0 +1,99 @@
+import pandas as pd
+import pytest
+from click.testing import CliRunner
+
+import wine_charts
+
+REVIEWS = (
+    "country,province,variety,points,price\n"
+    "US,California,Pinot Noir,91,40\n"
+    "US,California,Pinot Noir,87,20\n"
+    "US,Oregon,Pinot Noir,93,60\n"
+    "US,Oregon,Chardonnay,84,\n"
+    "France,Bordeaux,Merlot,89,25\n"
+    "France,Bordeaux,Merlot,95,100\n"
+    "France,Burgundy,Chardonnay,90,0\n"
+    "Italy,Tuscany,Sangiovese,88,30\n"
+    ",,,85,\n"
+)
+TOP_N = {"top_n_countries": 2, "top_n_provinces": 3, "top_n_varieties": 2, "top_n_countries_price": 2}
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "reviews.csv"
+    path.write_text(REVIEWS, encoding="utf-8")
+    return path
+
+
+def read_chart_csv(out_dir, index, **kwargs):
+    return pd.read_csv(out_dir / f"{wine_charts.CHART_NAMES[index]}.csv", **kwargs)
+
+
+def check_chart_csvs(out_dir):
+    bands = read_chart_csv(out_dir, 0, index_col=0)
+    assert bands.index.tolist() == ["France", "US"]
+    assert bands.loc["US"].tolist() == [1, 1, 2, 0]
+    assert bands.loc["France"].tolist() == [0, 1, 1, 1]
+
+    points = read_chart_csv(out_dir, 1, index_col=0)["count"]
+    assert points.to_dict() == {84: 1, 85: 1, 87: 1, 88: 1, 89: 1, 90: 1, 91: 1, 93: 1, 95: 1}
+
+    province_points = read_chart_csv(out_dir, 2)
+    assert province_points.columns.tolist() == ["province", "points", "count"]
+    assert province_points.groupby("province")["count"].sum().to_dict() == {"Bordeaux": 2, "California": 2,
+                                                                              "Oregon": 2}
+
+    variety = read_chart_csv(out_dir, 3, index_col=0)
+    assert variety.index.tolist() == ["Chardonnay", "Pinot Noir"]
+    assert variety["count"].tolist() == [2, 3]
+    assert variety["mean"].tolist() == pytest.approx([87.0, 271 / 3])
+
+    prices = read_chart_csv(out_dir, 4)
+    assert prices.columns.tolist() == ["country", "province_avg_price"]
+    # France: Bordeaux only (Burgundy has no valid price); US: California 30, Oregon 60
+    assert prices.groupby("country")["province_avg_price"].apply(sorted).to_dict() == {
+        "France": [62.5], "US": [30.0, 60.0]
+    }
+
+
+def test_write_chart_csvs(csv_path, tmp_path):
+    data = wine_charts.chart_data(wine_charts.load_or_build_cube(csv_path), **TOP_N)
+    out_dir = tmp_path / "charts"
+    out_dir.mkdir()
+    paths = wine_charts.write_chart_csvs(data, out_dir)
+    assert [p.name for p in paths] == [f"{name}.csv" for name in wine_charts.CHART_NAMES]
+    check_chart_csvs(out_dir)
+
+
+def test_export_charts(csv_path, tmp_path):
+    pytest.importorskip("matplotlib")
+    out_dir = tmp_path / "charts"
+    paths = wine_charts.export_charts(csv_path, out_dir, formats=("png", "svg"), workers=1, **TOP_N)
+
+    expected = {f"{name}.{ext}" for name in wine_charts.CHART_NAMES for ext in ("csv", "png", "svg")}
+    assert {p.name for p in paths} == expected
+    assert {p.name for p in out_dir.iterdir()} == expected
+    for name in wine_charts.CHART_NAMES:
+        assert (out_dir / f"{name}.png").read_bytes().startswith(b"\x89PNG")
+        assert "<svg" in (out_dir / f"{name}.svg").read_text(encoding="utf-8")
+    check_chart_csvs(out_dir)
+
+
+def test_export_charts_unknown_format(csv_path, tmp_path):
+    with pytest.raises(ValueError):
+        wine_charts.export_charts(csv_path, tmp_path / "charts", formats=("gif",))
+    assert not (tmp_path / "charts").exists()
+
+
+def test_cli(csv_path, tmp_path):
+    pytest.importorskip("matplotlib")
+    out_dir = tmp_path / "charts"
+    result = CliRunner().invoke(wine_charts.main, [
+        str(csv_path), "--out", str(out_dir), "--workers", "1",
+        "--top-n-countries", "2", "--top-n-provinces", "3", "--top-n-varieties", "2", "--top-n-countries-price", "2",
+    ])
+    assert result.exit_code == 0, result.output
+    assert result.output.count("Saved:") == 10
+    assert sorted(p.suffix for p in out_dir.iterdir()) == [".csv"] * 5 + [".png"] * 5
+    check_chart_csvs(out_dir)
@@ -0,0 +1,234 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import wine_chunked
+import wine_cube
+import wine_data
+
+TOP_N = {"top_n_countries": 4, "top_n_provinces": 5, "top_n_varieties": 4, "top_n_countries_price": 3}
+CHUNK_SIZE = 97
+
+
+def make_reviews(n=1500, seed=7, missing_points=True):
+    """Random reviews with missing values, "Unknown" categories, zero prices and distinct top-N counts."""
+    rng = np.random.default_rng(seed)
+    countries = ["US", "France", "Italy", "Spain", "Chile", "Unknown", None]
+    country = rng.choice(len(countries), size=n, p=[0.3, 0.22, 0.16, 0.12, 0.09, 0.06, 0.05])
+    province_number = rng.integers(0, 3, size=n)
+    rows = {
+        "country": [countries[c] for c in country],
+        "province": [None if rng.random() < 0.03 else f"{countries[c] or 'X'}-{p}"
+                     for c, p in zip(country, province_number)],
+        "variety": rng.choice(["Pinot Noir", "Merlot", "Syrah", "Riesling", "Malbec", "Unknown", None],
+                              size=n, p=[0.3, 0.22, 0.16, 0.12, 0.1, 0.05, 0.05]),
+        "points": rng.integers(80, 101, size=n).astype(float),
+        "price": np.round(rng.lognormal(3.3, 0.7, size=n), 2),
+    }
+    df = pd.DataFrame(rows)
+    if missing_points:
+        df.loc[rng.random(n) < 0.04, "points"] = np.nan
+    df.loc[rng.random(n) < 0.08, "price"] = np.nan
+    df.loc[rng.random(n) < 0.02, "price"] = 0.0
+    return df
+
+
+@pytest.fixture(scope="module", params=[True, False], ids=["missing_points", "complete_points"])
+def csv_path(request, tmp_path_factory):
+    path = tmp_path_factory.mktemp("wine") / "reviews.csv"
+    make_reviews(missing_points=request.param).to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture(scope="module")
+def wine_df(csv_path):
+    df = wine_data.load_wine_data(csv_path, use_cache=False)
+    # Ties around the top-N cut or in the ranking would make the order ambiguous
+    with_points = df[df["points"].notna()]
+    priced = df[(df["price"] > 0) & (df["country"] != "Unknown")]
+    for counts, n in [
+        (with_points["country"].value_counts(), TOP_N["top_n_countries"]),
+        (df["province"].value_counts(), TOP_N["top_n_provinces"]),
+        (with_points["variety"].value_counts(), TOP_N["top_n_varieties"]),
+        (priced["country"].value_counts(), TOP_N["top_n_countries_price"]),
+    ]:
+        assert counts.head(n + 1).is_unique, counts
+    return df
+
+
+def notebook_charts(wine_df, top_n_countries, top_n_provinces, top_n_varieties, top_n_countries_price):
+    """The chart data as computed in wine_analysis.ipynb on the whole table."""
+    # Plot 1
+    df_with_points = wine_df.dropna(subset=["country", "points"]).copy()
+    top_countries = df_with_points["country"].value_counts().head(top_n_countries).index
+    df_with_points["rating_band"] = pd.cut(
+        df_with_points["points"], bins=wine_chunked.RATING_BINS, labels=wine_chunked.RATING_LABELS,
+        include_lowest=True,
+    )
+    top_country_df = df_with_points[df_with_points["country"].isin(top_countries)]
+    band_counts = (
+        top_country_df.assign(country=top_country_df["country"].cat.remove_unused_categories())
+        .groupby(["country", "rating_band"], observed=False)
+        .size()
+        .unstack(fill_value=0)
+    )
+    band_counts = band_counts.loc[band_counts.sum(axis=1).sort_values().index]
+
+    # Plot 2
+    points_counts = wine_df["points"].dropna().astype(int).value_counts().sort_index()
+
+    # Plot 3
+    top_provinces = wine_df["province"].value_counts().head(top_n_provinces).index.tolist()
+    province_data = [wine_df.loc[wine_df["province"] == p, "points"].dropna().values for p in top_provinces]
+
+    # Plot 4
+    variety_stats = (
+        wine_df.dropna(subset=["variety", "points"])
+        .groupby("variety", observed=True)["points"]
+        .agg(["count", "mean", "std"])
+        .sort_values("count", ascending=False)
+        .head(top_n_varieties)
+        .sort_values("mean")
+    )
+
+    # Plot 5
+    df_with_price = wine_df.dropna(subset=["price"])
+    df_with_price = df_with_price[df_with_price["price"] > 0]
+    top_countries_price = (
+        df_with_price[df_with_price["country"] != "Unknown"]["country"].value_counts().head(top_n_countries_price).index
+    )
+    province_avg_prices = (
+        df_with_price[df_with_price["country"].isin(top_countries_price)]
+        .groupby(["country", "province"], observed=True)["price"]
+        .mean()
+        .reset_index(name="avg_price")
+    )
+    price_data = [province_avg_prices.loc[province_avg_prices["country"] == c, "avg_price"].values
+                  for c in top_countries_price]
+    medians = [np.median(v) if len(v) > 0 else np.nan for v in price_data]
+    order = np.argsort(medians)
+
+    return {
+        "band_counts": band_counts,
+        "points_counts": points_counts,
+        "top_provinces": top_provinces,
+        "province_data": province_data,
+        "variety_stats": variety_stats,
+        "country_labels": [top_countries_price[i] for i in order],
+        "price_data": [price_data[i] for i in order],
+    }
+
+
+def assert_same_charts(result, expected):
+    # Plot 1: same countries in the same order, same counts per band
+    assert result["band_counts"].index.tolist() == [str(c) for c in expected["band_counts"].index]
+    assert result["band_counts"].columns.tolist() == [str(c) for c in expected["band_counts"].columns]
+    np.testing.assert_array_equal(result["band_counts"].to_numpy(), expected["band_counts"].to_numpy())
+    # Plot 2
+    assert result["points_counts"].index.tolist() == expected["points_counts"].index.tolist()
+    assert result["points_counts"].tolist() == expected["points_counts"].tolist()
+    # Plot 3 (the same points for each province; the chunked version has them sorted)
+    assert result["top_provinces"] == expected["top_provinces"]
+    for got, want in zip(result["province_data"], expected["province_data"]):
+        np.testing.assert_array_equal(got, np.sort(want).astype("int64"))
+    # Plot 4 (points are float32 when some are missing, so pandas' mean/std are float32 too)
+    stats, want = result["variety_stats"], expected["variety_stats"]
+    assert stats.index.tolist() == [str(v) for v in want.index]
+    assert stats["count"].tolist() == want["count"].tolist()
+    rtol = 1e-6 if want["mean"].dtype == np.float32 else 1e-12
+    np.testing.assert_allclose(stats["mean"], want["mean"], rtol=rtol)
+    np.testing.assert_allclose(stats["std"], want["std"], rtol=rtol)
+    # Plot 5 (prices are float32 in the table, so averages agree to float32 precision)
+    assert result["country_labels"] == [str(c) for c in expected["country_labels"]]
+    for got, want in zip(result["price_data"], expected["price_data"]):
+        np.testing.assert_allclose(np.sort(got), np.sort(want), rtol=1e-6)
+
+
+def chunked_charts(aggs, top_n_countries, top_n_provinces, top_n_varieties, top_n_countries_price):
+    top_provinces, province_data = wine_chunked.province_points(aggs, top_n_provinces)
+    country_labels, price_data = wine_chunked.province_price_data(aggs, top_n_countries_price)
+    return {
+        "band_counts": wine_chunked.rating_band_counts(aggs, top_n_countries),
+        "points_counts": wine_chunked.points_distribution(aggs),
+        "top_provinces": top_provinces,
+        "province_data": province_data,
+        "variety_stats": wine_chunked.variety_stats(aggs, top_n_varieties),
+        "country_labels": country_labels,
+        "price_data": price_data,
+    }
+
+
+def test_aggregate_csv_matches_notebook(csv_path, wine_df):
+    aggs = wine_chunked.aggregate_csv(csv_path, chunksize=CHUNK_SIZE)
+    assert_same_charts(chunked_charts(aggs, **TOP_N), notebook_charts(wine_df, **TOP_N))
+
+
+def test_cube_chart_data_matches_notebook(csv_path, wine_df, tmp_path):
+    cube_path = tmp_path / "reviews_cube.csv"
+    cube = wine_cube.load_or_build_cube(csv_path, cube_path, chunksize=CHUNK_SIZE)
+    assert cube["reviews"].sum() == len(wine_df)
+    expected = notebook_charts(wine_df, **TOP_N)
+    assert_same_charts(wine_cube.chart_data(cube, **TOP_N), expected)
+    # The saved cube gives the same charts
+    assert_same_charts(wine_cube.chart_data(wine_cube.load_or_build_cube(csv_path, cube_path), **TOP_N), expected)
+
+
+def test_build_cube_from_csv_merges_once(csv_path, wine_df, monkeypatch):
+    calls = []
+    merge_cubes = wine_cube.merge_cubes
+    monkeypatch.setattr(wine_cube, "merge_cubes", lambda cubes: calls.append(len(cubes)) or merge_cubes(cubes))
+    cube = wine_cube.build_cube_from_csv(csv_path, chunksize=CHUNK_SIZE)
+    assert calls == [-(-len(wine_df) // CHUNK_SIZE)]
+
+    def rows(cube):
+        cube = cube.astype({col: str for col in wine_data.CATEGORY_COLUMNS})
+        return cube.sort_values(wine_cube.CUBE_KEYS, ignore_index=True)
+
+    pd.testing.assert_frame_equal(rows(cube), rows(wine_cube.build_cube(wine_df)))
+
+
+def test_csv_cube_keeps_na_names(tmp_path):
+    df = pd.DataFrame({"country": ["NA", "US"], "province": ["NA", "null"], "variety": ["N/A", "None"],
+                       "points": [88.0, np.nan], "price": [20.0, np.nan]})
+    for col in wine_data.CATEGORY_COLUMNS:
+        df[col] = df[col].astype("category")
+    cube = wine_cube.build_cube(df)
+    path = tmp_path / "cube.csv"
+    wine_cube.save_cube(cube, path)
+    loaded = wine_cube.load_cube(path)
+    assert loaded["province"].tolist() == ["NA", "null"]
+    assert loaded["variety"].tolist() == ["N/A", "None"]
+    assert loaded["points"].isna().tolist() == [False, True]
+
+
+def test_load_wine_data_dtypes(wine_df):
+    for col in wine_data.CATEGORY_COLUMNS:
+        assert isinstance(wine_df[col].dtype, pd.CategoricalDtype)
+        assert not wine_df[col].isna().any()
+    assert "Unknown" in wine_df["country"].cat.categories
+    # points is float32 when values are missing, int8 when complete
+    assert wine_df["points"].dtype == (np.float32 if wine_df["points"].isna().any() else np.int8)
+    assert wine_df["price"].dtype == np.float32
+    assert list(wine_df.columns) == wine_data.USE_COLUMNS
+
+
+def test_load_wine_data_points_downcast(tmp_path):
+    path = tmp_path / "reviews.csv"
+    path.write_text("country,province,variety,points,price,title\nUS,Oregon,Pinot Noir,91,40,x\n", encoding="utf-8")
+    df = wine_data.load_wine_data(path, use_cache=False)
+    assert df["points"].dtype == np.int8
+    assert "title" not in df
+
+
+@pytest.mark.skipif(not wine_data.HAS_PYARROW, reason="Parquet cache needs pyarrow")
+def test_load_wine_data_reuses_cache(csv_path, tmp_path, monkeypatch):
+    cache_path = tmp_path / "reviews.parquet"
+    df = wine_data.load_wine_data(csv_path, cache_path=cache_path)
+    assert cache_path.exists()
+
+    def fail(path):
+        raise AssertionError("CSV read although the cache is up to date")
+
+    monkeypatch.setattr(wine_data, "load_wine_csv", fail)
+    cached = wine_data.load_wine_data(csv_path, cache_path=cache_path)
+    pd.testing.assert_frame_equal(cached, df)
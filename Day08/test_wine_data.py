@@ -0,0 +1,47 @@
+import pandas as pd
+import pytest
+
+import wine_data
+
+SHARDS = [
+    "country,province,variety,points,price\n"
+    "Italy,Sicily,Nero d'Avola,87,15\n"
+    "US,California,Pinot Noir,91,40\n",
+    "country,province,variety,points,price\n"
+    "France,Bordeaux,Merlot,89,25\n"
+    ",,,85,\n",
+    "country,province,variety,points,price\n"
+    "US,Oregon,Pinot Noir,93,55\n"
+    "Italy,Tuscany,Sangiovese,90,30\n",
+]
+
+
+@pytest.fixture
+def shard_dir(tmp_path):
+    for i, text in enumerate(SHARDS):
+        (tmp_path / f"shard-{i}.csv").write_text(text, encoding="utf-8")
+    return tmp_path
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_load_wine_shards(shard_dir, workers):
+    df = wine_data.load_wine_shards(shard_dir / "shard-*.csv", workers=workers)
+    assert len(df) == 6
+    assert df["points"].tolist() == [87, 91, 89, 85, 93, 90]
+    for col in wine_data.CATEGORY_COLUMNS:
+        assert isinstance(df[col].dtype, pd.CategoricalDtype)
+    # One shared dictionary for all shards (sorted, with "Unknown" for the missing values)
+    assert list(df["country"].cat.categories) == ["France", "Italy", "US", "Unknown"]
+    assert df["variety"].cat.codes.iloc[1] == df["variety"].cat.codes.iloc[4]
+
+
+def test_load_wine_shards_from_paths_and_strings(shard_dir):
+    paths = sorted(shard_dir.glob("shard-*.csv"))
+    by_paths = wine_data.load_wine_shards(paths, workers=1)
+    by_pattern = wine_data.load_wine_shards(str(shard_dir / "shard-*.csv"), workers=1)
+    pd.testing.assert_frame_equal(by_paths, by_pattern)
+
+
+def test_load_wine_shards_no_match(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        wine_data.load_wine_shards(tmp_path / "missing-*.csv")
@@ -0,0 +1,111 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import wine_sketches
+
+N_BLOCKS = 10
+
+
+@pytest.fixture(scope="module")
+def zipf_labels():
+    rng = np.random.default_rng(11)
+    ranks = rng.zipf(1.3, size=60_000)
+    ranks = ranks[ranks <= 5000]
+    return np.array([f"label-{r}" for r in ranks], dtype=object)
+
+
+@pytest.fixture(scope="module")
+def lognormal_values():
+    rng = np.random.default_rng(12)
+    return rng.lognormal(3.3, 0.8, size=100_000)
+
+
+def blocks(values):
+    return np.array_split(values, N_BLOCKS)
+
+
+def assert_space_saving_bounds(summary, true_counts):
+    for label, count in summary.counts.items():
+        true = true_counts.get(label, 0)
+        assert count - summary.errors[label] <= true <= count, label
+    # Every label more frequent than the floor is tracked
+    frequent = true_counts[true_counts > summary.floor].index
+    assert set(frequent) <= set(summary.counts.index)
+    assert summary.total == true_counts.sum()
+
+
+def test_space_saving_error_bounds(zipf_labels):
+    true_counts = pd.Series(zipf_labels).value_counts()
+    streamed = wine_sketches.SpaceSaving(capacity=50)
+    for block in blocks(zipf_labels):
+        streamed.update(block)
+    assert len(streamed) <= 50
+    assert_space_saving_bounds(streamed, true_counts)
+
+    bounds = streamed.error_bounds(10)
+    assert (bounds["lower"] <= true_counts[bounds.index]).all()
+    assert (true_counts[bounds.index] <= bounds["count"]).all()
+
+
+def test_space_saving_merge_matches_single_pass(zipf_labels):
+    true_counts = pd.Series(zipf_labels).value_counts()
+    single = wine_sketches.SpaceSaving(capacity=50).update(zipf_labels)
+    merged = wine_sketches.SpaceSaving(capacity=50)
+    for block in blocks(zipf_labels):
+        merged.merge(wine_sketches.SpaceSaving(capacity=50).update(block))
+    assert_space_saving_bounds(merged, true_counts)
+    # The heavy hitters and their order agree
+    assert merged.head(10).index.tolist() == single.head(10).index.tolist() == true_counts.head(10).index.tolist()
+
+
+def test_count_min_never_underestimates(zipf_labels):
+    true_counts = pd.Series(zipf_labels).value_counts()
+    sketch = wine_sketches.CountMinSketch(width=256, depth=4)
+    for block in blocks(zipf_labels):
+        sketch.update(block)
+    estimates = sketch.estimate(true_counts.index)
+    assert (estimates >= true_counts.to_numpy()).all()
+    # The e / width * total bound holds for nearly all labels
+    assert np.mean(estimates - true_counts.to_numpy() <= sketch.error_bound) > 0.95
+    assert sketch["label-never-seen"] <= sketch.error_bound * 2
+
+
+def test_count_min_merge_matches_single_pass(zipf_labels):
+    single = wine_sketches.CountMinSketch(width=256, depth=4).update(zipf_labels)
+    merged = wine_sketches.CountMinSketch(width=256, depth=4)
+    for block in blocks(zipf_labels):
+        merged.merge(wine_sketches.CountMinSketch(width=256, depth=4).update(block))
+    np.testing.assert_array_equal(merged.table, single.table)
+    assert merged.total == single.total == len(zipf_labels)
+
+
+QUANTILES = [0.001, 0.01, 0.1, 0.25, 0.5, 0.75, 0.9, 0.99, 0.999]
+
+
+def rank_errors(digest, values):
+    sorted_values = np.sort(values)
+    estimates = digest.quantile(QUANTILES).to_numpy()
+    ranks = np.searchsorted(sorted_values, estimates, side="right") / len(values)
+    return np.abs(ranks - np.array(QUANTILES))
+
+
+def test_tdigest_rank_error(lognormal_values):
+    digest = wine_sketches.TDigest(compression=200)
+    for block in blocks(lognormal_values):
+        digest.update(block)
+    assert digest.count == len(lognormal_values)
+    assert len(digest) <= 200
+    assert rank_errors(digest, lognormal_values).max() <= 1 / digest.compression
+    assert digest.quantile(0) == lognormal_values.min()
+    assert digest.quantile(1) == lognormal_values.max()
+
+
+def test_tdigest_merge_matches_single_pass(lognormal_values):
+    single = wine_sketches.TDigest(compression=200).update(lognormal_values)
+    merged = wine_sketches.TDigest(compression=200)
+    for block in blocks(lognormal_values):
+        merged.merge(wine_sketches.TDigest(compression=200).update(block))
+    assert merged.count == single.count
+    assert rank_errors(merged, lognormal_values).max() <= 1 / merged.compression
+    np.testing.assert_allclose(merged.quantile(QUANTILES), single.quantile(QUANTILES), rtol=0.02)
@@ -0,0 +1,245 @@
+"""
+Export the wine analysis charts without Jupyter.
+
+The chart data is computed once (from the aggregate cube, see wine_cube.py),
+saved as CSV files, and the five figures are rendered in parallel worker
+processes with the non-interactive Agg backend and saved as PNG and/or SVG.
+
+Usage:
+
+    python wine_charts.py winemag-data-130k-v2.csv --out charts --format png --format svg
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import click
+import numpy as np
+import pandas as pd
+
+from wine_chunked import DEFAULT_CHUNK_SIZE
+from wine_cube import chart_data, load_or_build_cube
+from wine_data import DEFAULT_CSV_PATH
+
+FORMATS = ("png", "svg")
+
+# Chart file names (without extension), in the notebook's order
+CHART_NAMES = (
+    "1_rating_bands_by_country",
+    "2_points_distribution",
+    "3_points_by_province",
+    "4_points_by_variety",
+    "5_province_prices_by_country",
+)
+
+
+def _compact(values):
+    """Store an array of repeated values as (unique values, counts) to send it to a worker cheaply."""
+    return np.unique(values, return_counts=True)
+
+
+def _expand(compact):
+    values, counts = compact
+    return np.repeat(values, counts)
+
+
+# ---------- Plot functions (same charts as wine_analysis.ipynb) ----------
+
+def plot_rating_bands(ax, band_counts):
+    """Plot 1: stacked horizontal bars of review counts per country and rating band."""
+    band_counts.plot(kind="barh", stacked=True, ax=ax)
+    ax.set_title(f"Top {len(band_counts)} Countries: Review Counts Stacked by Rating Bands")
+    ax.set_xlabel("Number of Reviews")
+    ax.set_ylabel("Country")
+    ax.grid(axis="x", alpha=0.25)
+    ax.legend(title="Points Band", bbox_to_anchor=(1.02, 1), loc="upper left")
+
+
+def plot_points_distribution(ax, points_counts):
+    """Plot 2: bar chart of the number of reviews per points value."""
+    ax.bar(points_counts.index, points_counts.values, width=0.8)
+    ax.set_title("Distribution of Wine Ratings (Points)")
+    ax.set_xlabel("Points")
+    ax.set_ylabel("Count")
+    ax.grid(axis="y", alpha=0.25)
+    ax.set_xticks(range(int(points_counts.index.min()), int(points_counts.index.max()) + 1))
+
+
+def plot_province_points(ax, top_provinces, province_data):
+    """Plot 3: violin plot of points per province."""
+    ax.violinplot(province_data, showmeans=True, showmedians=True)
+    ax.set_title(f"Points Distribution by Province (Top {len(top_provinces)} by Review Count)")
+    ax.set_xlabel("Province")
+    ax.set_ylabel("Points")
+    ax.grid(axis="y", alpha=0.25)
+    positions = np.arange(1, len(top_provinces) + 1)
+    ax.set_xticks(positions)
+    ax.set_xticklabels(top_provinces, rotation=45, ha="right")
+
+
+def plot_variety_stats(ax, variety_stats):
+    """Plot 4: average points per variety with standard deviation error bars."""
+    ax.barh(variety_stats.index, variety_stats["mean"], xerr=variety_stats["std"].fillna(0), capsize=3)
+    ax.set_title(f"Average Points by Variety (Top {len(variety_stats)} by Review Count)")
+    ax.set_xlabel("Average Points (error bars = standard deviation)")
+    ax.set_ylabel("Variety")
+    ax.grid(axis="x", alpha=0.25)
+
+
+def plot_province_prices(ax, country_labels, price_data):
+    """Plot 5: box plots of province average prices per country, with jittered points."""
+    ax.boxplot(price_data, showfliers=False)
+    ax.set_xticks(range(1, len(country_labels) + 1))
+    ax.set_xticklabels(country_labels, rotation=35, ha="right")
+
+    # Overlay jittered points (each dot = one province's average price)
+    rng = np.random.default_rng(42)
+    for i, prices in enumerate(price_data, start=1):
+        x_jitter = i + rng.normal(0, 0.06, size=len(prices))
+        ax.scatter(x_jitter, prices, alpha=0.25, s=12)
+
+    ax.set_yscale("log")
+    ax.set_title(f"Distribution of Province Average Prices within Top {len(country_labels)} Countries")
+    ax.set_xlabel("Country (sorted by median province average price)")
+    ax.set_ylabel("Average Price per Province (USD, log scale)")
+    ax.grid(axis="y", alpha=0.25)
+
+
+# ---------- Rendering in worker processes ----------
+
+def _use_agg_backend():
+    """Worker initializer: render without a display."""
+    import matplotlib
+    matplotlib.use("Agg")
+
+
+def render_chart(name, payload, out_dir, formats):
+    """Render one chart and save it in every format. Returns the saved paths."""
+    import matplotlib.pyplot as plt
+
+    if name == CHART_NAMES[0]:
+        fig, ax = plt.subplots(figsize=(12, 8))
+        plot_rating_bands(ax, payload)
+    elif name == CHART_NAMES[1]:
+        fig, ax = plt.subplots(figsize=(10, 4.8))
+        plot_points_distribution(ax, payload)
+    elif name == CHART_NAMES[2]:
+        top_provinces, compact_data = payload
+        fig, ax = plt.subplots(figsize=(12, 5.8))
+        plot_province_points(ax, top_provinces, [_expand(c) for c in compact_data])
+    elif name == CHART_NAMES[3]:
+        fig, ax = plt.subplots(figsize=(10, 6.5))
+        plot_variety_stats(ax, payload)
+    elif name == CHART_NAMES[4]:
+        fig, ax = plt.subplots(figsize=(12, 6))
+        plot_province_prices(ax, *payload)
+    else:
+        raise ValueError(f"Unknown chart: {name}")
+
+    fig.tight_layout()
+    paths = []
+    for fmt in formats:
+        path = Path(out_dir) / f"{name}.{fmt}"
+        fig.savefig(path, bbox_inches="tight")
+        paths.append(path)
+    plt.close(fig)
+    return paths
+
+
+def chart_payloads(data):
+    """Split the chart data (see wine_cube.chart_data) into one small payload per chart."""
+    return {
+        CHART_NAMES[0]: data["band_counts"],
+        CHART_NAMES[1]: data["points_counts"],
+        CHART_NAMES[2]: (data["top_provinces"], [_compact(values) for values in data["province_data"]]),
+        CHART_NAMES[3]: data["variety_stats"],
+        CHART_NAMES[4]: (data["country_labels"], data["price_data"]),
+    }
+
+
+def write_chart_csvs(data, out_dir):
+    """Save the data behind every chart as CSV files. Returns the saved paths."""
+    out_dir = Path(out_dir)
+    province_points = pd.DataFrame(
+        [
+            (province, int(points), int(count))
+            for province, values in zip(data["top_provinces"], data["province_data"])
+            for points, count in zip(*_compact(values))
+        ],
+        columns=["province", "points", "count"],
+    )
+    province_prices = pd.DataFrame(
+        [
+            (country, float(price))
+            for country, prices in zip(data["country_labels"], data["price_data"])
+            for price in prices
+        ],
+        columns=["country", "province_avg_price"],
+    )
+    tables = {
+        CHART_NAMES[0]: (data["band_counts"], True),
+        CHART_NAMES[1]: (data["points_counts"].rename("count"), True),
+        CHART_NAMES[2]: (province_points, False),
+        CHART_NAMES[3]: (data["variety_stats"], True),
+        CHART_NAMES[4]: (province_prices, False),
+    }
+    paths = []
+    for name, (table, index) in tables.items():
+        path = out_dir / f"{name}.csv"
+        table.to_csv(path, index=index)
+        paths.append(path)
+    return paths
+
+
+def export_charts(csv_path, out_dir, formats=("png",), workers=None, chunksize=DEFAULT_CHUNK_SIZE, **top_n):
+    """
+    Compute the chart data once, write the CSV files and render all charts in a process pool.
+
+    top_n may contain top_n_countries, top_n_provinces, top_n_varieties and
+    top_n_countries_price (see wine_cube.chart_data). Returns all saved paths.
+    """
+    unknown = [fmt for fmt in formats if fmt not in FORMATS]
+    if unknown:
+        raise ValueError(f"Unknown format(s): {', '.join(unknown)}")
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    data = chart_data(load_or_build_cube(csv_path, chunksize=chunksize), **top_n)
+    paths = write_chart_csvs(data, out_dir)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_use_agg_backend) as pool:
+        futures = [
+            pool.submit(render_chart, name, payload, out_dir, tuple(formats))
+            for name, payload in chart_payloads(data).items()
+        ]
+        for future in futures:
+            paths.extend(future.result())
+    return paths
+
+
+@click.command()
+@click.argument('csv_path', type=click.Path(exists=True, dir_okay=False), default=str(DEFAULT_CSV_PATH))
+@click.option('--out', 'out_dir', type=click.Path(file_okay=False), default="charts", show_default=True,
+              help="Folder for the chart images and CSV files.")
+@click.option('--format', 'formats', type=click.Choice(FORMATS), multiple=True,
+              help="Image format (repeat for several). Default: png.")
+@click.option('--workers', type=click.IntRange(min=1), help="Number of rendering processes (default: CPU count).")
+@click.option('--chunksize', type=click.IntRange(min=1), default=DEFAULT_CHUNK_SIZE, show_default=True,
+              help="Rows read at once when the aggregate cube has to be built.")
+@click.option('--top-n-countries', type=click.IntRange(min=1), default=20, show_default=True)
+@click.option('--top-n-provinces', type=click.IntRange(min=1), default=15, show_default=True)
+@click.option('--top-n-varieties', type=click.IntRange(min=1), default=20, show_default=True)
+@click.option('--top-n-countries-price', type=click.IntRange(min=1), default=10, show_default=True)
+def main(csv_path, out_dir, formats, workers, chunksize, **top_n):
+    """
+    Export the five wine analysis charts and their data.
+
+    CSV_PATH is the wine review CSV (default: winemag-data-130k-v2.csv next to this script).
+    """
+    paths = export_charts(csv_path, out_dir, formats or ("png",), workers, chunksize, **top_n)
+    for path in paths:
+        click.echo(f"✓ Saved: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Out-of-core aggregation for the wine analysis.
+
+The CSV is read in blocks; every block is reduced to small partial results
+(counts, sums and sums of squares) that can be merged by adding them up.
+From the merged partials we derive the data behind the notebook's five
+charts, with the same numbers as running the notebook on the whole table.
+
+    aggs = aggregate_csv("winemag-data-130k-v2.csv")
+    band_counts = rating_band_counts(aggs, top_n=20)
+"""
+
+import numpy as np
+import pandas as pd
+
+from wine_data import UNKNOWN, clean_wine_data, read_wine_csv
+
+# Rating bands used in plot 1
+RATING_BINS = [79.5, 84.5, 89.5, 94.5, 100.5]
+RATING_LABELS = ["80–84", "85–89", "90–94", "95–100"]
+
+DEFAULT_CHUNK_SIZE = 200_000
+
+
+def plain_index(result):
+    """Turn categorical index levels into plain values so partials from different blocks can be added."""
+    index = result.index
+    if isinstance(index, pd.MultiIndex):
+        result.index = pd.MultiIndex.from_arrays(
+            [index.get_level_values(i).astype(object) for i in range(index.nlevels)],
+            names=index.names,
+        )
+    else:
+        result.index = index.astype(object)
+    return result
+
+
+def _top(counts, top_n):
+    """Top-N labels by count (largest first, ties in label order)."""
+    return counts.sort_index().sort_values(ascending=False, kind="stable").head(top_n).index.tolist()
+
+
+def aggregate_frame(df):
+    """
+    Reduce a cleaned block of reviews (see wine_data.clean_wine_data) to partial results.
+
+    Returns a dict of Series/DataFrames; see merge_aggregates to combine blocks.
+    """
+    with_points = df[df["points"].notna()]
+    points = with_points["points"].astype("int64")
+    bands = pd.cut(with_points["points"], bins=RATING_BINS, labels=RATING_LABELS, include_lowest=True)
+
+    points_stats = (
+        pd.DataFrame({"variety": with_points["variety"], "count": 1, "sum": points, "sumsq": points * points})
+        .groupby("variety", observed=True)[["count", "sum", "sumsq"]]
+        .sum()
+    )
+
+    with_price = df[df["price"].notna() & (df["price"] > 0)]
+    price_stats = (
+        pd.DataFrame({
+            "country": with_price["country"],
+            "province": with_price["province"],
+            "count": 1,
+            "sum": with_price["price"].astype("float64"),
+        })
+        .groupby(["country", "province"], observed=True)[["count", "sum"]]
+        .sum()
+    )
+
+    return {
+        # Plot 1: reviews with points per country, and per country and rating band
+        "country_counts": plain_index(with_points.groupby("country", observed=True).size()),
+        "band_counts": plain_index(
+            pd.DataFrame({"country": with_points["country"], "band": bands})
+            .groupby(["country", "band"], observed=True).size()
+        ),
+        # Plot 2: reviews per points value
+        "points_counts": plain_index(points.value_counts()),
+        # Plot 3: reviews per province, and per province and points value
+        "province_counts": plain_index(df.groupby("province", observed=True).size()),
+        "province_points": plain_index(
+            pd.DataFrame({"province": with_points["province"], "points": points})
+            .groupby(["province", "points"], observed=True).size()
+        ),
+        # Plot 4: count, sum and sum of squares of points per variety
+        "variety_points": plain_index(points_stats),
+        # Plot 5: count and sum of prices per country and province
+        "province_prices": plain_index(price_stats),
+    }
+
+
+def merge_aggregates(left, right):
+    """Combine two partial results (from aggregate_frame) into one."""
+    if left is None:
+        return right
+    return {key: left[key].add(right[key], fill_value=0) for key in left}
+
+
+def aggregate_chunks(chunks):
+    """Aggregate an iterable of cleaned blocks."""
+    aggs = None
+    for chunk in chunks:
+        aggs = merge_aggregates(aggs, aggregate_frame(chunk))
+    if aggs is None:
+        raise ValueError("No data to aggregate")
+    return aggs
+
+
+def iter_wine_chunks(csv_path, chunksize=DEFAULT_CHUNK_SIZE):
+    """Read and clean a wine review CSV block by block."""
+    with read_wine_csv(csv_path, chunksize=chunksize) as reader:
+        for chunk in reader:
+            yield clean_wine_data(chunk)
+
+
+def aggregate_csv(csv_path, chunksize=DEFAULT_CHUNK_SIZE):
+    """Aggregate a wine review CSV without loading it into memory at once."""
+    return aggregate_chunks(iter_wine_chunks(csv_path, chunksize))
+
+
+# ---------- Chart data derived from the partial results ----------
+
+def rating_band_counts(aggs, top_n=20):
+    """Plot 1: reviews per rating band for the top-N countries, sorted by total count (ascending)."""
+    top_countries = _top(aggs["country_counts"], top_n)
+    table = (
+        aggs["band_counts"].unstack(fill_value=0)
+        .reindex(index=top_countries, columns=RATING_LABELS, fill_value=0)
+        .astype("int64")
+    )
+    table.index.name = "country"
+    table.columns.name = "rating_band"
+    return table.loc[table.sum(axis=1).sort_values(kind="stable").index]
+
+
+def points_distribution(aggs):
+    """Plot 2: number of reviews per points value."""
+    counts = aggs["points_counts"].astype("int64").sort_index()
+    counts.index = counts.index.astype("int64")
+    counts.index.name = "points"
+    return counts
+
+
+def province_points(aggs, top_n=15):
+    """Plot 3: (top-N provinces by review count, list of points arrays per province)."""
+    top_provinces = _top(aggs["province_counts"], top_n)
+    counts = aggs["province_points"].astype("int64")
+    data = []
+    for province in top_provinces:
+        if province in counts.index.get_level_values(0):
+            per_points = counts.loc[province]
+            data.append(np.repeat(per_points.index.to_numpy(dtype="int64"), per_points.to_numpy()))
+        else:
+            data.append(np.array([], dtype="int64"))
+    return top_provinces, data
+
+
+def variety_stats(aggs, top_n=20):
+    """Plot 4: count, mean and standard deviation of points for the top-N varieties (sorted by mean)."""
+    stats = aggs["variety_points"]
+    count = stats["count"].astype("int64")
+    mean = stats["sum"] / count
+    # Sample standard deviation (ddof=1), like pandas' std
+    with np.errstate(invalid="ignore", divide="ignore"):
+        variance = (stats["sumsq"] - stats["sum"] * stats["sum"] / count) / (count - 1)
+    std = np.sqrt(variance.clip(lower=0)).where(count > 1)
+    result = pd.DataFrame({"count": count, "mean": mean, "std": std})
+    result.index.name = "variety"
+    top_varieties = _top(count, top_n)
+    return result.loc[top_varieties].sort_values("mean", kind="stable")
+
+
+def province_price_data(aggs, top_n=10):
+    """
+    Plot 5: (country labels, list of province average price arrays) for the
+    top-N countries by priced reviews, sorted by median province average price.
+    """
+    prices = aggs["province_prices"]
+    country_counts = prices["count"].groupby(level="country").sum()
+    top_countries = _top(country_counts[country_counts.index != UNKNOWN], top_n)
+
+    avg_prices = prices["sum"] / prices["count"]
+    price_data = [avg_prices.loc[country].to_numpy() for country in top_countries]
+
+    medians = [np.median(values) if len(values) > 0 else np.nan for values in price_data]
+    order = np.argsort(medians, kind="stable")
+    return [top_countries[i] for i in order], [price_data[i] for i in order]
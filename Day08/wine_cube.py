@@ -0,0 +1,168 @@
+"""
+Precomputed aggregate cube for the wine analysis.
+
+The cube holds one row per (country, province, variety, points) combination
+with the number of reviews and the count, sum and sum of squares of valid
+prices. It is small compared to the reviews, can be saved to disk, and the
+data for every chart (for any TOP_N_* values) is derived from it without
+scanning the reviews again.
+
+    cube = load_or_build_cube("winemag-data-130k-v2.csv")
+    data = chart_data(cube, top_n_countries=10)
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+from wine_chunked import (
+    DEFAULT_CHUNK_SIZE,
+    RATING_BINS,
+    RATING_LABELS,
+    iter_wine_chunks,
+    plain_index,
+    points_distribution,
+    province_points,
+    province_price_data,
+    rating_band_counts,
+    variety_stats,
+)
+from wine_data import CATEGORY_COLUMNS, HAS_PYARROW
+
+CUBE_KEYS = ["country", "province", "variety", "points"]
+CUBE_VALUES = ["reviews", "price_count", "price_sum", "price_sumsq"]
+
+
+def build_cube(df):
+    """Build the cube from a cleaned table of reviews (see wine_data.clean_wine_data)."""
+    price_ok = df["price"].notna() & (df["price"] > 0)
+    price = df["price"].astype("float64").where(price_ok, 0.0)
+    frame = pd.DataFrame({
+        "country": df["country"],
+        "province": df["province"],
+        "variety": df["variety"],
+        "points": df["points"].astype("float64"),
+        "reviews": 1,
+        "price_count": price_ok.astype("int64"),
+        "price_sum": price,
+        "price_sumsq": price * price,
+    })
+    return _group_cube(frame)
+
+
+def _group_cube(frame):
+    cube = (
+        frame.groupby(CUBE_KEYS, observed=True, dropna=False, sort=False)[CUBE_VALUES]
+        .sum()
+        .reset_index()
+    )
+    for col in CATEGORY_COLUMNS:
+        cube[col] = cube[col].astype("category")
+    return cube
+
+
+def merge_cubes(cubes):
+    """Add up cubes built from different parts of the data."""
+    cubes = list(cubes)
+    if not cubes:
+        raise ValueError("No cubes to merge")
+    frame = pd.concat(
+        [cube.astype({col: object for col in CATEGORY_COLUMNS}) for cube in cubes],
+        ignore_index=True,
+    )
+    return _group_cube(frame)
+
+
+def build_cube_from_csv(csv_path, chunksize=DEFAULT_CHUNK_SIZE):
+    """Build the cube from a wine review CSV, reading it block by block."""
+    # The partial cubes are merged once at the end; merging after every block
+    # would regroup the whole cube each time
+    partials = [build_cube(chunk) for chunk in iter_wine_chunks(csv_path, chunksize)]
+    if not partials:
+        raise ValueError("No data to aggregate")
+    return partials[0] if len(partials) == 1 else merge_cubes(partials)
+
+
+def default_cube_path(csv_path):
+    """Return the path where the cube of a CSV file is saved."""
+    csv_path = Path(csv_path)
+    suffix = ".parquet" if HAS_PYARROW else ".csv"
+    return csv_path.with_name(f"{csv_path.stem}_cube{suffix}")
+
+
+def save_cube(cube, path):
+    """Save a cube as Parquet (.parquet, needs pyarrow) or CSV."""
+    path = Path(path)
+    if path.suffix == ".parquet":
+        cube.to_parquet(path, index=False)
+    else:
+        cube.to_csv(path, index=False)
+
+
+def load_cube(path):
+    """Load a cube saved with save_cube."""
+    path = Path(path)
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    # Only an empty points cell is missing; names such as "NA" stay strings
+    return pd.read_csv(path, dtype={col: "category" for col in CATEGORY_COLUMNS},
+                       keep_default_na=False, na_values={"points": [""]})
+
+
+def load_or_build_cube(csv_path, cube_path=None, chunksize=DEFAULT_CHUNK_SIZE):
+    """Load the saved cube of a CSV file, or build and save it if it is missing or older than the CSV."""
+    csv_path = Path(csv_path)
+    cube_path = Path(cube_path) if cube_path else default_cube_path(csv_path)
+    if cube_path.exists() and cube_path.stat().st_mtime >= csv_path.stat().st_mtime:
+        return load_cube(cube_path)
+    cube = build_cube_from_csv(csv_path, chunksize)
+    save_cube(cube, cube_path)
+    return cube
+
+
+def cube_aggregates(cube):
+    """Turn the cube into the partial results used by the wine_chunked chart functions."""
+    with_points = cube[cube["points"].notna()]
+    points = with_points["points"].astype("int64")
+    reviews = with_points["reviews"]
+    bands = pd.cut(with_points["points"], bins=RATING_BINS, labels=RATING_LABELS, include_lowest=True)
+
+    variety_points = pd.DataFrame({
+        "variety": with_points["variety"],
+        "count": reviews,
+        "sum": reviews * points,
+        "sumsq": reviews * points * points,
+    }).groupby("variety", observed=True)[["count", "sum", "sumsq"]].sum()
+
+    priced = cube[cube["price_count"] > 0]
+    province_prices = (
+        priced.groupby(["country", "province"], observed=True)[["price_count", "price_sum"]]
+        .sum()
+        .rename(columns={"price_count": "count", "price_sum": "sum"})
+    )
+
+    return {
+        "country_counts": plain_index(reviews.groupby(with_points["country"], observed=True).sum()),
+        "band_counts": plain_index(reviews.groupby([with_points["country"], bands], observed=True).sum()),
+        "points_counts": plain_index(reviews.groupby(points).sum()),
+        "province_counts": plain_index(cube.groupby("province", observed=True)["reviews"].sum()),
+        "province_points": plain_index(reviews.groupby([with_points["province"], points]).sum()),
+        "variety_points": plain_index(variety_points),
+        "province_prices": plain_index(province_prices),
+    }
+
+
+def chart_data(cube, top_n_countries=20, top_n_provinces=15, top_n_varieties=20, top_n_countries_price=10):
+    """Derive the data for all five charts from the cube."""
+    aggs = cube_aggregates(cube)
+    top_provinces, province_data = province_points(aggs, top_n_provinces)
+    country_labels, price_data = province_price_data(aggs, top_n_countries_price)
+    return {
+        "band_counts": rating_band_counts(aggs, top_n_countries),
+        "points_counts": points_distribution(aggs),
+        "top_provinces": top_provinces,
+        "province_data": province_data,
+        "variety_stats": variety_stats(aggs, top_n_varieties),
+        "country_labels": country_labels,
+        "price_data": price_data,
+    }
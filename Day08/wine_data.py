@@ -0,0 +1,133 @@
+"""
+Loader for the wine review dataset (winemag-data-130k-v2.csv).
+
+Only the columns used by the analysis are read, with an explicit schema:
+country, province and variety become categoricals and points/price are
+downcast to small numeric types. The cleaned table can be cached as a
+Parquet file next to the CSV, so the next load skips CSV parsing.
+Data split over many CSV shards can be loaded in parallel with load_wine_shards.
+"""
+
+import glob
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+# Parquet caching needs pyarrow (optional)
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+DEFAULT_CSV_PATH = Path(__file__).parent / "winemag-data-130k-v2.csv"
+
+CATEGORY_COLUMNS = ["country", "province", "variety"]
+NUMERIC_COLUMNS = ["points", "price"]
+USE_COLUMNS = CATEGORY_COLUMNS + NUMERIC_COLUMNS
+
+# Explicit schema for read_csv; points and price are coerced to numbers (and downcast) after reading,
+# so stray text in a numeric column becomes NaN instead of failing the whole load
+CSV_DTYPES = {col: "category" for col in CATEGORY_COLUMNS}
+
+UNKNOWN = "Unknown"
+
+
+def clean_wine_data(df):
+    """
+    Apply the notebook's cleaning to a table with the USE_COLUMNS columns:
+    missing country/province/variety become "Unknown", points and price are
+    coerced to numbers. Points are stored as int8 when no value is missing
+    (float32 otherwise) and price as float32.
+    """
+    df = df[USE_COLUMNS].copy()
+    for col in CATEGORY_COLUMNS:
+        values = df[col].astype("category")
+        if values.isna().any():
+            if UNKNOWN not in values.cat.categories:
+                values = values.cat.add_categories(UNKNOWN)
+            values = values.fillna(UNKNOWN)
+        df[col] = values
+
+    points = pd.to_numeric(df["points"], errors="coerce")
+    if points.notna().all() and (points == points.round()).all():
+        df["points"] = pd.to_numeric(points, downcast="integer")
+    else:
+        df["points"] = pd.to_numeric(points, downcast="float")
+    df["price"] = pd.to_numeric(df["price"], errors="coerce").astype("float32")
+    return df
+
+
+def read_wine_csv(csv_path, **read_csv_kwargs):
+    """
+    Read the needed columns of a wine review CSV with the explicit schema (no cleaning).
+    Extra keyword arguments go to pd.read_csv (e.g. chunksize to read in blocks).
+    """
+    return pd.read_csv(csv_path, usecols=USE_COLUMNS, dtype=CSV_DTYPES, **read_csv_kwargs)
+
+
+def default_cache_path(csv_path):
+    """Return the Parquet cache path used for a CSV file."""
+    return Path(csv_path).with_suffix(".parquet")
+
+
+def load_wine_data(csv_path=DEFAULT_CSV_PATH, cache_path=None, use_cache=True):
+    """
+    Load and clean the wine reviews.
+
+    With use_cache=True (and pyarrow installed) the cleaned table is stored in
+    cache_path (default: the CSV path with a .parquet suffix) and reused as long
+    as it is newer than the CSV.
+    """
+    csv_path = Path(csv_path)
+    cache_path = Path(cache_path) if cache_path else default_cache_path(csv_path)
+    use_cache = use_cache and HAS_PYARROW
+
+    if use_cache and cache_path.exists() and cache_path.stat().st_mtime >= csv_path.stat().st_mtime:
+        return pd.read_parquet(cache_path)
+
+    df = load_wine_csv(csv_path)
+
+    if use_cache:
+        df.to_parquet(cache_path, index=False)
+    return df
+
+
+def load_wine_csv(csv_path):
+    """Read and clean one wine review CSV (no cache)."""
+    return clean_wine_data(read_wine_csv(csv_path))
+
+
+def concat_wine_data(frames):
+    """
+    Concatenate cleaned tables. The category columns get one shared, sorted
+    dictionary of categories instead of falling back to text.
+    """
+    frames = list(frames)
+    if not frames:
+        raise ValueError("No tables to concatenate")
+    data = {}
+    for col in USE_COLUMNS:
+        if col in CATEGORY_COLUMNS:
+            data[col] = union_categoricals([frame[col] for frame in frames], sort_categories=True)
+        else:
+            data[col] = pd.concat([frame[col] for frame in frames], ignore_index=True)
+    return pd.DataFrame(data)
+
+
+def load_wine_shards(pattern, workers=None):
+    """
+    Load many wine review CSV shards (a glob pattern such as "reviews/2024-*.csv",
+    as a str or Path, or a list of paths) in parallel worker processes, with the same cleaning as
+    load_wine_data, and concatenate them in file name order.
+    """
+    paths = sorted(glob.glob(str(pattern))) if isinstance(pattern, (str, Path)) else [str(p) for p in pattern]
+    if not paths:
+        raise FileNotFoundError(f"No CSV shards found for {pattern}")
+    if len(paths) == 1 or workers == 1:
+        return concat_wine_data(load_wine_csv(path) for path in paths)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return concat_wine_data(pool.map(load_wine_csv, paths))
@@ -0,0 +1,319 @@
+"""
+Streaming sketches for the wine analysis.
+
+For review feeds that keep growing, the exact counts and quantiles used by the
+notebook can be replaced by summaries of fixed size that are updated block by
+block and merged by adding them up:
+
+- SpaceSaving: top-N labels (heavy hitters) with a guaranteed error range,
+  used like value_counts().head(N)
+- CountMinSketch: estimated count of any label (never too low)
+- TDigest: approximate quantiles of points and price, used like
+  Series.quantile() / Series.median()
+
+    sketch = sketch_csv("winemag-data-130k-v2.csv")
+    sketch.country_counts.head(20).index       # top 20 countries
+    sketch.price.median()
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+
+from wine_chunked import DEFAULT_CHUNK_SIZE, iter_wine_chunks
+from wine_data import UNKNOWN
+
+DEFAULT_CAPACITY = 200
+DEFAULT_COMPRESSION = 200
+DEFAULT_CMS_WIDTH = 2048
+DEFAULT_CMS_DEPTH = 5
+
+
+def _exact_counts(labels):
+    """Exact count per label of a block."""
+    counts = pd.Series(labels).dropna().value_counts()
+    counts = counts[counts > 0].astype("int64")
+    counts.index = counts.index.astype(object)
+    return counts
+
+
+class SpaceSaving:
+    """
+    Top-N labels in bounded memory (Space-Saving / mergeable summaries).
+
+    At most `capacity` labels are tracked. For every tracked label
+    count - error <= true count <= count, and any label whose true count is
+    above `floor` is tracked.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.counts = pd.Series(dtype="int64")
+        self.errors = pd.Series(dtype="int64")
+        self.floor = 0
+        self.total = 0
+
+    def update(self, labels):
+        """Add a block of labels."""
+        counts = _exact_counts(labels)
+        block = SpaceSaving(self.capacity)
+        block.counts = counts
+        block.errors = pd.Series(0, index=counts.index, dtype="int64")
+        block.total = int(counts.sum())
+        self._merge(block)
+        return self
+
+    def merge(self, other):
+        """Combine with another summary (e.g. from a different block of files)."""
+        if other.capacity != self.capacity:
+            raise ValueError("Cannot merge summaries with different capacities")
+        self._merge(other)
+        return self
+
+    def _merge(self, other):
+        labels = self.counts.index.union(other.counts.index, sort=False)
+        # A label missing on one side may still have up to `floor` reviews there
+        counts = self.counts.reindex(labels, fill_value=self.floor) + other.counts.reindex(
+            labels, fill_value=other.floor
+        )
+        errors = self.errors.reindex(labels, fill_value=self.floor) + other.errors.reindex(
+            labels, fill_value=other.floor
+        )
+        floor = self.floor + other.floor
+
+        order = counts.sort_values(ascending=False, kind="stable").index
+        if len(order) > self.capacity:
+            floor = max(floor, int(counts[order[self.capacity:]].max()))
+            order = order[: self.capacity]
+        self.counts = counts[order].astype("int64")
+        self.errors = errors[order].astype("int64")
+        self.floor = floor
+        self.total += other.total
+
+    def head(self, n=5):
+        """Top-n labels with their estimated counts, like value_counts().head(n)."""
+        counts = self.counts.sort_index().sort_values(ascending=False, kind="stable").head(n)
+        counts.name = "count"
+        return counts
+
+    def error_bounds(self, n=None):
+        """Estimated count, error and guaranteed minimum of the top-n labels."""
+        counts = self.head(len(self.counts) if n is None else n)
+        errors = self.errors[counts.index]
+        return pd.DataFrame({"count": counts, "error": errors, "lower": counts - errors})
+
+    def __len__(self):
+        return len(self.counts)
+
+
+class CountMinSketch:
+    """
+    Estimated count of any label in a fixed-size table (Count-Min sketch).
+
+    Estimates are never too low; with probability 1 - exp(-depth) they are too
+    high by at most e / width * total.
+    """
+
+    def __init__(self, width=DEFAULT_CMS_WIDTH, depth=DEFAULT_CMS_DEPTH):
+        if width < 1 or depth < 1:
+            raise ValueError("width and depth must be at least 1")
+        self.width = width
+        self.depth = depth
+        self.table = np.zeros((depth, width), dtype="int64")
+        self.total = 0
+
+    def _columns(self, labels):
+        """Table column of every label in every row (double hashing)."""
+        hashes = pd.util.hash_array(np.asarray([str(label) for label in labels], dtype=object))
+        h1 = hashes & np.uint64(0xFFFFFFFF)
+        h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+        rows = np.arange(self.depth, dtype="uint64")[:, None]
+        return ((h1 + rows * h2) % np.uint64(self.width)).astype("int64")
+
+    def update(self, labels):
+        """Add a block of labels."""
+        counts = _exact_counts(labels)
+        if len(counts) == 0:
+            return self
+        columns = self._columns(counts.index)
+        for row in range(self.depth):
+            np.add.at(self.table[row], columns[row], counts.to_numpy())
+        self.total += int(counts.sum())
+        return self
+
+    def merge(self, other):
+        """Add another sketch with the same width and depth."""
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("Cannot merge sketches of different sizes")
+        self.table += other.table
+        self.total += other.total
+        return self
+
+    def estimate(self, labels):
+        """Estimated counts for a list of labels."""
+        labels = list(labels)
+        if not labels:
+            return np.array([], dtype="int64")
+        columns = self._columns(labels)
+        return self.table[np.arange(self.depth)[:, None], columns].min(axis=0)
+
+    def __getitem__(self, label):
+        return int(self.estimate([label])[0])
+
+    @property
+    def error_bound(self):
+        """Largest overestimate (with probability 1 - exp(-depth))."""
+        return math.e / self.width * self.total
+
+
+class TDigest:
+    """
+    Approximate quantiles in bounded memory (merging t-digest).
+
+    Values are kept as about `compression` / 2 weighted centroids, small near
+    the minimum and maximum, so tail quantiles stay accurate. The rank error
+    is typically well below 1 / compression.
+    """
+
+    def __init__(self, compression=DEFAULT_COMPRESSION):
+        if compression < 10:
+            raise ValueError("compression must be at least 10")
+        self.compression = compression
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.min = math.inf
+        self.max = -math.inf
+        self._buffer = []
+
+    def update(self, values):
+        """Add a block of values (missing values are skipped)."""
+        values = np.asarray(values, dtype="float64").ravel()
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self._buffer.append((values, np.ones(len(values))))
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """Add the centroids of another digest."""
+        other._compress()
+        if len(other.means) > 0:
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+            self._buffer.append((other.means, other.weights))
+            self._compress()
+        return self
+
+    def _compress(self):
+        if not self._buffer:
+            return
+        means = np.concatenate([self.means] + [values for values, _ in self._buffer])
+        weights = np.concatenate([self.weights] + [weights for _, weights in self._buffer])
+        self._buffer = []
+
+        order = np.argsort(means, kind="stable")
+        means, weights = means[order], weights[order]
+        total = weights.sum()
+        # Group neighbours whose quantile falls in the same unit of the k1 scale
+        q = (np.cumsum(weights) - weights / 2) / total
+        k = np.floor(self.compression / (2 * math.pi) * np.arcsin(2 * q - 1))
+        starts = np.flatnonzero(np.r_[True, k[1:] != k[:-1]])
+        self.weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / self.weights
+
+    @property
+    def count(self):
+        self._compress()
+        return float(self.weights.sum())
+
+    def quantile(self, q=0.5):
+        """Approximate quantile(s), like Series.quantile (NaN when empty)."""
+        self._compress()
+        qs = np.atleast_1d(np.asarray(q, dtype="float64"))
+        if np.any((qs < 0) | (qs > 1)):
+            raise ValueError("Quantiles must be between 0 and 1")
+        if len(self.means) == 0:
+            result = np.full(len(qs), np.nan)
+        else:
+            total = self.weights.sum()
+            centres = np.cumsum(self.weights) - self.weights / 2
+            positions = np.r_[0.0, centres, total]
+            values = np.r_[self.min, self.means, self.max]
+            result = np.interp(qs * total, positions, values)
+        if np.ndim(q) == 0:
+            return float(result[0])
+        return pd.Series(result, index=qs)
+
+    def median(self):
+        return self.quantile(0.5)
+
+    def __len__(self):
+        return len(self.means)
+
+
+class WineSketch:
+    """
+    Bounded-memory summary of a stream of cleaned review blocks.
+
+    The label counts follow the notebook: countries and varieties are counted
+    over reviews with points, provinces over all reviews, and `price_country_counts`
+    over reviews with a price (without "Unknown"), as used by plot 5.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, compression=DEFAULT_COMPRESSION,
+                 cms_width=DEFAULT_CMS_WIDTH, cms_depth=DEFAULT_CMS_DEPTH):
+        self.country_counts = SpaceSaving(capacity)
+        self.province_counts = SpaceSaving(capacity)
+        self.variety_counts = SpaceSaving(capacity)
+        self.price_country_counts = SpaceSaving(capacity)
+        self.label_counts = CountMinSketch(cms_width, cms_depth)
+        self.points = TDigest(compression)
+        self.price = TDigest(compression)
+        self.reviews = 0
+
+    def update(self, df):
+        """Add a cleaned block of reviews (see wine_data.clean_wine_data)."""
+        with_points = df[df["points"].notna()]
+        with_price = df[df["price"].notna() & (df["price"] > 0)]
+
+        self.country_counts.update(with_points["country"])
+        self.province_counts.update(df["province"])
+        self.variety_counts.update(with_points["variety"])
+        self.price_country_counts.update(with_price.loc[with_price["country"] != UNKNOWN, "country"])
+        for col in ("country", "province", "variety"):
+            self.label_counts.update(col + "=" + df[col].astype(str))
+        self.points.update(with_points["points"])
+        self.price.update(with_price["price"])
+        self.reviews += len(df)
+        return self
+
+    def merge(self, other):
+        """Combine with the summary of another stream."""
+        for name in ("country_counts", "province_counts", "variety_counts", "price_country_counts",
+                     "label_counts", "points", "price"):
+            getattr(self, name).merge(getattr(other, name))
+        self.reviews += other.reviews
+        return self
+
+    def count(self, column, label):
+        """Estimated number of reviews with this country, province or variety."""
+        return self.label_counts[f"{column}={label}"]
+
+
+def sketch_chunks(chunks, **options):
+    """Summarize an iterable of cleaned blocks."""
+    sketch = WineSketch(**options)
+    for chunk in chunks:
+        sketch.update(chunk)
+    return sketch
+
+
+def sketch_csv(csv_path, chunksize=DEFAULT_CHUNK_SIZE, **options):
+    """Summarize a wine review CSV block by block (options: see WineSketch)."""
+    return sketch_chunks(iter_wine_chunks(csv_path, chunksize), **options)
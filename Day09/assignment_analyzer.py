@@ -3,36 +3,53 @@ Assignment Submission Analysis Tool
 Analyzes submission data from subjects.txt and generates reports and visualizations.
 """
 
+import argparse
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from datetime import datetime
+from array import array
+from datetime import datetime, timedelta
 import re
 import json
 from pathlib import Path
 from collections import defaultdict
 
-# Try to import seaborn (optional)
-try:
-    import seaborn as sns
-    HAS_SEABORN = True
-except ImportError:
-    HAS_SEABORN = False
-
-# Configure matplotlib for better plots
-try:
-    plt.style.use('seaborn-v0_8-darkgrid')
-except:
+import pr_json
+import report_cards
+import submission_store
+from title_formats import TitleFormatClassifier
+
+# Plotting libraries (matplotlib, seaborn) are imported by _setup_plotting() only
+# when plots are made, so report-only runs start quickly.
+_PLOTTING = None
+
+
+def _setup_plotting():
+    """Import and configure matplotlib (and seaborn if installed). Returns (plt, sns or None)."""
+    global _PLOTTING
+    if _PLOTTING is not None:
+        return _PLOTTING
+
+    import matplotlib.pyplot as plt
+
+    # Try to import seaborn (optional)
     try:
-        plt.style.use('seaborn-darkgrid')
-    except:
+        import seaborn as sns
+    except ImportError:
+        sns = None
+
+    # Configure matplotlib for better plots
+    for style in ('seaborn-v0_8-darkgrid', 'seaborn-darkgrid', 'ggplot', 'default'):
         try:
-            plt.style.use('ggplot')
-        except:
-            plt.style.use('default')
-if HAS_SEABORN:
-    sns.set_palette("husl")
-plt.rcParams['figure.dpi'] = 100
+            plt.style.use(style)
+            break
+        except OSError:
+            continue
+    if sns is not None:
+        sns.set_palette("husl")
+    plt.rcParams['figure.dpi'] = 100
+
+    _PLOTTING = (plt, sns)
+    return _PLOTTING
 
 # Deadlines
 DEADLINES = {
@@ -69,11 +86,8 @@ def parse_submission_line(line):
     if not timestamp_str:
         return None
     
-    try:
-        timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
-        # Convert to naive datetime for easier comparison (assuming UTC)
-        timestamp = timestamp.replace(tzinfo=None)
-    except:
+    timestamp = parse_timestamp(timestamp_str)
+    if timestamp is None:
         return None
     
     return {
@@ -84,6 +98,56 @@ def parse_submission_line(line):
     }
 
 
+def parse_timestamp(timestamp_str):
+    """Parse an ISO 8601 timestamp ("2025-11-01T20:00:00Z") as a naive UTC datetime (None if invalid)."""
+    try:
+        timestamp = datetime.fromisoformat(timestamp_str.replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return None
+    # Convert to naive datetime for easier comparison (assuming UTC)
+    return timestamp.replace(tzinfo=None)
+
+
+# Fields of a pull request in a JSON export (e.g. gh pr list --json number,state,title,createdAt)
+PR_FIELDS = ('number', 'state', 'title', 'createdAt')
+
+
+def parse_pr_record(record):
+    """Parse one pull request object from a JSON export into the same dict as parse_submission_line."""
+    number, state, title, created_at = (record.get(field) for field in PR_FIELDS)
+    if number is None or not state or not title:
+        return None
+    timestamp = parse_timestamp(created_at)
+    if timestamp is None:
+        return None
+    return {
+        'id': str(number),
+        'status': state,
+        'title': title,
+        'timestamp': timestamp
+    }
+
+
+def iter_submissions(filepath):
+    """
+    Yield parsed submissions from a tab-separated file like subjects.txt or a JSON export
+    of pull requests (array or JSON Lines, streamed; see pr_json.py). The format is
+    detected from the first character of the file.
+    """
+    if pr_json.is_json_file(filepath):
+        with open(filepath, 'r', encoding='utf-8-sig') as f:
+            for record in pr_json.iter_json_records(f):
+                parsed = parse_pr_record(record)
+                if parsed:
+                    yield parsed
+    else:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            for line in f:
+                parsed = parse_submission_line(line)
+                if parsed:
+                    yield parsed
+
+
 def extract_assignment_days(title):
     """Extract assignment day(s) from title. Returns list of day keys."""
     title_lower = title.lower()
@@ -141,60 +205,175 @@ def normalize_student_name(name):
     return normalized
 
 
-def parse_data(filepath):
-    """Parse subjects.txt and create structured DataFrame."""
-    records = []
-    name_mapping = {}  # Map variations to normalized names
-    
-    with open(filepath, 'r', encoding='utf-8') as f:
-        for line in f:
-            parsed = parse_submission_line(line)
-            if not parsed:
-                continue
-            
-            title = parsed['title']
-            assignment_days = extract_assignment_days(title)
-            student_name_raw = extract_student_name(title)
-            
-            if not assignment_days or not student_name_raw:
-                continue
-            
-            # Normalize student name
-            student_name_normalized = normalize_student_name(student_name_raw)
-            name_mapping[student_name_raw] = student_name_normalized
-            
-            # Create a record for each assignment day (for combined submissions)
-            for day in assignment_days:
-                deadline = DEADLINES.get(day)
-                if deadline:
-                    hours_after_deadline = (parsed['timestamp'] - deadline).total_seconds() / 3600
-                    is_late = hours_after_deadline > 0
-                    
-                    records.append({
-                        'id': parsed['id'],
-                        'status': parsed['status'],
-                        'assignment_day': day,
-                        'student_name': student_name_normalized,
-                        'submission_time': parsed['timestamp'],
-                        'deadline': deadline,
-                        'hours_after_deadline': hours_after_deadline,
-                        'days_after_deadline': hours_after_deadline / 24,
-                        'is_late': is_late,
-                        'title_format': title,
-                        'hours_before_deadline': -hours_after_deadline if hours_after_deadline < 0 else 0
-                    })
-    
-    df = pd.DataFrame(records)
-    
-    # Store original title formats for analysis
-    if len(df) > 0:
-        df['title_format_pattern'] = df['title_format'].str.extract(r'^([Dd]ay\s*\d+|Final\s+[Pp]roject)', expand=False)
+# Assignment codes used while parsing (deadlines are looked up by code)
+ASSIGNMENTS = sorted(DEADLINES)
+ASSIGNMENT_CODES = {day: code for code, day in enumerate(ASSIGNMENTS)}
+DEADLINE_TIMES = np.array([DEADLINES[day] for day in ASSIGNMENTS], dtype='datetime64[us]')
+EPOCH = datetime(1970, 1, 1)
+ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+class _StringDictionary:
+    """Dictionary encoding for a string column: every distinct value is stored once."""
+
+    def __init__(self):
+        self.codes = {}
+        self.values = []
+
+    def encode(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def categorical(self, codes, sort=True):
+        """Categorical column from the codes (categories sorted, or in order of appearance)."""
+        codes = np.frombuffer(codes, dtype=np.int32)
+        if not sort:
+            return pd.Categorical.from_codes(codes, self.values)
+        order = sorted(range(len(self.values)), key=self.values.__getitem__)
+        new_codes = np.empty(len(order), dtype=np.int32)
+        new_codes[order] = np.arange(len(order), dtype=np.int32)
+        return pd.Categorical.from_codes(new_codes[codes], [self.values[i] for i in order])
+
+
+DEDUP_POLICIES = ('first', 'last', 'earliest_non_closed')
+
+
+def deduplicate_submissions(df, policy='last'):
+    """
+    Keep one submission per (student_name, assignment_day).
+
+    policy: 'first' (earliest submission), 'last' (latest submission) or
+    'earliest_non_closed' (earliest OPEN one; the earliest CLOSED one if none is open).
+    Done with one sort and one hash-based drop_duplicates; the original row order is kept.
+    Returns (deduplicated DataFrame, number of records collapsed).
+    """
+    if policy not in DEDUP_POLICIES:
+        raise ValueError(f"Unknown dedup policy: {policy} (choose from {', '.join(DEDUP_POLICIES)})")
+    if df.empty:
+        return df, 0
+
+    keys = ['student_name', 'assignment_day']
+    if policy == 'earliest_non_closed':
+        ordered = df.assign(_closed=df['status'] == 'CLOSED').sort_values(
+            keys + ['_closed', 'submission_time'], kind='stable')
+        keep = 'first'
+    else:
+        ordered = df.sort_values(keys + ['submission_time'], kind='stable')
+        keep = 'first' if policy == 'first' else 'last'
+
+    kept = ordered.drop_duplicates(subset=keys, keep=keep).sort_index()
+    return kept[df.columns], len(df) - len(kept)
+
+
+def read_submissions(filepath):
+    """
+    Read subjects.txt (or a JSON export of pull requests) into a DataFrame with one row per
+    submitted assignment (a combined "Day03 and Day04" PR gives two rows with the same id).
+    """
+    ids = []
+    day_codes = array('b')  # index into ASSIGNMENTS
+    status_codes = array('i')
+    student_codes = array('i')
+    title_codes = array('i')
+    timestamps = array('q')  # microseconds since 1970-01-01
+    hours = array('d')
+    statuses, students, titles = (_StringDictionary() for _ in range(3))
+    
+    for parsed in iter_submissions(filepath):
+        title = parsed['title']
+        assignment_days = extract_assignment_days(title)
+        student_name_raw = extract_student_name(title)
+        
+        if not assignment_days or not student_name_raw:
+            continue
+        
+        # Normalize student name
+        student_code = students.encode(normalize_student_name(student_name_raw))
+        status_code = statuses.encode(parsed['status'])
+        title_code = titles.encode(title)
+        timestamp = (parsed['timestamp'] - EPOCH) // ONE_MICROSECOND
+        
+        # Create a record for each assignment day (for combined submissions)
+        for day in assignment_days:
+            deadline = DEADLINES.get(day)
+            if deadline:
+                ids.append(parsed['id'])
+                day_codes.append(ASSIGNMENT_CODES[day])
+                status_codes.append(status_code)
+                student_codes.append(student_code)
+                title_codes.append(title_code)
+                timestamps.append(timestamp)
+                hours.append((parsed['timestamp'] - deadline).total_seconds() / 3600)
+    
+    if not ids:
+        return pd.DataFrame()
+    
+    # Hand the buffers to pandas without copying them
+    day_codes = np.frombuffer(day_codes, dtype=np.int8)
+    hours_after_deadline = np.frombuffer(hours, dtype=np.float64)
+    title_codes = np.frombuffer(title_codes, dtype=np.int32)
+    # Title format template, e.g. "Day{NN} by {Name}" (see title_formats.py)
+    classifier = TitleFormatClassifier()
+    title_templates = np.fromiter((classifier.template_id(t) for t in titles.values), dtype=np.int32)
+    
+    return pd.DataFrame({
+        'id': ids,
+        'status': statuses.categorical(status_codes),
+        'assignment_day': pd.Categorical.from_codes(day_codes, ASSIGNMENTS).remove_unused_categories(),
+        'student_name': students.categorical(student_codes),
+        'submission_time': np.frombuffer(timestamps, dtype='datetime64[us]'),
+        'deadline': DEADLINE_TIMES[day_codes],
+        'hours_after_deadline': hours_after_deadline,
+        'days_after_deadline': hours_after_deadline / 24,
+        'is_late': hours_after_deadline > 0,
+        'title_format': titles.categorical(title_codes, sort=False),
+        'hours_before_deadline': np.where(hours_after_deadline < 0, -hours_after_deadline, 0.0),
+        'title_format_pattern': pd.Categorical.from_codes(title_templates[title_codes], classifier.templates),
+    }, copy=False)
+
+
+def store_submissions(df, db_path):
+    """
+    Store the submissions in the SQLite database at db_path (see submission_store.py),
+    replacing the rows stored earlier from the same file (df.attrs['source']).
+    """
+    conn = submission_store.open_store(db_path)
+    try:
+        submission_store.upsert_submissions(conn, df, source=df.attrs.get('source'))
+    finally:
+        conn.close()
+
+
+def parse_data(filepath, db_path=None, dedup=None):
+    """
+    Parse subjects.txt (or a JSON export of pull requests) and create structured DataFrame.
+    With dedup (a policy from DEDUP_POLICIES), repeated submissions of a student for the same
+    assignment are collapsed; the number collapsed is in df.attrs['duplicates_collapsed'].
+    With db_path, the records are also stored in that SQLite database (see store_submissions),
+    so rows collapsed by dedup are removed from it too.
+    """
+    df = read_submissions(filepath)
+    
+    if dedup is not None:
+        df, collapsed = deduplicate_submissions(df, dedup)
+        df.attrs['duplicates_collapsed'] = collapsed
+    
+    df.attrs['source'] = str(Path(filepath).resolve())
+    if db_path is not None:
+        store_submissions(df, db_path)
     
     return df
 
 
-def generate_missing_submissions_report(df):
-    """Generate report of students who haven't submitted each assignment."""
+# With conn, the four reports below are SQL queries on the rows stored from df's data file
+# (df.attrs['source']), so they describe the same submissions as df.
+def generate_missing_submissions_report(df, conn=None):
+    """Generate report of students who haven't submitted each assignment (from SQLite if conn is given)."""
+    if conn is not None:
+        return submission_store.missing_submissions(conn, sorted(DEADLINES.keys()), df.attrs.get('source'))
     if df.empty:
         return pd.DataFrame()
     
@@ -218,15 +397,19 @@ def generate_missing_submissions_report(df):
     return missing_df
 
 
-def generate_late_submissions_report(df):
-    """Generate report of late submissions."""
+def generate_late_submissions_report(df, conn=None):
+    """Generate report of late submissions (from SQLite if conn is given)."""
+    if conn is not None:
+        return submission_store.late_submissions(conn, df.attrs.get('source'))
     late_df = df[df['is_late'] == True].copy()
     late_df = late_df.sort_values(['assignment_day', 'hours_after_deadline'], ascending=[True, False])
     return late_df
 
 
-def generate_format_popularity_report(df):
-    """Analyze title format popularity."""
+def generate_format_popularity_report(df, conn=None):
+    """Analyze title format popularity (from SQLite if conn is given)."""
+    if conn is not None:
+        return submission_store.format_popularity(conn, df.attrs.get('source'))
     if df.empty:
         return pd.DataFrame()
     
@@ -236,8 +419,71 @@ def generate_format_popularity_report(df):
     return format_counts
 
 
+def generate_statistics_by_assignment(df, conn=None):
+    """Per-assignment submission counts and hours after deadline (from SQLite if conn is given)."""
+    if conn is not None:
+        return submission_store.statistics_by_assignment(conn, df.attrs.get('source'))
+    stats = df.groupby('assignment_day', observed=True).agg({
+        'id': 'count',
+        'is_late': 'sum',
+        'hours_after_deadline': ['mean', 'median', 'min', 'max']
+    }).reset_index()
+    stats.columns = ['assignment_day', 'total_submissions', 'late_count', 
+                     'avg_hours_after_deadline', 'median_hours_after_deadline',
+                     'min_hours_after_deadline', 'max_hours_after_deadline']
+    stats['on_time_count'] = stats['total_submissions'] - stats['late_count']
+    stats['late_percentage'] = (stats['late_count'] / stats['total_submissions'] * 100).round(2)
+    return stats
+
+
+# Heatmap bins: hours after the deadline (12-hour bins from one week before to one week
+# after; earlier/later submissions are counted in the first/last bin) x hour of the week (UTC)
+HOURS_BIN_WIDTH = 12
+HOURS_BIN_EDGES = np.arange(-168, 168 + HOURS_BIN_WIDTH, HOURS_BIN_WIDTH)
+HOURS_PER_WEEK = 7 * 24
+WEEKDAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+EPOCH_WEEKDAY = 3  # 1970-01-01 was a Thursday
+
+
+def submission_heatmap_counts(df):
+    """
+    Count submissions per (assignment, hours-after-deadline bin, hour of the week).
+
+    Every row gets one integer cell code and the cells are counted with a single
+    np.bincount, so millions of records take well under a second.
+    Returns (counts with shape (assignments, hour bins, 168), assignment names).
+    """
+    assignment_codes, assignments = pd.factorize(df['assignment_day'], sort=True)
+    n_bins = len(HOURS_BIN_EDGES) - 1
+    hours = df['hours_after_deadline'].to_numpy(dtype=np.float64)
+    hour_bins = np.clip((hours - HOURS_BIN_EDGES[0]) // HOURS_BIN_WIDTH, 0, n_bins - 1).astype(np.intp)
+    epoch_hours = df['submission_time'].to_numpy().astype('datetime64[h]').astype(np.int64)
+    hour_of_week = (epoch_hours + EPOCH_WEEKDAY * 24) % HOURS_PER_WEEK
+    
+    cells = (assignment_codes * n_bins + hour_bins) * HOURS_PER_WEEK + hour_of_week
+    shape = (len(assignments), n_bins, HOURS_PER_WEEK)
+    counts = np.bincount(cells, minlength=int(np.prod(shape))).reshape(shape)
+    return counts, [str(day) for day in assignments]
+
+
+def generate_submission_heatmap(df):
+    """Non-empty heatmap cells as a table (assignment, hours-after-deadline bin, weekday, hour, count)."""
+    counts, assignments = submission_heatmap_counts(df)
+    assignment_idx, bin_idx, hour_of_week = np.nonzero(counts)
+    return pd.DataFrame({
+        'assignment_day': np.asarray(assignments, dtype=object)[assignment_idx],
+        'hours_after_deadline_from': HOURS_BIN_EDGES[bin_idx],
+        'hours_after_deadline_to': HOURS_BIN_EDGES[bin_idx + 1],
+        'hour_of_week': hour_of_week,
+        'weekday': np.asarray(WEEKDAYS, dtype=object)[hour_of_week // 24],
+        'hour': hour_of_week % 24,
+        'count': counts[assignment_idx, bin_idx, hour_of_week],
+    })
+
+
 def create_visualizations(df, output_dir):
     """Create all visualizations and save them."""
+    plt, sns = _setup_plotting()
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     
@@ -246,7 +492,7 @@ def create_visualizations(df, output_dir):
     # 1. Bar plot: Total submissions per day (colorful)
     plt.figure(fig_count, figsize=(12, 6))
     fig_count += 1
-    submissions_per_day = df.groupby('assignment_day').size().reset_index(name='count')
+    submissions_per_day = df.groupby('assignment_day', observed=True).size().reset_index(name='count')
     submissions_per_day = submissions_per_day.sort_values('assignment_day')
     
     x = range(len(submissions_per_day))
@@ -270,7 +516,7 @@ def create_visualizations(df, output_dir):
     # 2. Bar plot: On-time vs Late submissions per day
     plt.figure(fig_count, figsize=(12, 6))
     fig_count += 1
-    late_by_assignment = df.groupby('assignment_day').agg({
+    late_by_assignment = df.groupby('assignment_day', observed=True).agg({
         'is_late': ['sum', 'count']
     }).reset_index()
     late_by_assignment.columns = ['assignment_day', 'late_count', 'total_count']
@@ -305,34 +551,21 @@ def create_visualizations(df, output_dir):
     # 3. Day vs Night Owl: Submission hour analysis
     plt.figure(fig_count, figsize=(12, 6))
     fig_count += 1
-    # Extract hour from submission time
-    df['submission_hour'] = df['submission_time'].dt.hour
-    
-    # Categorize as Day (6-18) or Night (19-5)
-    def categorize_time(hour):
-        if 6 <= hour < 19:
-            return 'Day (6 AM - 6 PM)'
-        else:
-            return 'Night (7 PM - 5 AM)'
-    
-    df['time_category'] = df['submission_hour'].apply(categorize_time)
-    
-    # Group by assignment day and time category
-    time_analysis = df.groupby(['assignment_day', 'time_category']).size().unstack(fill_value=0)
-    time_analysis = time_analysis.reindex(sorted(time_analysis.index))
+    # Day (6 AM - 6 PM) / night counts per assignment from the binned counts
+    heatmap_counts, assignments = submission_heatmap_counts(df)
+    counts_by_hour = heatmap_counts.sum(axis=1)  # (assignments, hour of week)
+    hour_of_day = np.arange(HOURS_PER_WEEK) % 24
+    daytime = (hour_of_day >= 6) & (hour_of_day < 19)
+    time_analysis = pd.DataFrame({
+        'Day (6 AM - 6 PM)': counts_by_hour[:, daytime].sum(axis=1),
+        'Night (7 PM - 5 AM)': counts_by_hour[:, ~daytime].sum(axis=1),
+    }, index=assignments)
     
     x = range(len(time_analysis))
     width = 0.6
     
-    if 'Day (6 AM - 6 PM)' in time_analysis.columns:
-        day_counts = time_analysis['Day (6 AM - 6 PM)'].values
-    else:
-        day_counts = [0] * len(time_analysis)
-    
-    if 'Night (7 PM - 5 AM)' in time_analysis.columns:
-        night_counts = time_analysis['Night (7 PM - 5 AM)'].values
-    else:
-        night_counts = [0] * len(time_analysis)
+    day_counts = time_analysis['Day (6 AM - 6 PM)'].values
+    night_counts = time_analysis['Night (7 PM - 5 AM)'].values
     
     bars1 = plt.bar(x, day_counts, width, label='Day (6 AM - 6 PM)', color='#f39c12', alpha=0.8, edgecolor='black')
     bars2 = plt.bar(x, night_counts, width, bottom=day_counts, label='Night (7 PM - 5 AM)', 
@@ -381,7 +614,7 @@ def create_visualizations(df, output_dir):
         plt.plot(x_kde, y_kde, 'b-', linewidth=2.5, color='#2980b9')
     except ImportError:
         # If scipy not available, use seaborn or fallback to simple histogram density
-        if HAS_SEABORN:
+        if sns is not None:
             sns.histplot(df['hours_after_deadline'], bins=50, kde=True, alpha=0.6, 
                         stat='density', color='#3498db', edgecolor=None, fill=True)
         else:
@@ -461,11 +694,38 @@ def create_visualizations(df, output_dir):
     plt.savefig(output_dir / '6_open_vs_closed.png', dpi=300, bbox_inches='tight')
     plt.show()
     
+    # 7. Heatmap: hours after deadline x hour of the week, one panel per assignment
+    n_cols = min(4, len(assignments))
+    n_rows = -(-len(assignments) // n_cols)
+    fig, axes = plt.subplots(n_rows, n_cols, figsize=(4.5 * n_cols, 3.5 * n_rows), squeeze=False,
+                             sharex=True, sharey=True, num=fig_count)
+    fig_count += 1
+    # 4-hour blocks on the x axis so single submissions stay visible
+    blocks = heatmap_counts.reshape(*heatmap_counts.shape[:2], HOURS_PER_WEEK // 4, 4).sum(axis=3)
+    vmax = max(int(blocks.max()), 1)
+    extent = (0, HOURS_PER_WEEK, HOURS_BIN_EDGES[0], HOURS_BIN_EDGES[-1])
+    for ax, assignment, assignment_counts in zip(axes.flat, assignments, blocks):
+        image = ax.imshow(assignment_counts, origin='lower', aspect='auto', extent=extent,
+                          cmap='YlOrRd', vmin=0, vmax=vmax, interpolation='nearest')
+        ax.axhline(0, color='black', linestyle='--', linewidth=1)
+        ax.set_title(assignment.replace('_', ' ').title(), fontsize=11, fontweight='bold')
+        ax.set_xticks(np.arange(0, HOURS_PER_WEEK, 24) + 12)
+        ax.set_xticklabels(WEEKDAYS, fontsize=8)
+        ax.grid(False)
+    for ax in axes.flat[len(assignments):]:
+        ax.set_visible(False)
+    for ax in axes[:, 0]:
+        ax.set_ylabel('Hours After Deadline', fontsize=10)
+    fig.colorbar(image, ax=axes, label='Number of Submissions', shrink=0.8)
+    fig.suptitle('Submission Time: Hours After Deadline vs Hour of the Week (UTC)', fontsize=13, fontweight='bold')
+    fig.savefig(output_dir / '7_submission_heatmap.png', dpi=300, bbox_inches='tight')
+    plt.show()
+    
     print(f"\n✓ All visualizations saved to: {output_dir}")
     print(f"✓ {fig_count - 1} plots generated and displayed")
 
 
-def generate_text_reports(df, output_dir):
+def generate_text_reports(df, output_dir, conn=None):
     """Generate text-based reports."""
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -501,7 +761,7 @@ def generate_text_reports(df, output_dir):
             reports.append(f"  Maximum Days Late: {max_late:.1f}")
     
     # Missing Submissions
-    missing_df = generate_missing_submissions_report(df)
+    missing_df = generate_missing_submissions_report(df, conn)
     if not missing_df.empty:
         reports.append("\n" + "=" * 80)
         reports.append("MISSING SUBMISSIONS")
@@ -514,7 +774,7 @@ def generate_text_reports(df, output_dir):
                     reports.append(f"  - {row['student_name']}")
     
     # Late Submissions Details
-    late_df = generate_late_submissions_report(df)
+    late_df = generate_late_submissions_report(df, conn)
     if not late_df.empty:
         reports.append("\n" + "=" * 80)
         reports.append("LATE SUBMISSIONS DETAILS")
@@ -526,7 +786,7 @@ def generate_text_reports(df, output_dir):
                 reports.append(f"  - {row['student_name']}: {row['days_after_deadline']:.1f} days late")
     
     # Format Popularity
-    format_df = generate_format_popularity_report(df)
+    format_df = generate_format_popularity_report(df, conn)
     if not format_df.empty:
         reports.append("\n" + "=" * 80)
         reports.append("TITLE FORMAT POPULARITY")
@@ -552,43 +812,39 @@ def generate_text_reports(df, output_dir):
     return report_text
 
 
-def save_data_reports(df, output_dir):
-    """Save data reports as CSV files."""
+def save_data_reports(df, output_dir, conn=None):
+    """Save data reports as CSV files (the four reports come from SQLite if conn is given)."""
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
     
     # Missing submissions
-    missing_df = generate_missing_submissions_report(df)
+    missing_df = generate_missing_submissions_report(df, conn)
     if not missing_df.empty:
         missing_df.to_csv(output_dir / 'missing_submissions.csv', index=False)
         print(f"✓ Saved: {output_dir / 'missing_submissions.csv'}")
     
     # Late submissions
-    late_df = generate_late_submissions_report(df)
+    late_df = generate_late_submissions_report(df, conn)
     if not late_df.empty:
         late_df.to_csv(output_dir / 'late_submissions.csv', index=False)
         print(f"✓ Saved: {output_dir / 'late_submissions.csv'}")
     
     # Format popularity
-    format_df = generate_format_popularity_report(df)
+    format_df = generate_format_popularity_report(df, conn)
     if not format_df.empty:
         format_df.to_csv(output_dir / 'format_popularity.csv', index=False)
         print(f"✓ Saved: {output_dir / 'format_popularity.csv'}")
     
     # Statistics by assignment
-    stats = df.groupby('assignment_day').agg({
-        'id': 'count',
-        'is_late': 'sum',
-        'hours_after_deadline': ['mean', 'median', 'min', 'max']
-    }).reset_index()
-    stats.columns = ['assignment_day', 'total_submissions', 'late_count', 
-                     'avg_hours_after_deadline', 'median_hours_after_deadline',
-                     'min_hours_after_deadline', 'max_hours_after_deadline']
-    stats['on_time_count'] = stats['total_submissions'] - stats['late_count']
-    stats['late_percentage'] = (stats['late_count'] / stats['total_submissions'] * 100).round(2)
+    stats = generate_statistics_by_assignment(df, conn)
     stats.to_csv(output_dir / 'statistics_by_assignment.csv', index=False)
     print(f"✓ Saved: {output_dir / 'statistics_by_assignment.csv'}")
     
+    # Submission time heatmap (hours after deadline x hour of the week)
+    heatmap_df = generate_submission_heatmap(df)
+    heatmap_df.to_csv(output_dir / 'submission_heatmap.csv', index=False)
+    print(f"✓ Saved: {output_dir / 'submission_heatmap.csv'}")
+    
     # Save statistics as JSON (as per plan)
     stats_dict = stats.to_dict('records')
     # Convert numpy types to native Python types for JSON serialization
@@ -619,11 +875,34 @@ def save_data_reports(df, output_dir):
     print(f"✓ Saved: {output_dir / 'submission_statistics.json'}")
 
 
-def main():
+def parse_args(argv=None):
+    """Parse command line options."""
+    here = Path(__file__).parent
+    parser = argparse.ArgumentParser(description="Analyze assignment submissions and write reports and plots.")
+    parser.add_argument('--data', type=Path, default=here / 'subjects.txt',
+                        help="Submission data: tab-separated like subjects.txt, or a JSON export of pull requests "
+                             "with number, state, title and createdAt (default: subjects.txt next to this script)")
+    parser.add_argument('--output', type=Path, default=here / 'analysis',
+                        help="Output directory (default: analysis/ next to this script)")
+    parser.add_argument('--no-plots', '--stats-only', dest='plots', action='store_false',
+                        help="Only write the text/CSV/JSON reports; matplotlib is not loaded")
+    parser.add_argument('--dedup', choices=DEDUP_POLICIES,
+                        help="Keep one submission per student and assignment: the first, the last, "
+                             "or the earliest one that is not CLOSED (default: keep all)")
+    parser.add_argument('--db', type=Path,
+                        help="Also store the submissions in this SQLite database and build the reports with SQL")
+    parser.add_argument('--report-cards', type=Path, metavar='PATH',
+                        help="Write a report card per student into this directory, "
+                             "or into a .zip/.tar/.tar.gz archive")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Main function to run the analysis."""
+    args = parse_args(argv)
     # File paths
-    data_file = Path(__file__).parent / 'subjects.txt'
-    output_dir = Path(__file__).parent / 'analysis'
+    data_file = args.data
+    output_dir = args.output
     
     print("=" * 80)
     print("ASSIGNMENT SUBMISSION ANALYZER")
@@ -631,38 +910,52 @@ def main():
     print(f"\nReading data from: {data_file}")
     
     # Parse data
-    df = parse_data(data_file)
+    df = parse_data(data_file, db_path=args.db, dedup=args.dedup)
     
     if df.empty:
         print("ERROR: No data parsed. Please check the file format.")
         return
     
     print(f"✓ Parsed {len(df)} submission records")
+    if args.dedup:
+        print(f"✓ Collapsed {df.attrs['duplicates_collapsed']} duplicate submissions (policy: {args.dedup})")
     print(f"✓ Found {df['student_name'].nunique()} unique students")
     print(f"✓ Found {df['assignment_day'].nunique()} unique assignments")
     
     # Create output directory
     output_dir.mkdir(parents=True, exist_ok=True)
     (output_dir / 'reports').mkdir(parents=True, exist_ok=True)
-    (output_dir / 'plots').mkdir(parents=True, exist_ok=True)
+    if args.plots:
+        (output_dir / 'plots').mkdir(parents=True, exist_ok=True)
     
-    print(f"\nGenerating reports...")
-    # summary_report.txt should be in analysis/ root, not in reports/
-    generate_text_reports(df, output_dir / 'reports')
+    conn = submission_store.open_store(args.db) if args.db else None
+    try:
+        print(f"\nGenerating reports...")
+        # summary_report.txt should be in analysis/ root, not in reports/
+        generate_text_reports(df, output_dir / 'reports', conn)
+        
+        print(f"\nSaving data reports...")
+        save_data_reports(df, output_dir / 'reports', conn)
+    finally:
+        if conn is not None:
+            conn.close()
     
-    print(f"\nSaving data reports...")
-    save_data_reports(df, output_dir / 'reports')
+    if args.report_cards:
+        count = report_cards.write_report_cards(df, args.report_cards, ASSIGNMENTS)
+        print(f"✓ Saved {count} report cards to: {args.report_cards}")
     
-    print(f"\nGenerating visualizations...")
-    print("Note: Plots will be displayed in separate windows and saved to disk.")
-    create_visualizations(df, output_dir / 'plots')
+    if args.plots:
+        print(f"\nGenerating visualizations...")
+        print("Note: Plots will be displayed in separate windows and saved to disk.")
+        create_visualizations(df, output_dir / 'plots')
     
     print(f"\n" + "=" * 80)
     print("ANALYSIS COMPLETE!")
     print("=" * 80)
     print(f"\nAll outputs saved to: {output_dir}")
     print(f"  - Reports: {output_dir / 'reports'}")
-    print(f"  - Plots: {output_dir / 'plots'}")
+    if args.plots:
+        print(f"  - Plots: {output_dir / 'plots'}")
 
 
 if __name__ == '__main__':
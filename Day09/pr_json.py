@@ -0,0 +1,89 @@
+"""
+Streaming reader for JSON exports of pull requests.
+
+Accepts the output of a PR listing export such as
+
+    gh pr list --state all --limit 10000 --json number,state,title,createdAt > prs.json
+
+i.e. a JSON array of objects, as well as JSON Lines (one object per line) or
+several arrays one after the other (paged exports). The file is read in
+chunks and decoded one object at a time with json.JSONDecoder.raw_decode, so
+only the current chunk and object are in memory, however large the export is.
+"""
+
+import json
+import re
+
+CHUNK_SIZE = 1 << 16
+# Largest record (in characters) kept in memory while waiting for its end
+MAX_RECORD_SIZE = 1 << 24
+# A decode error this close to the end of the buffer may just be a cut literal (e.g. "tru")
+_CUT_MARGIN = 16
+# Whitespace and the commas between array elements / JSON Lines
+_SEPARATORS = re.compile(r'[\s,]*')
+
+
+def _needs_more_input(exc, buffer):
+    """True if a decode error may be caused by the buffer ending in the middle of a value."""
+    return exc.msg.startswith('Unterminated string') or exc.pos >= len(buffer) - _CUT_MARGIN
+
+
+def iter_json_records(stream, chunk_size=CHUNK_SIZE, max_record_size=MAX_RECORD_SIZE):
+    """
+    Yield the top-level objects (or the objects of top-level arrays) of a text stream.
+
+    Raises ValueError as soon as the input is invalid, or if a single record is
+    longer than max_record_size characters, so a broken export is not read to the end.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    in_array = False
+    eof = False
+    while True:
+        pos = _SEPARATORS.match(buffer, pos).end()
+        if pos < len(buffer):
+            char = buffer[pos]
+            if char == '[' and not in_array:
+                in_array = True
+                pos += 1
+                continue
+            if char == ']' and in_array:
+                in_array = False
+                pos += 1
+                continue
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError as exc:
+                if eof or not _needs_more_input(exc, buffer):
+                    raise ValueError(f"Invalid JSON: {exc}") from exc
+                end = None
+            # A value that ends at the end of the buffer may be cut short (e.g. a number)
+            if end is not None and (end < len(buffer) or eof):
+                if not isinstance(value, dict):
+                    raise ValueError(f"Expected a JSON object, got {type(value).__name__}")
+                pos = end
+                yield value
+                continue
+        elif eof:
+            if in_array:
+                raise ValueError("Invalid JSON: unexpected end of input (unclosed array)")
+            return
+
+        # Need more input: keep the unread part and append the next chunk. Reading at
+        # least as much as is pending doubles the buffer for long records, so the
+        # copies stay linear in the record size.
+        pending = len(buffer) - pos
+        if pending > max_record_size:
+            raise ValueError(f"JSON record longer than {max_record_size} characters")
+        chunk = stream.read(max(chunk_size, pending))
+        eof = not chunk
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+
+def is_json_file(filepath):
+    """True if the file starts (after whitespace) with '[' or '{'."""
+    with open(filepath, 'r', encoding='utf-8-sig') as f:
+        start = f.read(256).lstrip()
+    return start[:1] in ('[', '{')
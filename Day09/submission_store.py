@@ -0,0 +1,196 @@
+"""
+SQLite store for parsed submissions.
+
+parse_data() can upsert its records into a local database, so the data is kept
+between runs and can be queried directly (several readers at once, thanks to
+WAL mode). Every row records the data file it came from (source), and storing
+a file again replaces all of that file's rows. The missing, late, format and
+per-assignment statistics reports are available as SQL queries (for one
+source, or all rows) that return the same tables as the pandas versions in
+assignment_analyzer.py.
+"""
+
+import sqlite3
+
+import pandas as pd
+
+COLUMNS = [
+    'id', 'status', 'assignment_day', 'student_name', 'submission_time', 'deadline',
+    'hours_after_deadline', 'days_after_deadline', 'is_late', 'title_format',
+    'hours_before_deadline', 'title_format_pattern',
+]
+
+# A PR that covers several assignments ("Day03 and Day04") has one row per
+# assignment, so the key is (id, assignment_day) rather than id alone.
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS submissions (
+    id TEXT NOT NULL,
+    status TEXT,
+    assignment_day TEXT NOT NULL,
+    student_name TEXT,
+    submission_time TEXT,
+    deadline TEXT,
+    hours_after_deadline REAL,
+    days_after_deadline REAL,
+    is_late INTEGER,
+    title_format TEXT,
+    hours_before_deadline REAL,
+    title_format_pattern TEXT,
+    source TEXT,
+    PRIMARY KEY (id, assignment_day)
+);
+"""
+
+INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_submissions_assignment_student
+    ON submissions (assignment_day, student_name);
+CREATE INDEX IF NOT EXISTS idx_submissions_time ON submissions (submission_time);
+CREATE INDEX IF NOT EXISTS idx_submissions_source ON submissions (source);
+"""
+
+# Restricts a query to one source; with source NULL all rows are used
+SOURCE_FILTER = "(:source IS NULL OR source = :source)"
+
+
+def open_store(db_path):
+    """Open (and create if needed) the submission database."""
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    # Databases created before the source column existed
+    if 'source' not in {row[1] for row in conn.execute("PRAGMA table_info(submissions)")}:
+        conn.execute("ALTER TABLE submissions ADD COLUMN source TEXT")
+    conn.executescript(INDEXES)
+    return conn
+
+
+def _to_sql_value(value):
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return str(value)
+    if hasattr(value, 'item'):  # numpy scalars
+        return value.item()
+    return value
+
+
+def upsert_submissions(conn, df, source=None):
+    """
+    Insert parsed submissions, replacing rows with the same (id, assignment_day).
+    With source (e.g. the data file path), the rows stored earlier for that source are
+    deleted in the same transaction, so the database holds exactly this parse of it
+    (including submissions collapsed by deduplication or removed from the file).
+    """
+    rows = [
+        tuple(_to_sql_value(value) for value in row) + (source,)
+        for row in df.reindex(columns=COLUMNS).itertuples(index=False, name=None)
+    ]
+    columns = COLUMNS + ['source']
+    placeholders = ", ".join("?" for _ in columns)
+    updates = ", ".join(f"{col} = excluded.{col}" for col in columns if col not in ('id', 'assignment_day'))
+    with conn:
+        if source is not None:
+            conn.execute("DELETE FROM submissions WHERE source = ?", (source,))
+        conn.executemany(
+            f"INSERT INTO submissions ({', '.join(columns)}) VALUES ({placeholders}) "
+            f"ON CONFLICT (id, assignment_day) DO UPDATE SET {updates}",
+            rows,
+        )
+    return len(rows)
+
+
+def _typed(df):
+    """Give columns read from SQLite the same types as parse_data's DataFrame."""
+    for col in ('submission_time', 'deadline'):
+        if col in df:
+            df[col] = pd.to_datetime(df[col])
+    if 'is_late' in df:
+        df['is_late'] = df['is_late'].astype(bool)
+    return df
+
+
+def load_submissions(conn, source=None):
+    """Read the stored submissions (of one source, or all) as a DataFrame (in insertion order)."""
+    query = f"SELECT {', '.join(COLUMNS)} FROM submissions WHERE {SOURCE_FILTER} ORDER BY rowid"
+    return _typed(pd.read_sql_query(query, conn, params={'source': source}))
+
+
+def missing_submissions(conn, assignments, source=None):
+    """Every student x assignment with submitted/missing flags (sorted by assignment, then student)."""
+    values = ", ".join(f"(:a{i})" for i in range(len(assignments)))
+    query = f"""
+        WITH assignments(assignment_day) AS (VALUES {values}),
+             current AS (SELECT assignment_day, student_name FROM submissions WHERE {SOURCE_FILTER}),
+             students AS (SELECT DISTINCT student_name FROM current)
+        SELECT a.assignment_day, s.student_name,
+               EXISTS (SELECT 1 FROM current x
+                       WHERE x.assignment_day = a.assignment_day AND x.student_name = s.student_name) AS submitted
+        FROM assignments a CROSS JOIN students s
+        ORDER BY a.assignment_day, s.student_name
+    """
+    params = {f"a{i}": assignment for i, assignment in enumerate(assignments)}
+    params['source'] = source
+    df = pd.read_sql_query(query, conn, params=params)
+    if df.empty:
+        return pd.DataFrame()
+    df['submitted'] = df['submitted'].astype(bool)
+    df['missing'] = ~df['submitted']
+    return df
+
+
+def late_submissions(conn, source=None):
+    """Late submissions, by assignment and most hours late first."""
+    query = f"""
+        SELECT {', '.join(COLUMNS)} FROM submissions
+        WHERE is_late = 1 AND {SOURCE_FILTER}
+        ORDER BY assignment_day, hours_after_deadline DESC, rowid
+    """
+    return _typed(pd.read_sql_query(query, conn, params={'source': source}))
+
+
+def format_popularity(conn, source=None):
+    """Count and percentage of submissions per title format pattern."""
+    query = f"""
+        SELECT title_format_pattern AS format_pattern, COUNT(*) AS count,
+               ROUND(COUNT(*) * 100.0 / (SELECT COUNT(*) FROM submissions WHERE {SOURCE_FILTER}), 2) AS percentage
+        FROM submissions
+        WHERE title_format_pattern IS NOT NULL AND {SOURCE_FILTER}
+        GROUP BY title_format_pattern
+        ORDER BY count DESC, MIN(rowid)
+    """
+    df = pd.read_sql_query(query, conn, params={'source': source})
+    return df if not df.empty else pd.DataFrame()
+
+
+def statistics_by_assignment(conn, source=None):
+    """Per-assignment counts and hours-after-deadline statistics (median via window functions)."""
+    query = f"""
+        WITH current AS (SELECT * FROM submissions WHERE {SOURCE_FILTER}),
+        ranked AS (
+            SELECT assignment_day, hours_after_deadline,
+                   ROW_NUMBER() OVER (PARTITION BY assignment_day ORDER BY hours_after_deadline) AS position,
+                   COUNT(*) OVER (PARTITION BY assignment_day) AS n
+            FROM current
+            WHERE hours_after_deadline IS NOT NULL
+        ),
+        medians AS (
+            SELECT assignment_day, AVG(hours_after_deadline) AS median_hours_after_deadline
+            FROM ranked
+            WHERE position IN ((n + 1) / 2, (n + 2) / 2)
+            GROUP BY assignment_day
+        )
+        SELECT s.assignment_day,
+               COUNT(s.id) AS total_submissions,
+               SUM(s.is_late) AS late_count,
+               AVG(s.hours_after_deadline) AS avg_hours_after_deadline,
+               m.median_hours_after_deadline,
+               MIN(s.hours_after_deadline) AS min_hours_after_deadline,
+               MAX(s.hours_after_deadline) AS max_hours_after_deadline
+        FROM current s LEFT JOIN medians m ON m.assignment_day = s.assignment_day
+        GROUP BY s.assignment_day
+        ORDER BY s.assignment_day
+    """
+    stats = pd.read_sql_query(query, conn, params={'source': source})
+    stats['on_time_count'] = stats['total_submissions'] - stats['late_count']
+    stats['late_percentage'] = (stats['late_count'] / stats['total_submissions'] * 100).round(2)
+    return stats
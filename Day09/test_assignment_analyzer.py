@@ -0,0 +1,119 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import assignment_analyzer as aa
+
+HERE = Path(__file__).parent
+# Modules that must only be imported when plots are made
+PLOTTING_MODULES = ("matplotlib", "matplotlib.pyplot", "seaborn", "scipy")
+
+SAMPLE = (
+    "1\tCLOSED\tDay01 by Ada Lovelace\t\t2025-11-01T20:00:00Z\n"
+    "2\tOPEN\tday 02 by ada lovelace\t\t2025-11-10T22:00:00Z\n"
+    "3\tCLOSED\tDay03 and Day04 by Alan Turing\t\t2025-11-16T21:00:00Z\n"
+    "4\tOPEN\tNo assignment here\t\t2025-11-16T21:00:00Z\n"
+)
+
+
+def run_python(code):
+    result = subprocess.run([sys.executable, "-c", code], cwd=HERE, capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+def test_import_does_not_load_plotting_libraries():
+    output = run_python(
+        "import sys\n"
+        "import assignment_analyzer\n"
+        f"print(','.join(m for m in {PLOTTING_MODULES!r} if m in sys.modules))\n"
+    )
+    assert output == ""
+
+
+def test_stats_only_run_never_imports_matplotlib(tmp_path):
+    data = tmp_path / "subjects.txt"
+    data.write_text(SAMPLE, encoding="utf-8")
+    output = run_python(
+        "import io, sys, contextlib\n"
+        "import assignment_analyzer\n"
+        "with contextlib.redirect_stdout(io.StringIO()):\n"
+        f"    assignment_analyzer.main(['--no-plots', '--data', {str(data)!r}, '--output', {str(tmp_path / 'out')!r}])\n"
+        f"print(','.join(m for m in {PLOTTING_MODULES!r} if m in sys.modules))\n"
+    )
+    assert output == ""
+    assert (tmp_path / "out" / "summary_report.txt").exists()
+    assert not (tmp_path / "out" / "plots").exists()
+    stats = json.loads((tmp_path / "out" / "reports" / "submission_statistics.json").read_text())
+    assert stats["overall_statistics"]["total_submissions"] == 4
+
+
+def test_parse_data_splits_combined_submissions(tmp_path):
+    data = tmp_path / "subjects.txt"
+    data.write_text(SAMPLE, encoding="utf-8")
+    df = aa.parse_data(data)
+    assert df["assignment_day"].tolist() == ["day01", "day02", "day03", "day04"]
+    assert df["student_name"].tolist() == ["Ada Lovelace", "Ada Lovelace", "Alan Turing", "Alan Turing"]
+    assert df["is_late"].tolist() == [False, True, False, False]
+    assert df["hours_after_deadline"].tolist()[:2] == [-2.0, 24.0]
+
+
+DUPLICATES = (
+    "1\tCLOSED\tDay01 by Ada Lovelace\t\t2025-11-01T10:00:00Z\n"
+    "2\tOPEN\tDay01 by ada lovelace\t\t2025-11-01T12:00:00Z\n"
+    "3\tCLOSED\tDay01 by Ada Lovelace\t\t2025-11-01T23:00:00Z\n"
+    "4\tOPEN\tDay02 by Ada Lovelace\t\t2025-11-09T20:00:00Z\n"
+    "5\tCLOSED\tDay01 by Alan Turing\t\t2025-11-01T09:00:00Z\n"
+)
+
+
+def dedup_ids(tmp_path, policy):
+    data = tmp_path / "subjects.txt"
+    data.write_text(DUPLICATES, encoding="utf-8")
+    df = aa.parse_data(data, dedup=policy)
+    return df["id"].tolist(), df.attrs["duplicates_collapsed"]
+
+
+def test_deduplicate_policies(tmp_path):
+    assert dedup_ids(tmp_path, "first") == (["1", "4", "5"], 2)
+    assert dedup_ids(tmp_path, "last") == (["3", "4", "5"], 2)
+    assert dedup_ids(tmp_path, "earliest_non_closed") == (["2", "4", "5"], 2)
+
+
+def test_deduplicate_unknown_policy(tmp_path):
+    with pytest.raises(ValueError):
+        dedup_ids(tmp_path, "random")
+
+
+def test_parse_data_uses_categorical_columns(tmp_path):
+    data = tmp_path / "subjects.txt"
+    data.write_text(SAMPLE, encoding="utf-8")
+    df = aa.parse_data(data)
+    for col in ("status", "assignment_day", "student_name", "title_format", "title_format_pattern"):
+        assert df[col].dtype == "category"
+    assert list(df["assignment_day"].cat.categories) == ["day01", "day02", "day03", "day04"]
+    # Ids are unique per PR and stored as plain strings; a combined submission has one id for both rows
+    assert df["id"].tolist() == ["1", "2", "3", "3"] and pd.api.types.is_string_dtype(df["id"])
+    assert str(df["submission_time"].dtype).startswith("datetime64")
+    assert df["hours_before_deadline"].tolist() == [2.0, 0.0, 1.0, 169.0]
+
+
+def test_submission_heatmap_counts(tmp_path):
+    data = tmp_path / "subjects.txt"
+    data.write_text(SAMPLE, encoding="utf-8")
+    df = aa.parse_data(data)
+    counts, assignments = aa.submission_heatmap_counts(df)
+    assert assignments == ["day01", "day02", "day03", "day04"]
+    assert counts.shape == (4, len(aa.HOURS_BIN_EDGES) - 1, aa.HOURS_PER_WEEK)
+    assert counts.sum() == len(df)
+    # 2025-11-01 20:00 UTC was a Saturday; 2 hours before the deadline
+    heatmap = aa.generate_submission_heatmap(df)
+    first = heatmap[heatmap["assignment_day"] == "day01"].iloc[0]
+    assert (first["weekday"], first["hour"], first["hour_of_week"]) == ("Sat", 20, 5 * 24 + 20)
+    assert (first["hours_after_deadline_from"], first["hours_after_deadline_to"]) == (-12, 0)
+    # 169 hours early is counted in the first (open-ended) bin
+    day04 = heatmap[heatmap["assignment_day"] == "day04"].iloc[0]
+    assert day04["hours_after_deadline_from"] == aa.HOURS_BIN_EDGES[0]
@@ -0,0 +1,67 @@
+import io
+import json
+
+import pandas as pd
+import pytest
+
+import assignment_analyzer as aa
+import pr_json
+
+PRS = [
+    {"number": 1, "state": "CLOSED", "title": "Day01 by Ada Lovelace", "createdAt": "2025-11-01T20:00:00Z"},
+    {"number": 2, "state": "OPEN", "title": "day 02 by ada lovelace", "createdAt": "2025-11-10T22:00:00Z"},
+    {"number": 3, "state": "MERGED", "title": "Day03 and Day04 by Alan Turing",
+     "createdAt": "2025-11-16T21:00:00Z", "author": {"login": "alan"}},
+]
+
+
+@pytest.mark.parametrize("text", [
+    json.dumps(PRS, indent=2),
+    "\n".join(json.dumps(pr) for pr in PRS),
+    json.dumps(PRS[:1]) + "\n" + json.dumps(PRS[1:]),
+])
+@pytest.mark.parametrize("chunk_size", [1, 5, pr_json.CHUNK_SIZE])
+def test_iter_json_records(text, chunk_size):
+    assert list(pr_json.iter_json_records(io.StringIO(text), chunk_size)) == PRS
+
+
+@pytest.mark.parametrize("text", ['[{"number": 1}', '[{"number": ', '[1, 2]', '{"number": 1} x'])
+def test_iter_json_records_invalid(text):
+    with pytest.raises(ValueError):
+        list(pr_json.iter_json_records(io.StringIO(text), 3))
+
+
+class CountingStream(io.StringIO):
+    """StringIO that counts the characters read."""
+    read_chars = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.read_chars += len(data)
+        return data
+
+
+@pytest.mark.parametrize("start", ['[{"number": 1,, "state": "OPEN"}', '[{"number": 1}, x{"number": 2}'])
+def test_iter_json_records_fails_fast(start):
+    # A syntax error at the start of a large export is reported without reading the rest
+    stream = CountingStream(start + ", " + ", ".join([json.dumps(PRS[0])] * 100000) + "]")
+    with pytest.raises(ValueError, match="Invalid JSON"):
+        list(pr_json.iter_json_records(stream, chunk_size=1024))
+    assert stream.read_chars <= 2048
+
+
+def test_iter_json_records_long_record():
+    record = {"number": 1, "title": "x" * 5000}
+    assert list(pr_json.iter_json_records(io.StringIO(json.dumps([record] * 3)), chunk_size=7)) == [record] * 3
+    with pytest.raises(ValueError, match="longer than"):
+        list(pr_json.iter_json_records(io.StringIO(json.dumps([record])), chunk_size=7, max_record_size=1000))
+
+
+def test_json_export_matches_tab_separated(tmp_path):
+    tsv = tmp_path / "subjects.txt"
+    tsv.write_text("".join(f"{pr['number']}\t{pr['state']}\t{pr['title']}\t\t{pr['createdAt']}\n" for pr in PRS),
+                   encoding="utf-8")
+    export = tmp_path / "prs.json"
+    export.write_text(json.dumps(PRS), encoding="utf-8")
+    assert pr_json.is_json_file(export) and not pr_json.is_json_file(tsv)
+    pd.testing.assert_frame_equal(aa.parse_data(export), aa.parse_data(tsv))
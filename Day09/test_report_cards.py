@@ -0,0 +1,54 @@
+import tarfile
+import zipfile
+
+import pytest
+
+import assignment_analyzer as aa
+import report_cards
+
+SAMPLE = (
+    "1\tCLOSED\tDay01 by Ada Lovelace\t\t2025-11-01T20:00:00Z\n"
+    "2\tOPEN\tday 02 by ada lovelace\t\t2025-11-10T22:00:00Z\n"
+    "3\tCLOSED\tDay03 and Day04 by Alan Turing\t\t2025-11-16T21:00:00Z\n"
+)
+
+
+@pytest.fixture
+def df(tmp_path):
+    data = tmp_path / "subjects.txt"
+    data.write_text(SAMPLE, encoding="utf-8")
+    return aa.parse_data(data)
+
+
+def test_report_card_contents(df):
+    cards = dict(report_cards.iter_report_cards(df, aa.ASSIGNMENTS))
+    assert sorted(cards) == ["ada_lovelace.txt", "alan_turing.txt"]
+    ada = cards["ada_lovelace.txt"]
+    assert "Submitted: 2 of 8 assignments" in ada
+    assert "Submissions: 2 (late: 1)" in ada
+    assert "  - Day01: 2025-11-01 20:00 UTC, CLOSED, 2.0 hours early" in ada
+    assert "  - Day02: 2025-11-10 22:00 UTC, OPEN, 1.0 days late" in ada
+    assert "  - Day03\n" in ada and "  - Final Project\n" in ada
+    assert "  - Day03" not in cards["alan_turing.txt"].split("MISSING")[1]
+
+
+def test_filenames_are_unique():
+    used = set()
+    assert report_cards.report_card_filename("Ada Lovelace", used) == "ada_lovelace.txt"
+    assert report_cards.report_card_filename("ada  lovelace!", used) == "ada_lovelace_2.txt"
+
+
+@pytest.mark.parametrize("name", ["cards", "cards.zip", "cards.tar.gz"])
+def test_write_report_cards(df, tmp_path, name):
+    destination = tmp_path / name
+    assert report_cards.write_report_cards(df, destination, aa.ASSIGNMENTS) == 2
+    expected = dict(report_cards.iter_report_cards(df, aa.ASSIGNMENTS))
+    if name.endswith(".zip"):
+        with zipfile.ZipFile(destination) as archive:
+            written = {n: archive.read(n).decode("utf-8") for n in archive.namelist()}
+    elif name.endswith(".tar.gz"):
+        with tarfile.open(destination) as archive:
+            written = {m.name: archive.extractfile(m).read().decode("utf-8") for m in archive.getmembers()}
+    else:
+        written = {p.name: p.read_text(encoding="utf-8") for p in destination.iterdir()}
+    assert written == expected
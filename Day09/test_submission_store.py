@@ -0,0 +1,114 @@
+import pandas as pd
+import pytest
+
+import assignment_analyzer as aa
+import submission_store as store
+
+SAMPLE = (
+    "1\tCLOSED\tDay01 by Ada Lovelace\t\t2025-11-01T20:00:00Z\n"
+    "2\tOPEN\tday 02 by ada lovelace\t\t2025-11-10T22:00:00Z\n"
+    "3\tCLOSED\tDay03 and Day04 by Alan Turing\t\t2025-11-16T21:00:00Z\n"
+    "4\tOPEN\tDay01 by Alan Turing\t\t2025-11-03T01:00:00Z\n"
+    "5\tOPEN\tDay 01 by Grace Hopper\t\t2025-11-02T10:00:00Z\n"
+)
+
+
+def plain(df):
+    """Categorical columns (from parse_data) as plain strings, like the SQL results."""
+    return df.apply(lambda col: col.astype(str) if isinstance(col.dtype, pd.CategoricalDtype) else col)
+
+
+@pytest.fixture
+def stored(tmp_path):
+    data = tmp_path / "subjects.txt"
+    data.write_text(SAMPLE, encoding="utf-8")
+    db_path = tmp_path / "submissions.db"
+    df = aa.parse_data(data, db_path=db_path)
+    conn = store.open_store(db_path)
+    yield df, conn
+    conn.close()
+
+
+def test_upsert_is_keyed_by_id_and_assignment(stored, tmp_path):
+    df, conn = stored
+    # Parsing again does not add rows; the combined PR has one row per assignment
+    aa.parse_data(tmp_path / "subjects.txt", db_path=tmp_path / "submissions.db")
+    assert conn.execute("SELECT COUNT(*) FROM submissions").fetchone()[0] == len(df) == 6
+    assert conn.execute("SELECT COUNT(*) FROM submissions WHERE id = '3'").fetchone()[0] == 2
+
+
+def test_indexes_exist(stored):
+    _, conn = stored
+    names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"idx_submissions_assignment_student", "idx_submissions_time"} <= names
+
+
+def test_load_submissions_round_trip(stored):
+    df, conn = stored
+    loaded = store.load_submissions(conn)
+    pd.testing.assert_frame_equal(plain(loaded), plain(df[store.COLUMNS]), check_dtype=False)
+    assert loaded["is_late"].dtype == bool
+
+
+def test_sql_reports_match_pandas(stored):
+    df, conn = stored
+    pd.testing.assert_frame_equal(
+        plain(aa.generate_missing_submissions_report(df, conn)), plain(aa.generate_missing_submissions_report(df))
+    )
+    pd.testing.assert_frame_equal(
+        plain(aa.generate_late_submissions_report(df, conn)),
+        plain(aa.generate_late_submissions_report(df).reset_index(drop=True)),
+        check_dtype=False,
+    )
+    pd.testing.assert_frame_equal(
+        plain(aa.generate_format_popularity_report(df, conn)), plain(aa.generate_format_popularity_report(df)),
+        check_dtype=False,
+    )
+    pd.testing.assert_frame_equal(
+        plain(aa.generate_statistics_by_assignment(df, conn)), plain(aa.generate_statistics_by_assignment(df)),
+        check_dtype=False,
+    )
+
+
+OTHER = (
+    "7\tOPEN\tDay01 by Barbara Liskov\t\t2025-11-02T23:00:00Z\n"
+    "8\tCLOSED\tDay02 by Barbara Liskov\t\t2025-11-08T10:00:00Z\n"
+)
+
+
+def test_reports_are_scoped_to_the_current_file(stored, tmp_path):
+    df, conn = stored
+    other = tmp_path / "other.txt"
+    other.write_text(OTHER, encoding="utf-8")
+    other_df = aa.parse_data(other, db_path=tmp_path / "submissions.db")
+    assert conn.execute("SELECT COUNT(*) FROM submissions").fetchone()[0] == len(df) + len(other_df)
+
+    for frame in (df, other_df):
+        stats = aa.generate_statistics_by_assignment(frame, conn)
+        assert stats["total_submissions"].sum() == len(frame)
+        assert stats["late_count"].sum() == frame["is_late"].sum()
+        assert len(aa.generate_late_submissions_report(frame, conn)) == frame["is_late"].sum()
+        assert aa.generate_format_popularity_report(frame, conn)["count"].sum() == len(frame)
+        missing = aa.generate_missing_submissions_report(frame, conn)
+        assert set(missing["student_name"]) == set(frame["student_name"])
+        pd.testing.assert_frame_equal(plain(missing), plain(aa.generate_missing_submissions_report(frame)))
+    assert other_df.attrs["source"] != df.attrs["source"]
+
+
+def test_dedup_removes_collapsed_rows_from_the_store(tmp_path):
+    data = tmp_path / "subjects.txt"
+    data.write_text(SAMPLE + "6\tOPEN\tDay01 by Ada Lovelace\t\t2025-11-03T10:00:00Z\n", encoding="utf-8")
+    db_path = tmp_path / "submissions.db"
+    assert len(aa.parse_data(data, db_path=db_path)) == 7
+    df = aa.parse_data(data, db_path=db_path, dedup="last")
+    assert df.attrs["duplicates_collapsed"] == 1
+    conn = store.open_store(db_path)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM submissions").fetchone()[0] == len(df) == 6
+        assert conn.execute("SELECT COUNT(*) FROM submissions WHERE id = '1'").fetchone()[0] == 0
+        late = aa.generate_late_submissions_report(df, conn)
+        assert late["id"].tolist() == aa.generate_late_submissions_report(df)["id"].tolist()
+        stats = aa.generate_statistics_by_assignment(df, conn)
+        assert stats["total_submissions"].sum() == len(df)
+    finally:
+        conn.close()
@@ -0,0 +1,37 @@
+import title_formats as tf
+
+
+def test_tokenize_common_formats():
+    cases = {
+        "Day08 by Ada Lovelace": "Day{NN} by {Name}",
+        "day08 by Ada": "day{NN} by {Name}",
+        "Day 1 Ada Lovelace": "Day {N} {Name}",
+        "Day08 By Ada": "Day{NN} By {Name}",
+        "DAY02 by Ada": "DAY{NN} by {Name}",
+        "day03-Ada Lovelace": "day{NN}-{Name}",
+        "Day 03 - Ada": "Day {NN} - {Name}",
+        "Day03 and Day04 by Ada": "Day{NN} and Day{NN} by {Name}",
+        "Final Project proposal by Ada": "Final Project proposal by {Name}",
+        "day 08 and proposal for final project-Ada": "day {NN} and proposal for final project-{Name}",
+    }
+    for title, template in cases.items():
+        assert "".join(tf.tokenize_title(title)) == template
+
+
+def test_name_after_by_is_not_a_keyword():
+    assert "".join(tf.tokenize_title("Day01 by Final Project")) == "Day{NN} by {Name}"
+
+
+def test_classifier_ids_and_counts():
+    classifier = tf.TitleFormatClassifier()
+    titles = ["Day01 by Ada", "Day02 by Alan", "day1 Grace", "Day01 by Ada"]
+    ids = classifier.classify(titles)
+    assert ids.tolist() == [0, 0, 1, 0]
+    assert classifier.templates == ["Day{NN} by {Name}", "day{N} {Name}"]
+    assert classifier.count(titles) == {"Day{NN} by {Name}": 3, "day{N} {Name}": 1}
+    # The same classifier keeps its ids
+    assert classifier.template_id("day9 Alan") == 1
+
+
+def test_title_templates():
+    assert tf.title_templates(["Day 05 and 06 by Ada"]) == ["Day {NN} and {NN} by {Name}"]
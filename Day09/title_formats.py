@@ -0,0 +1,101 @@
+"""
+Classify submission titles into format templates.
+
+Each title is scanned once with a compiled regular expression and turned into
+a sequence of symbols: the literal "day"/"Day"/"DAY", the number as {N} or
+{NN} (one or two digits), keywords such as "by", "and", "Final", "project",
+separators and spacing, and the student name as {Name}. For example:
+
+    "Day08 by Ada Lovelace"                       -> "Day{NN} by {Name}"
+    "day 08 and proposal for final project-Ada"   -> "day {NN} and proposal for final project-{Name}"
+    "Day 1 Ada Lovelace"                          -> "Day {N} {Name}"
+
+Symbol sequences are stored in a trie that gives every distinct template an
+integer id, so counting millions of titles only needs integer counts.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+NAME = '{Name}'
+KEYWORDS = frozenset({'and', 'by', 'final', 'project', 'proposal', 'for'})
+
+TOKEN_RE = re.compile(r"""
+    (?P<day>day)(?=\s*\d)     # "day" followed by a number
+  | (?P<num>\d+)
+  | (?P<space>\s+)
+  | (?P<word>[^\W\d_]+)
+  | (?P<other>.)
+""", re.IGNORECASE | re.VERBOSE)
+
+
+def tokenize_title(title):
+    """Return the template symbols of a title (see module docstring)."""
+    symbols = []
+    space = False
+    after_by = False
+    for match in TOKEN_RE.finditer(title.strip()):
+        kind = match.lastgroup
+        text = match.group()
+        if kind == 'space':
+            space = True
+            continue
+        if space and symbols:
+            symbols.append(' ')
+        space = False
+
+        if kind == 'num':
+            symbols.append('{NN}' if len(text) >= 2 else '{N}')
+        elif kind == 'word' and (after_by or text.lower() not in KEYWORDS):
+            # The student name runs to the end of the title
+            symbols.append(NAME)
+            break
+        else:
+            symbols.append(text)
+            after_by = kind == 'word' and text.lower() == 'by'
+    return tuple(symbols)
+
+
+class TitleFormatClassifier:
+    """Maps titles to template ids with a trie over template symbols."""
+
+    def __init__(self):
+        self._root = {}
+        self.templates = []  # template id -> template text
+
+    def template_id(self, title):
+        """Return the id of the title's template (new templates get the next id)."""
+        symbols = tokenize_title(title)
+        node = self._root
+        for symbol in symbols:
+            node = node.setdefault(symbol, {})
+        if None not in node:
+            node[None] = len(self.templates)
+            self.templates.append(''.join(symbols))
+        return node[None]
+
+    def classify(self, titles):
+        """Template id of every title (each distinct title is tokenized only once)."""
+        codes, unique_titles = pd.factorize(pd.Series(titles, dtype=object))
+        unique_ids = np.fromiter((self.template_id(title) for title in unique_titles),
+                                 dtype=np.int64, count=len(unique_titles))
+        return unique_ids[codes]
+
+    def templates_of(self, titles):
+        """Template text of every title, as a list."""
+        ids = self.classify(titles)
+        templates = np.array(self.templates, dtype=object)
+        return templates[ids].tolist()
+
+    def count(self, titles):
+        """Number of titles per template text (largest first)."""
+        counts = np.bincount(self.classify(titles), minlength=len(self.templates))
+        order = np.argsort(-counts, kind='stable')
+        return {self.templates[i]: int(counts[i]) for i in order if counts[i] > 0}
+
+
+def title_templates(titles):
+    """Template text of every title."""
+    return TitleFormatClassifier().templates_of(titles)